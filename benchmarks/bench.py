@@ -0,0 +1,353 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""
+Benchmark suite for the hot paths of python-docx: importing the package,
+opening a document, building one paragraph, table and picture at a time,
+querying paragraphs, tables and text, replacing text, and saving.
+
+Synthetic documents of parameterized size are generated afresh on each run,
+so results depend only on the revision under test and the parameters given.
+Results are written as JSON; two such files, e.g. from two revisions, can be
+compared with ``--compare``::
+
+    python benchmarks/bench.py --output before.json
+    git checkout feature-branch
+    python benchmarks/bench.py --output after.json
+    python benchmarks/bench.py --compare before.json after.json
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+
+from io import BytesIO
+from timeit import default_timer
+
+thisdir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(thisdir))
+
+import docx  # noqa
+
+from docx import Document  # noqa
+
+
+image_path = os.path.join(
+    os.path.dirname(thisdir), 'tests', 'test_files', 'monty-truth.png'
+)
+
+paragraph_styles = (
+    'Normal', 'Heading1', 'Heading2', 'BodyText', 'ListBullet',
+    'ListNumber', 'Quote', 'Caption', 'NoSpacing', 'IntenseQuote',
+)
+
+text = 'The quick brown fox jumps over the lazy dog. ' * 4
+
+
+class Params(object):
+    """
+    Size of the synthetic documents a benchmark run generates.
+    """
+    def __init__(self, paragraphs, tables, table_rows, table_cols, images,
+                 styles):
+        self.paragraphs = paragraphs
+        self.tables = tables
+        self.table_rows = table_rows
+        self.table_cols = table_cols
+        self.images = images
+        self.styles = styles
+
+    def as_dict(self):
+        return dict(
+            paragraphs=self.paragraphs, tables=self.tables,
+            table_rows=self.table_rows, table_cols=self.table_cols,
+            images=self.images, styles=self.styles
+        )
+
+
+def build_document(params):
+    """
+    Return a new |Document| containing *params.paragraphs* paragraphs whose
+    styles cycle through *params.styles* distinct paragraph styles, along
+    with *params.tables* tables and *params.images* pictures spread evenly
+    among them.
+    """
+    document = Document()
+    styles = paragraph_styles[:max(1, params.styles)]
+    table_every = _spacing(params.paragraphs, params.tables)
+    image_every = _spacing(params.paragraphs, params.images)
+    tables = images = 0
+    for idx in range(params.paragraphs):
+        document.add_paragraph(text, styles[idx % len(styles)])
+        if tables < params.tables and idx % table_every == 0:
+            _add_table(document, params.table_rows, params.table_cols)
+            tables += 1
+        if images < params.images and idx % image_every == 0:
+            document.add_picture(image_path)
+            images += 1
+    while tables < params.tables:
+        _add_table(document, params.table_rows, params.table_cols)
+        tables += 1
+    while images < params.images:
+        document.add_picture(image_path)
+        images += 1
+    return document
+
+
+def docx_blob(params):
+    """
+    Return the bytes of a .docx package generated according to *params*.
+    """
+    stream = BytesIO()
+    build_document(params).save(stream)
+    return stream.getvalue()
+
+
+def benchmarks(params):
+    """
+    Return a list of (name, setup) 2-tuples, one per benchmark. *setup* is
+    called, untimed, before each run and returns the callable that is timed.
+    """
+    blob = docx_blob(params)
+
+    def open_document():
+        stream = BytesIO(blob)
+        return lambda: Document(stream)
+
+    def add_paragraph():
+        document = Document()
+
+        def run():
+            for _ in range(params.paragraphs):
+                document.add_paragraph(text)
+        return run
+
+    def add_paragraphs():
+        document = Document()
+        return lambda: document.add_paragraphs([text] * params.paragraphs)
+
+    def add_table():
+        document = Document()
+
+        def run():
+            for _ in range(params.tables):
+                _add_table(document, params.table_rows, params.table_cols)
+        return run
+
+    def set_values():
+        document = Document()
+        tables = [
+            document.add_table(params.table_rows, params.table_cols)
+            for _ in range(params.tables)
+        ]
+        matrix = [
+            ['%d,%d' % (row_idx, col_idx)
+             for col_idx in range(params.table_cols)]
+            for row_idx in range(params.table_rows)
+        ]
+
+        def run():
+            for table in tables:
+                table.set_values(matrix)
+        return run
+
+    def add_picture():
+        document = Document()
+
+        def run():
+            for _ in range(params.images):
+                document.add_picture(image_path)
+        return run
+
+    def query_paragraphs():
+        document = Document(BytesIO(blob))
+        return lambda: [p.style for p in document.paragraphs]
+
+    def query_tables():
+        document = Document(BytesIO(blob))
+        return lambda: [
+            p.text for t in document.tables for c in t.columns
+            for cell in c.cells for p in cell.paragraphs
+        ]
+
+    def table_records():
+        document = Document(BytesIO(blob))
+        return lambda: [t.to_records() for t in document.tables]
+
+    def query_text():
+        document = Document(BytesIO(blob))
+        return lambda: '\n'.join(p.text for p in document.paragraphs)
+
+    def replace():
+        document = Document(BytesIO(blob))
+        return lambda: document.replace({'quick': 'slow', 'lazy dog': 'cat'})
+
+    def save():
+        document = Document(BytesIO(blob))
+        return lambda: document.save(BytesIO())
+
+    return [
+        ('open', open_document),
+        ('add_paragraph', add_paragraph),
+        ('add_paragraphs', add_paragraphs),
+        ('add_table', add_table),
+        ('set_values', set_values),
+        ('add_picture', add_picture),
+        ('query_paragraphs', query_paragraphs),
+        ('query_tables', query_tables),
+        ('table_records', table_records),
+        ('query_text', query_text),
+        ('replace', replace),
+        ('save', save),
+    ]
+
+
+def run_benchmarks(params, repeat, selected=None):
+    """
+    Return a dict mapping the name of each benchmark to a dict of its
+    timings, in seconds, over *repeat* runs. Only benchmarks named in
+    *selected* are run when it is not |None|.
+    """
+    results = {}
+    for name, setup in benchmarks(params):
+        if selected and name not in selected:
+            continue
+        times = []
+        for _ in range(repeat):
+            fn = setup()
+            start = default_timer()
+            fn()
+            times.append(default_timer() - start)
+        times.sort()
+        results[name] = dict(
+            min=times[0], median=times[len(times)//2], max=times[-1],
+            runs=times
+        )
+        print('%-18s min %9.4fs  median %9.4fs' % (
+            name, times[0], times[len(times)//2]
+        ))
+    return results
+
+
+def import_time(repeat):
+    """
+    Return a dict of the timings, in seconds, of ``import docx`` in each of
+    *repeat* fresh interpreters, excluding interpreter startup.
+    """
+    script = (
+        'from timeit import default_timer; start = default_timer(); '
+        'import docx; print(default_timer() - start)'
+    )
+    pythonpath = [os.path.dirname(thisdir), os.environ.get('PYTHONPATH', '')]
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(pythonpath))
+    times = sorted(
+        float(subprocess.check_output([sys.executable, '-c', script], env=env))
+        for _ in range(repeat)
+    )
+    print('%-18s min %9.4fs  median %9.4fs' % (
+        'import', times[0], times[len(times)//2]
+    ))
+    return dict(
+        min=times[0], median=times[len(times)//2], max=times[-1], runs=times
+    )
+
+
+def compare(before_path, after_path):
+    """
+    Print the ratio of median times in *after_path* to those in
+    *before_path* for each benchmark present in both result files.
+    """
+    with open(before_path) as f:
+        before = json.load(f)
+    with open(after_path) as f:
+        after = json.load(f)
+    if before['params'] != after['params']:
+        print('warning: results were produced with different parameters')
+    print('%-18s %11s %11s %8s' % ('benchmark', 'before', 'after', 'ratio'))
+    for name in sorted(before['results']):
+        if name not in after['results']:
+            continue
+        old = before['results'][name]['median']
+        new = after['results'][name]['median']
+        ratio = new / old if old else float('nan')
+        print('%-18s %10.4fs %10.4fs %7.2fx' % (name, old, new, ratio))
+
+
+def environment():
+    """
+    Return a dict describing the interpreter and library under test.
+    """
+    return dict(
+        python=platform.python_version(),
+        implementation=platform.python_implementation(),
+        platform=platform.platform(),
+        docx_version=docx.__version__,
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--paragraphs', type=int, default=500)
+    parser.add_argument('--tables', type=int, default=20)
+    parser.add_argument('--table-rows', type=int, default=10)
+    parser.add_argument('--table-cols', type=int, default=5)
+    parser.add_argument('--images', type=int, default=10)
+    parser.add_argument('--styles', type=int, default=5,
+                        help='distinct paragraph styles, at most %d' %
+                        len(paragraph_styles))
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--only', nargs='+', metavar='NAME',
+                        help='run only the named benchmarks, "import" '
+                        'being the time taken by `import docx`')
+    parser.add_argument('--output', metavar='PATH',
+                        help='write results as JSON to PATH')
+    parser.add_argument('--compare', nargs=2, metavar=('BEFORE', 'AFTER'),
+                        help='compare two JSON result files and exit')
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    params = Params(
+        args.paragraphs, args.tables, args.table_rows, args.table_cols,
+        args.images, args.styles
+    )
+    results = {}
+    if not args.only or 'import' in args.only:
+        results['import'] = import_time(args.repeat)
+    results.update(run_benchmarks(params, args.repeat, args.only))
+    if args.output:
+        report = dict(
+            environment=environment(), params=params.as_dict(),
+            repeat=args.repeat, results=results
+        )
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+
+def _add_table(document, rows, cols):
+    table = document.add_table(rows, cols)
+    for row_idx, row in enumerate(table.rows):
+        for col_idx, cell in enumerate(row.cells):
+            cell.text = '%d,%d' % (row_idx, col_idx)
+    return table
+
+
+def _spacing(count, items):
+    """
+    Return the number of paragraphs between each of *items* spread evenly
+    among *count* paragraphs.
+    """
+    if not items:
+        return count + 1
+    return max(1, count // items)
+
+
+if __name__ == '__main__':
+    main()
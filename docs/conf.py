@@ -77,20 +77,30 @@ rst_epilog = """
 
 .. |_Columns| replace:: :class:`_Columns`
 
+.. |CompiledTemplate| replace:: :class:`.CompiledTemplate`
+
+.. |Composer| replace:: :class:`.Composer`
+
 .. |Document| replace:: :class:`.Document`
 
 .. |docx| replace:: ``python-docx``
 
 .. |Emu| replace:: :class:`.Emu`
 
+.. |Exporter| replace:: :class:`.Exporter`
+
 .. |False| replace:: ``False``
 
+.. |IndexError| replace:: :class:`IndexError`
+
 .. |InlineShape| replace:: :class:`.InlineShape`
 
 .. |InlineShapes| replace:: :class:`.InlineShapes`
 
 .. |int| replace:: :class:`int`
 
+.. |KeyError| replace:: :class:`KeyError`
+
 .. |Length| replace:: :class:`.Length`
 
 .. |OpcPackage| replace:: :class:`OpcPackage`
@@ -103,6 +113,8 @@ rst_epilog = """
 
 .. |Part| replace:: :class:`Part`
 
+.. |PictureInfo| replace:: :class:`.PictureInfo`
+
 .. |_Relationship| replace:: :class:`_Relationship`
 
 .. |Relationships| replace:: :class:`_Relationships`
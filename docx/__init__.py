@@ -1,6 +1,7 @@
 # encoding: utf-8
 
 from docx.api import Document  # noqa
+from docx.composer import compose  # noqa
 
 __version__ = '0.7.4'
 
@@ -10,21 +11,24 @@ __version__ = '0.7.4'
 from docx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from docx.opc.package import PartFactory
 
-from docx.parts.document import DocumentPart
-from docx.parts.image import ImagePart
 from docx.parts.numbering import NumberingPart
 from docx.parts.styles import StylesPart
 
 
 def part_class_selector(content_type, reltype):
+    # the document and image part modules bring in the proxy, oxml and image
+    # header modules, so they are only imported once a package is opened
     if reltype == RT.IMAGE:
+        from docx.parts.image import ImagePart
         return ImagePart
+    if content_type == CT.WML_DOCUMENT_MAIN:
+        from docx.parts.document import DocumentPart
+        return DocumentPart
     return None
 
 
 PartFactory.part_class_selector = part_class_selector
-PartFactory.part_type_for[CT.WML_DOCUMENT_MAIN] = DocumentPart
 PartFactory.part_type_for[CT.WML_NUMBERING] = NumberingPart
 PartFactory.part_type_for[CT.WML_STYLES] = StylesPart
 
-del CT, DocumentPart, PartFactory, part_class_selector
+del PartFactory, part_class_selector
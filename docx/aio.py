@@ -0,0 +1,215 @@
+# encoding: utf-8
+
+"""
+Coroutine counterparts of ``Document(...)`` and ``Document.save()`` for use
+in asyncio applications. Zip I/O, XML parsing, serialization and compression
+are all CPU-bound and run on an executor. A document is streamed rather than
+held in memory in full: it is read from an asyncio stream into a temporary
+file that stays in memory only while it is small, and saved to an asyncio
+stream chunk by chunk as it is written, the save waiting on a slow peer
+rather than running ahead of it. Requires Python 3.5 or later.
+"""
+
+import asyncio
+import inspect
+import tempfile
+
+from functools import partial
+
+from .api import Document
+from .compat import is_string
+
+
+CHUNK_SIZE = 64 * 1024
+
+# size above which a document read from a stream is spooled to disk
+SPOOL_SIZE = 16 * CHUNK_SIZE
+
+# number of chunks a save may get ahead of the stream it is writing to
+_PIPE_DEPTH = 4
+
+# get_running_loop() is new in Python 3.7
+_running_loop = getattr(asyncio, 'get_running_loop', asyncio.get_event_loop)
+
+
+async def open_document(docx=None, executor=None):
+    """
+    Return a |Document| instance loaded from *docx*, without blocking the
+    event loop. *docx* can be a path to a ``.docx`` file (a string),
+    a file-like object, or an asyncio stream having a coroutine ``read()``
+    method, such as :class:`asyncio.StreamReader`. If *docx* is missing or
+    |None|, the built-in default document "template" is loaded. *executor*
+    is the :class:`concurrent.futures.Executor` used for blocking work,
+    defaulting to the event loop's default executor. A seekable file-like
+    object is read from directly on *executor*; any other stream is first
+    copied chunk by chunk into a temporary file, spooled to disk once it
+    outgrows ``SPOOL_SIZE`` bytes.
+    """
+    loop = _running_loop()
+    if docx is not None and not is_string(docx) and not _seekable(docx):
+        docx = await _spool(docx, loop, executor)
+    return await loop.run_in_executor(executor, Document, docx)
+
+
+async def save_document(document, path_or_stream, executor=None, **kwargs):
+    """
+    Save *document* to *path_or_stream* without blocking the event loop.
+    *path_or_stream* can be a path to a filesystem location (a string),
+    a file-like object, an object having a coroutine ``write()`` method, or
+    an :class:`asyncio.StreamWriter`, whose buffer is drained after each
+    chunk. *executor* is used as in :func:`open_document`. Any other keyword
+    arguments, such as *compact* or *deterministic*, are passed on to
+    :meth:`Document.save`. A path or blocking file-like object is written
+    to directly on *executor*. Otherwise each chunk of ``CHUNK_SIZE`` bytes
+    is handed to the event loop as soon as it is written, and the save waits
+    whenever the stream falls behind, so the saved document is never held in
+    memory in full.
+    """
+    loop = _running_loop()
+    save = partial(document.save, **kwargs)
+    if is_string(path_or_stream) or not _is_async_writer(path_or_stream):
+        await loop.run_in_executor(executor, save, path_or_stream)
+        return
+    pipe = _ChunkPipe(loop)
+    saved = loop.run_in_executor(executor, pipe.fill, save)
+    try:
+        await _write_stream(path_or_stream, pipe)
+    except BaseException:
+        pipe.abort()
+        await asyncio.wait([saved])
+        raise
+    await saved
+
+
+class _ChunkPipe(object):
+    """
+    Write-only file-like object a save on an executor thread writes to, from
+    which the event loop receives what is written as chunks of
+    ``CHUNK_SIZE`` bytes. A write blocks while ``_PIPE_DEPTH`` chunks are
+    waiting to be received. Having no ``tell()``, it is written to by
+    ``ZipFile`` as an unseekable stream.
+    """
+    def __init__(self, loop):
+        super(_ChunkPipe, self).__init__()
+        self._loop = loop
+        self._queue = asyncio.Queue(_PIPE_DEPTH)
+        self._buffer = bytearray()
+        self._aborted = False
+
+    def abort(self):
+        """
+        Cause the save filling this pipe to fail at its next write, the
+        chunks it is waiting to hand over being discarded.
+        """
+        self._aborted = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+    def fill(self, save):
+        """
+        Call *save* with this pipe as the stream to save to, then mark the
+        end of the chunks with |None|, whether or not *save* succeeds.
+        Called on an executor thread.
+        """
+        try:
+            save(self)
+            if self._buffer:
+                self._put(bytes(self._buffer))
+        finally:
+            if not self._aborted:
+                self._put(None)
+
+    def flush(self):
+        pass
+
+    async def get(self):
+        """
+        Return the next chunk written to this pipe, or |None| once the save
+        filling it is over.
+        """
+        return await self._queue.get()
+
+    def write(self, data):
+        """
+        Buffer *data*, handing each ``CHUNK_SIZE`` bytes buffered over to the
+        event loop. Raises |IOError| if the pipe has been aborted.
+        """
+        buffer = self._buffer
+        buffer.extend(data)
+        while len(buffer) >= CHUNK_SIZE:
+            self._put(bytes(buffer[:CHUNK_SIZE]))
+            del buffer[:CHUNK_SIZE]
+        return len(data)
+
+    def _put(self, chunk):
+        """
+        Hand *chunk* over to the event loop, waiting for room in the queue.
+        """
+        if self._aborted:
+            raise IOError('the stream being saved to failed')
+        asyncio.run_coroutine_threadsafe(
+            self._queue.put(chunk), self._loop
+        ).result()
+
+
+def _is_async_writer(stream):
+    """
+    Return |True| if *stream* has a coroutine ``write()`` method or is an
+    asyncio stream writer having a ``drain()`` coroutine.
+    """
+    return (
+        inspect.iscoroutinefunction(stream.write) or hasattr(stream, 'drain')
+    )
+
+
+def _seekable(stream):
+    """
+    Return |True| if *stream* is a blocking file-like object that can be
+    read from at any position, as ``ZipFile`` requires.
+    """
+    if inspect.iscoroutinefunction(stream.read):
+        return False
+    seekable = getattr(stream, 'seekable', None)
+    return seekable is not None and seekable()
+
+
+async def _spool(stream, loop, executor):
+    """
+    Return a temporary file containing everything read from *stream*,
+    positioned at its start. A coroutine ``read()`` is awaited directly;
+    a blocking one is called on *executor*, one chunk per call. Each chunk
+    is written on *executor*, since the file is on disk once it outgrows
+    ``SPOOL_SIZE`` bytes.
+    """
+    spool = tempfile.SpooledTemporaryFile(SPOOL_SIZE)
+    if inspect.iscoroutinefunction(stream.read):
+        def read():
+            return stream.read(CHUNK_SIZE)
+    else:
+        def read():
+            return loop.run_in_executor(executor, stream.read, CHUNK_SIZE)
+    while True:
+        chunk = await read()
+        if not chunk:
+            break
+        await loop.run_in_executor(executor, spool.write, chunk)
+    spool.seek(0)
+    return spool
+
+
+async def _write_stream(stream, pipe):
+    """
+    Write each chunk received from *pipe* to *stream*, awaiting either its
+    coroutine ``write()`` or, for an asyncio stream writer, its ``drain()``
+    after each chunk.
+    """
+    drain = not inspect.iscoroutinefunction(stream.write)
+    while True:
+        chunk = await pipe.get()
+        if chunk is None:
+            break
+        if drain:
+            stream.write(chunk)
+            await stream.drain()
+            continue
+        await stream.write(chunk)
@@ -28,11 +28,16 @@ class Document(object):
     Return a |Document| instance loaded from *docx*, where *docx* can be
     either a path to a ``.docx`` file (a string) or a file-like object. If
     *docx* is missing or ``None``, the built-in default document "template"
-    is loaded.
+    is loaded. If *use_mmap* is |True| and *docx* is a path, the file is
+    memory-mapped while loading, which lowers peak memory use when opening
+    large documents. If *blob_threshold* is an integer, the blob of each
+    binary part, such as an image, larger than that many bytes is left in
+    *docx*, or spilled to a temporary file when *docx* is a stream, and
+    read from there only when needed.
     """
-    def __init__(self, docx=None):
+    def __init__(self, docx=None, use_mmap=False, blob_threshold=None):
         super(Document, self).__init__()
-        document_part, package = self._open(docx)
+        document_part, package = self._open(docx, use_mmap, blob_threshold)
         self._document_part = document_part
         self._package = package
 
@@ -71,6 +76,17 @@ class Document(object):
         """
         return self._document_part.add_paragraph(text, style)
 
+    def add_paragraphs(self, paragraphs):
+        """
+        Return a list of paragraphs newly added to the end of the document,
+        one for each item in *paragraphs*. Each item is either a ``(text,
+        style)`` 2-tuple or just a *text* string, interpreted as the
+        arguments to :meth:`add_paragraph`. Adding a large number of
+        paragraphs this way, such as the lines of a log, is much faster than
+        calling :meth:`add_paragraph` for each one.
+        """
+        return self._document_part.add_paragraphs(paragraphs)
+
     def add_picture(self, image_path_or_stream, width=None, height=None):
         """
         Return a new picture shape added in its own paragraph at the end of
@@ -108,6 +124,65 @@ class Document(object):
             table.style = style
         return table
 
+    def append_document(self, other):
+        """
+        Append the body content of *other*, another |Document| instance, to
+        the end of this document, along with the images, hyperlinks and
+        other parts it relates to and the styles and numbering definitions
+        it uses, each remapped to its equivalent here. The final section
+        properties of *other* are not appended, so its content takes on the
+        page layout of the last section of this document. Footnotes,
+        endnotes and comments are not appended; references to them are
+        removed from the appended content. *other* is left unchanged. See
+        :func:`docx.compose` for appending many documents.
+        """
+        # docx.composer imports this module
+        from docx.composer import Composer
+        Composer(self).append(other)
+
+    def compact(self):
+        """
+        Remove each style and numbering definition nothing in this document
+        uses, and each relationship to an image, hyperlink, header or footer
+        nothing refers to, along with any part, such as an image, left
+        unused as a result. Documents assembled by repeated merging or
+        templating can accumulate thousands of these. Note that a style
+        removed is no longer available to apply, e.g. by
+        :meth:`add_paragraph`, so this is best done just before saving.
+        """
+        from docx.compact import compact_document
+        compact_document(self)
+
+    def content_digest(self):
+        """
+        Return a SHA1 hex digest of the content of this document, the same
+        for any two documents having the same parts, XML and relationships
+        regardless of how their files were written. Comparing digests is
+        a quick way to tell whether a document has changed, e.g. since it
+        was opened, or whether two documents are the same.
+        """
+        return self._package.content_digest()
+
+    def export(self, out=None, format='text'):
+        """
+        Write the body content of this document to *out*, a text stream, as
+        plain text, Markdown or simple HTML according to *format*, one of
+        ``'text'``, ``'markdown'`` or ``'html'``. The output is returned as
+        a string if *out* is |None|. See :func:`docx.export.export`.
+        """
+        from docx.export import export
+        return export(self, out, format)
+
+    def find_all(self, pattern):
+        """
+        Return a list of ``(paragraph, match)`` 2-tuples, one for each match
+        of the regular expression *pattern* in the text of a paragraph in
+        the body of this document, including those in tables, in document
+        order. A match may span several runs. See
+        :meth:`BlockItemContainer.find_all`.
+        """
+        return self._document_part.find_all(pattern)
+
     @property
     def inline_shapes(self):
         """
@@ -131,18 +206,65 @@ class Document(object):
     @property
     def paragraphs(self):
         """
-        A list of |Paragraph| instances corresponding to the paragraphs in
-        the document, in document order. Note that paragraphs within revision
-        marks such as ``<w:ins>`` or ``<w:del>`` do not appear in this list.
+        A sequence of |Paragraph| instances corresponding to the paragraphs
+        in the document, in document order, supporting ``len()``, iteration,
+        and indexed access, including negative indices and slices. Note that
+        paragraphs within revision marks such as ``<w:ins>`` or ``<w:del>``
+        do not appear in this sequence.
         """
         return self._document_part.paragraphs
 
-    def save(self, path_or_stream):
+    def replace(self, mapping):
+        """
+        Replace each occurrence of each key of *mapping*, such as
+        ``'{{name}}'``, in the text of the paragraphs in the body of this
+        document, including those in tables, with the corresponding value,
+        and return the number of replacements made. Occurrences split across
+        runs are found and replaced in place, each replacement taking the
+        formatting of the run its occurrence starts in. Values need not be
+        strings, and may contain tab and newline characters. The body is
+        scanned only once however many keys *mapping* has.
+        """
+        return self._document_part.replace(mapping)
+
+    def save(self, path_or_stream, workers=None, incremental=False,
+             format='zip', deterministic=False, compact=False):
         """
         Save this document to *path_or_stream*, which can be either a path to
-        a filesystem location (a string) or a file-like object.
+        a filesystem location (a string) or a file-like object. If *workers*
+        is a positive integer, the parts of the document are serialized
+        concurrently on that many threads, which can noticeably shorten the
+        save of a document having several large parts. If *incremental* is
+        |True|, parts left unchanged since the document was opened,
+        typically images and other media, are copied from the original file,
+        keeping the compression they have there. This requires a
+        document opened from a path, and *path_or_stream* may be that same
+        path. If *format* is ``'dir'``, the document is saved uncompressed as
+        an expanded package in the directory at path *path_or_stream*, which
+        ``Document()`` can open again without any inflate cost. If
+        *deterministic* is |True|, saving the same content always produces
+        byte-identical output, suitable for content-addressed caching; it
+        cannot be combined with *incremental*. If *compact* is |True|, the
+        document is compacted by :meth:`compact` before it is saved.
+        """
+        if compact:
+            self.compact()
+        self._package.save(
+            path_or_stream, workers, incremental, format, deterministic
+        )
+
+    def save_async(self, path_or_stream, executor=None, **kwargs):
+        """
+        Return an awaitable that saves this document to *path_or_stream*
+        without blocking the event loop, e.g. ``await doc.save_async(f)``.
+        Serialization runs on *executor*, or the event loop's default
+        executor if not provided. Any other keyword arguments, such as
+        *compact* or *deterministic*, are passed on to :meth:`save`. See
+        :func:`docx.aio.save_document` for the kinds of target accepted.
+        Requires Python 3.5 or later.
         """
-        self._package.save(path_or_stream)
+        from docx.aio import save_document
+        return save_document(self, path_or_stream, executor, **kwargs)
 
     @property
     def sections(self):
@@ -167,14 +289,16 @@ class Document(object):
     @property
     def tables(self):
         """
-        A list of |Table| instances corresponding to the tables in the
-        document, in document order. Note that tables within revision marks
-        such as ``<w:ins>`` or ``<w:del>`` do not appear in this list.
+        A sequence of |Table| instances corresponding to the tables in the
+        document, in document order, supporting ``len()``, iteration, and
+        indexed access, including negative indices and slices. Note that
+        tables within revision marks such as ``<w:ins>`` or ``<w:del>`` do
+        not appear in this sequence.
         """
         return self._document_part.tables
 
     @staticmethod
-    def _open(docx):
+    def _open(docx, use_mmap=False, blob_threshold=None):
         """
         Return a (document_part, package) 2-tuple loaded from *docx*, where
         *docx* can be either a path to a ``.docx`` file (a string) or a
@@ -182,7 +306,7 @@ class Document(object):
         document "template" is loaded.
         """
         docx = _default_docx_path if docx is None else docx
-        package = Package.open(docx)
+        package = Package.open(docx, use_mmap, blob_threshold)
         document_part = package.main_document
         if document_part.content_type != CT.WML_DOCUMENT_MAIN:
             tmpl = "file '%s' is not a Word file, content type is '%s'"
@@ -8,7 +8,15 @@ ones like structured document tags.
 
 from __future__ import absolute_import, print_function
 
-from .shared import Parented
+import re
+
+from collections import Sequence
+
+from .compat import is_string
+from .oxml import xml_change_count
+from .oxml.ns import qn
+from .oxml.text import TextMap
+from .shared import lazyproperty, Parented
 from .text import Paragraph
 
 
@@ -19,6 +27,8 @@ class BlockItemContainer(Parented):
     Provides the shared functionality to add a block item like a paragraph or
     table.
     """
+    __slots__ = ('_element', '_paragraphs', '_tables')
+
     def __init__(self, element, parent):
         super(BlockItemContainer, self).__init__(parent)
         self._element = element
@@ -30,41 +40,234 @@ class BlockItemContainer(Parented):
         paragraph style *style*. If *style* is |None|, no paragraph style is
         applied, which has the same effect as applying the 'Normal' style.
         """
+        change_count = xml_change_count()
         p = self._element.add_p()
         paragraph = Paragraph(p, self)
         if text:
             paragraph.add_run(text)
         if style is not None:
             paragraph.style = style
+        self.paragraphs._extend((paragraph,), change_count)
+        self.tables._children_appended(change_count)
         return paragraph
 
+    def add_paragraphs(self, paragraphs):
+        """
+        Return a list of paragraphs newly added to the end of the content in
+        this container, one for each item in *paragraphs*. Each item is
+        either a ``(text, style)`` 2-tuple or just a *text* string, and is
+        added as by :meth:`add_paragraph`. The paragraph elements are all
+        built in one pass and inserted together, so adding many paragraphs
+        this way is much faster than adding them one at a time.
+        """
+        change_count = xml_change_count()
+        p_lst = self._element.add_p_lst(
+            _text_and_style(item) for item in paragraphs
+        )
+        paragraph_lst = [Paragraph(p, self) for p in p_lst]
+        self.paragraphs._extend(paragraph_lst, change_count)
+        self.tables._children_appended(change_count)
+        return paragraph_lst
+
     def add_table(self, rows, cols):
         """
         Return a newly added table having *rows* rows and *cols* cols,
         appended to the content in this container.
         """
         from .table import Table
+        change_count = xml_change_count()
         tbl = self._element.add_tbl()
         table = Table(tbl, self)
         for i in range(cols):
             table.add_column()
         for i in range(rows):
             table.add_row()
+        self.tables._extend((table,), change_count)
+        self.paragraphs._children_appended(change_count)
         return table
 
-    @property
+    def find_all(self, pattern):
+        """
+        Return a list of ``(paragraph, match)`` 2-tuples, one for each match
+        of *pattern* in the text of a paragraph in this container, including
+        the paragraphs in its tables, in document order. *pattern* is
+        a regular expression, either a string or compiled, and *match* the
+        :class:`re.MatchObject` for it in the text of *paragraph*. A match
+        may span several runs.
+        """
+        regex = re.compile(pattern)
+        found = []
+        for p in self._element.iter(qn('w:p')):
+            text = TextMap(p).text
+            found.extend(
+                (Paragraph(p, self), match) for match in regex.finditer(text)
+            )
+        return found
+
+    @lazyproperty
     def paragraphs(self):
         """
-        A list containing the paragraphs in this container, in document
-        order. Read-only.
+        A sequence of the paragraphs in this container, in document order,
+        supporting ``len()``, iteration, and indexed access, including
+        negative indices and slices. Read-only.
         """
-        return [Paragraph(p, self) for p in self._element.p_lst]
+        return _BlockItems(self._element, 'w:p', Paragraph, self)
 
-    @property
+    def replace(self, mapping):
+        """
+        Replace each occurrence of each key of *mapping* in the text of the
+        paragraphs in this container, including the paragraphs in its
+        tables, with the corresponding value, and return the number of
+        replacements made. An occurrence may span several runs, as Word
+        often splits a placeholder such as ``{{name}}``; its replacement
+        takes the formatting of the run it starts in. All keys are matched
+        in a single pass over the text of each paragraph, the longest key
+        first where two match at the same position. Replacement text is not
+        itself searched again. A value that is not a string, such as
+        a number, is converted to one, and each tab or newline character in
+        a value becomes a tab or line break, as when setting |Run| text.
+        """
+        if not mapping:
+            return 0
+        if '' in mapping:
+            raise ValueError('cannot replace the empty string')
+        regex = re.compile('|'.join(
+            re.escape(key) for key in sorted(mapping, key=len, reverse=True)
+        ))
+        count = 0
+        for p in list(self._element.iter(qn('w:p'))):
+            text_map = TextMap(p)
+            matches = list(regex.finditer(text_map.text))
+            for match in reversed(matches):
+                text_map.replace(
+                    match.start(), match.end(), mapping[match.group()]
+                )
+            count += len(matches)
+        return count
+
+    @lazyproperty
     def tables(self):
         """
-        A list containing the tables in this container, in document order.
-        Read-only.
+        A sequence of the tables in this container, in document order,
+        supporting ``len()``, iteration, and indexed access, including
+        negative indices and slices. Read-only.
         """
         from .table import Table
-        return [Table(tbl, self) for tbl in self._element.tbl_lst]
+        return _BlockItems(self._element, 'w:tbl', Table, self)
+
+    def _invalidate_block_items(self):
+        """
+        Discard the cached lists of the paragraphs and tables in this
+        container, to be found again on next use.
+        """
+        self.paragraphs._invalidate()
+        self.tables._invalidate()
+
+
+class _BlockItems(Sequence):
+    """
+    Sequence of the |Paragraph| or |Table| objects for the child elements of
+    *element* having *tagname*, supporting ``len()``, iteration, and indexed
+    access, including negative indices and slices. The child elements are
+    found once and cached, and an object is created for each only when
+    first accessed, so ``len()`` and indexed access take no search. The
+    cache is refreshed once any element has been changed since it was
+    filled (see :func:`.xml_change_count`), however the change was made.
+    Block items added at the end through this API are appended to the
+    cache rather than having it refreshed.
+    """
+    def __init__(self, element, tagname, item_cls, parent):
+        super(_BlockItems, self).__init__()
+        self._element = element
+        self._tag = qn(tagname)
+        self._item_cls = item_cls
+        self._parent = parent
+        self._items_cache = None
+        self._change_count = None
+
+    def __getitem__(self, key):
+        items = self._items
+        if isinstance(key, slice):
+            return [
+                self._item(items, idx)
+                for idx in range(*key.indices(len(items)))
+            ]
+        if key < 0:
+            key += len(items)
+        if not 0 <= key < len(items):
+            raise IndexError('block item index [%d] out of range' % key)
+        return self._item(items, key)
+
+    def __iter__(self):
+        items = self._items
+        for idx in range(len(items)):
+            yield self._item(items, idx)
+
+    def __len__(self):
+        return len(self._items)
+
+    def _children_appended(self, change_count):
+        """
+        Account for the changes made since the count of changes was
+        *change_count*, all of them appending to the container element
+        children not having the tagname of this sequence, or changing those
+        children. The cached list, if it was current at *change_count*, is
+        kept rather than being found again for their sake.
+        """
+        if self._change_count == change_count:
+            self._change_count = xml_change_count()
+
+    def _extend(self, items, change_count):
+        """
+        Add *items*, the objects for child elements appended after the last
+        having the tagname of this sequence by the changes made since the
+        count of changes was *change_count*, to the cached list, if it was
+        current then, so adding block items at the end takes no search.
+        """
+        if self._items_cache is not None and (
+                self._change_count == change_count):
+            self._items_cache.extend(items)
+            self._change_count = xml_change_count()
+
+    def _invalidate(self):
+        """
+        Discard the cached list of child elements, to be found again on next
+        use.
+        """
+        self._items_cache = None
+
+    def _item(self, items, idx):
+        """
+        Return the object for the child element at *idx* in *items*,
+        a cached list, creating it on first access.
+        """
+        item = items[idx]
+        if not isinstance(item, self._item_cls):
+            item = items[idx] = self._item_cls(item, self._parent)
+        return item
+
+    @property
+    def _items(self):
+        """
+        A list containing, for each child element having the tagname of
+        this sequence, either the element or the object created for it,
+        found again when the cache was invalidated or an element has been
+        changed since it was filled.
+        """
+        change_count = xml_change_count()
+        if self._items_cache is None or change_count != self._change_count:
+            self._items_cache = self._element.findall(self._tag)
+            self._change_count = change_count
+        return self._items_cache
+
+
+def _text_and_style(item):
+    """
+    Return the ``(text, style)`` 2-tuple for *item*, an item passed to
+    :meth:`BlockItemContainer.add_paragraphs`, normalizing the 'Normal'
+    style to |None| as the :attr:`Paragraph.style` setter does.
+    """
+    if is_string(item):
+        return item, None
+    text, style = item
+    return text, None if style == 'Normal' else style
@@ -0,0 +1,216 @@
+# encoding: utf-8
+
+"""
+Removal of the styles, numbering definitions, relationships and parts
+a document no longer uses, by :meth:`Document.compact`.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+from lxml import etree
+
+from .opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from .oxml import parse_xml
+from .oxml.ns import nsmap, qn
+
+
+def compact_document(document):
+    """
+    Remove from *document* each style, numbering definition and explicit
+    relationship that nothing in its stories refers to, along with the
+    parts, such as images, left unused as a result. The stories are the
+    main document and its headers, footers, footnotes, endnotes and
+    comments; each is scanned once. A style is in use when a story, or a
+    style or numbering definition in use, refers to it; a default style is
+    always in use. Likewise for numbering definitions.
+    """
+    document_part = document._document_part
+    references = _References()
+    parts_dropped = _drop_unused_rels(
+        document_part, references.scan(document_part._element)
+    )
+    for rel in list(document_part.rels.values()):
+        if rel.is_external:
+            continue
+        part = rel.target_part
+        if part.content_type not in _story_content_types:
+            continue
+        parts_dropped |= _drop_unused_rels(
+            part, references.scan(_root_element(part))
+        )
+    settings_part = _related_part(document_part, RT.SETTINGS)
+    if settings_part is not None:
+        references.scan(_root_element(settings_part))
+
+    styles = _related_root(document_part, RT.STYLES)
+    numbering = _related_root(document_part, RT.NUMBERING)
+    _drop_unused_definitions(styles, numbering, references)
+
+    if parts_dropped:
+        package = document_part.package
+        package._invalidate_part_index()
+        parts = set(package.iter_parts())
+        for image_part in list(package.image_parts):
+            if image_part not in parts:
+                package.image_parts.remove(image_part)
+
+
+class _References(object):
+    """
+    The style ids, numIds and rIds referred to from the elements scanned.
+    """
+    def __init__(self):
+        super(_References, self).__init__()
+        self.style_ids = set()
+        self.numIds = set()
+
+    def scan(self, elm):
+        """
+        Add the style ids and numIds referred to from *elm* and its
+        descendants to those found so far, and return the set of rIds they
+        refer to.
+        """
+        style_ids, numIds, rIds = self.style_ids, self.numIds, set()
+        for e in elm.iter(etree.Element):
+            tag = e.tag
+            if tag in _style_ref_tags:
+                style_ids.add(e.get(_w_val))
+            elif tag == _numId_tag:
+                numIds.add(e.get(_w_val))
+            for name, value in e.items():
+                if name.startswith(_r_ns) or name in _rId_attrs:
+                    rIds.add(value)
+        return rIds
+
+
+def _children_by_id(root, tagname, id_attr):
+    """
+    Return a dict mapping the *id_attr* attribute of each child of *root*
+    having *tagname* to that child. The dict is empty if *root* is |None|.
+    """
+    if root is None:
+        return {}
+    return dict(
+        (child.get(qn(id_attr)), child)
+        for child in root.iterchildren(qn(tagname))
+    )
+
+
+def _drop_unused_definitions(styles, numbering, references):
+    """
+    Remove from *styles* and *numbering*, the root elements of the styles
+    and numbering parts, either of which may be |None|, each definition not
+    reachable from those *references* found in use.
+    """
+    styles_by_id = _children_by_id(styles, 'w:style', 'w:styleId')
+    nums_by_id = _children_by_id(numbering, 'w:num', 'w:numId')
+    abstractNums_by_id = _children_by_id(
+        numbering, 'w:abstractNum', 'w:abstractNumId'
+    )
+    style_ids, numIds = set(), set()
+    pending_style_ids = set(references.style_ids)
+    pending_style_ids.update(
+        style_id for style_id, style in styles_by_id.items()
+        if style.get(qn('w:default')) in ('1', 'true', 'on')
+    )
+    pending_numIds = set(references.numIds)
+    abstractNumIds = set()
+
+    while pending_style_ids or pending_numIds:
+        definitions = []
+        for style_id in pending_style_ids - style_ids:
+            style_ids.add(style_id)
+            if style_id in styles_by_id:
+                definitions.append(styles_by_id[style_id])
+        for numId in pending_numIds - numIds:
+            numIds.add(numId)
+            num = nums_by_id.get(numId)
+            if num is None:
+                continue
+            abstractNumId_elm = num.find(qn('w:abstractNumId'))
+            if abstractNumId_elm is None:
+                continue
+            abstractNumId = abstractNumId_elm.get(_w_val)
+            if abstractNumId in abstractNumIds:
+                continue
+            abstractNumIds.add(abstractNumId)
+            if abstractNumId in abstractNums_by_id:
+                definitions.append(abstractNums_by_id[abstractNumId])
+        references = _References()
+        for definition in definitions:
+            references.scan(definition)
+        pending_style_ids = references.style_ids - style_ids
+        pending_numIds = references.numIds - numIds
+
+    for style_id, style in styles_by_id.items():
+        if style_id not in style_ids:
+            styles.remove(style)
+    for numId, num in nums_by_id.items():
+        if numId not in numIds:
+            numbering.remove(num)
+    for abstractNumId, abstractNum in abstractNums_by_id.items():
+        if abstractNumId not in abstractNumIds:
+            numbering.remove(abstractNum)
+
+
+def _drop_unused_rels(part, rIds):
+    """
+    Remove each relationship of *part* of a type referred to by rId, such
+    as to an image or hyperlink, whose rId is not in *rIds*. Return |True|
+    if a relationship to another part was removed.
+    """
+    parts_dropped = False
+    for rId, rel in list(part.rels.items()):
+        if rel.reltype not in _explicit_reltypes or rId in rIds:
+            continue
+        del part.rels[rId]
+        parts_dropped |= not rel.is_external
+    return parts_dropped
+
+
+def _related_part(part, reltype):
+    """
+    Return the part *part* relates to by *reltype*, or |None| if there is
+    none.
+    """
+    try:
+        return part.part_related_by(reltype)
+    except KeyError:
+        return None
+
+
+def _related_root(part, reltype):
+    """
+    Return the root element of the XML part *part* relates to by *reltype*,
+    or |None| if there is none.
+    """
+    related_part = _related_part(part, reltype)
+    return None if related_part is None else related_part._element
+
+
+def _root_element(part):
+    """
+    Return the root element of *part*, parsing its blob when it is not an
+    XML part.
+    """
+    element = getattr(part, '_element', None)
+    return parse_xml(part.blob) if element is None else element
+
+
+_explicit_reltypes = frozenset((
+    RT.FOOTER, RT.HEADER, RT.HYPERLINK, RT.IMAGE,
+))
+_numId_tag = qn('w:numId')
+_r_ns = '{%s}' % nsmap['r']
+# refer to a relationship by rId from outside the r namespace
+_rId_attrs = frozenset((qn('o:relid'),))
+_story_content_types = frozenset((
+    CT.WML_COMMENTS, CT.WML_ENDNOTES, CT.WML_FOOTER, CT.WML_FOOTNOTES,
+    CT.WML_HEADER,
+))
+_style_ref_tags = frozenset(qn(tagname) for tagname in (
+    'w:basedOn', 'w:clickAndTypeStyle', 'w:defaultTableStyle', 'w:link',
+    'w:next', 'w:numStyleLink', 'w:pStyle', 'w:rStyle', 'w:styleLink',
+    'w:tblStyle',
+))
+_w_val = qn('w:val')
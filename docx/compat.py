@@ -26,6 +26,8 @@ if sys.version_info >= (3, 0):
 
     Unicode = str
 
+    unichr = chr
+
 # ===========================================================================
 # Python 2 versions
 # ===========================================================================
@@ -41,3 +43,5 @@ else:
         return isinstance(obj, basestring)
 
     Unicode = unicode
+
+    unichr = unichr
@@ -0,0 +1,441 @@
+# encoding: utf-8
+
+"""
+Concatenation of documents, by :func:`compose` and the |Composer| behind it
+and :meth:`Document.append_document`.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import posixpath
+
+from copy import deepcopy
+from io import BytesIO
+
+from lxml import etree
+
+from .api import Document
+from .opc.constants import RELATIONSHIP_TYPE as RT
+from .opc.oxml import serialize_part_xml
+from .opc.package import PartFactory, XmlPart
+from .opc.packuri import PackURI
+from .oxml import parse_xml
+from .oxml.ns import nsmap, qn
+
+
+def compose(documents):
+    """
+    Return a new |Document| made of the body content of each of *documents*
+    in turn, each either a |Document| instance or a path or stream
+    ``Document()`` can open. The composed document is a copy of the first,
+    so its section properties, headers and footers are those of the first.
+    The others are appended as by :meth:`Document.append_document`, by
+    a single |Composer|, so composing many documents takes time linear in
+    their total size, and with the same limitation: their footnotes,
+    endnotes and comments are left behind. None of *documents* is changed.
+    """
+    documents = iter(documents)
+    try:
+        first = next(documents)
+    except StopIteration:
+        raise ValueError('no documents to compose')
+    composed = _copy_of(first)
+    composer = Composer(composed)
+    for document in documents:
+        if not isinstance(document, Document):
+            document = Document(document)
+        composer.append(document)
+    return composed
+
+
+class Composer(object):
+    """
+    Appends the body content of other documents to the end of the body of
+    *document*, along with the parts, styles and numbering definitions that
+    content refers to. What it has learned about *document*, such as the ids
+    in use, is kept from one append to the next, and everything else is
+    looked up in hash maps built once per appended document, so that
+    appending many documents takes time linear in their total size.
+    """
+    def __init__(self, document):
+        super(Composer, self).__init__()
+        self._document_part = document._document_part
+        self._package = self._document_part.package
+        self._roots = {}
+        self._style_ids = None
+        self._next_ids = {}
+        self._anchors = {}
+        self._partname_idxs = {}
+        self._partnames = set()
+        # what is learned about the document being appended, reset by each
+        # append
+        self._source_part = None
+        self._source_roots = {}
+        self._source_definitions = {}
+        self._parts = {}
+        self._rIds = {}
+        self._numIds = {}
+        self._abstractNumIds = {}
+
+    def append(self, document):
+        """
+        Append the body content of *document*, a |Document| instance, less
+        its final section properties, to the end of the body of the composed
+        document, so it takes on the page layout of the last section there.
+        Relationships in that content are remapped to new or existing ones;
+        an image already in the composed document is reused rather than
+        copied. A style or numbering definition the content uses is copied
+        unless the composed document has a style of the same id, which then
+        applies instead. Numbering definitions are always copied under new
+        ids, so that lists in *document* restart rather than continuing
+        lists already present. Footnotes, endnotes and comments are not
+        copied, so each reference to one, such as a footnote mark, and each
+        comment range is removed from the appended content rather than left
+        pointing at a note or comment of the composed document, or at
+        nothing. *document* itself is left unchanged.
+        """
+        source_part = document._document_part
+        self._source_part = source_part
+        for reltype in (RT.STYLES, RT.NUMBERING):
+            self._source_roots[reltype] = _related_root(source_part, reltype)
+        for lookup in (self._source_definitions, self._parts, self._rIds,
+                       self._numIds, self._abstractNumIds):
+            lookup.clear()
+        self._parts[source_part] = self._document_part
+
+        elms = [
+            deepcopy(elm) for elm in source_part._element.body
+            if elm.tag != qn('w:sectPr') and elm.tag not in _annotation_tags
+        ]
+        for elm in elms:
+            self._import_ids(elm, in_story=True, in_body=True)
+        self._document_part._element.body.insert_elements_before(
+            elms, 'w:sectPr'
+        )
+        self._document_part.invalidate_body_indexes()
+
+    def _abstractNumId(self, abstractNumId):
+        """
+        Return the id of the copy in the composed document of the abstract
+        numbering definition having *abstractNumId* in the document being
+        appended, copying it on first use.
+        """
+        if abstractNumId in self._abstractNumIds:
+            return self._abstractNumIds[abstractNumId]
+        abstractNum = self._source_definition(
+            RT.NUMBERING, 'w:abstractNum', 'w:abstractNumId', abstractNumId
+        )
+        if abstractNum is None:
+            return abstractNumId
+        new_abstractNumId = '%d' % self._new_id('abstractNum')
+        self._abstractNumIds[abstractNumId] = new_abstractNumId
+        abstractNum = deepcopy(abstractNum)
+        abstractNum.set(qn('w:abstractNumId'), new_abstractNumId)
+        self._add_definition(
+            self._roots[RT.NUMBERING], abstractNum,
+            'w:num', 'w:numIdMacAtCleanup'
+        )
+        self._import_ids(abstractNum)
+        return new_abstractNumId
+
+    def _add_definition(self, root, elm, *tagnames):
+        """
+        Add *elm* to *root* directly after the last element of its kind
+        added, or before the first child having a tagname in *tagnames* for
+        the first one, so that adding many takes no search.
+        """
+        anchor = self._anchors.get(elm.tag)
+        if anchor is not None and anchor.getparent() is root:
+            anchor.addnext(elm)
+        else:
+            root.insert_element_before(elm, *tagnames)
+        self._anchors[elm.tag] = elm
+
+    def _definitions(self, reltype):
+        """
+        Return the root element of the styles or numbering part, according
+        to *reltype*, of the composed document, or |None| if neither it nor
+        the document being appended has one. When only the document being
+        appended has one, that part is copied whole, its ids being left as
+        they are.
+        """
+        if reltype in self._roots:
+            return self._roots[reltype]
+        part = _related_part(self._document_part, reltype)
+        if part is None:
+            source_part = _related_part(self._source_part, reltype)
+            if source_part is None:
+                return None
+            part = self._import_part(source_part, reltype)
+            self._document_part.relate_to(part, reltype)
+            self._source_roots[reltype] = None
+        root = self._roots[reltype] = part._element
+        if reltype == RT.STYLES:
+            self._style_ids = set(root.xpath('./w:style/@w:styleId'))
+        return root
+
+    def _import_ids(self, elm, in_story=False, in_body=False):
+        """
+        Remap, in a single pass, each reference to a style or numbering
+        definition in *elm* and its descendants, copied from the document
+        being appended, to its equivalent in the composed document. When
+        *in_story* is |True|, *elm* being content of the body, a header or
+        a footer, drawings are given new ids and references to footnotes,
+        endnotes and comments, which are not copied, are removed. When
+        *in_body* is |True| as well, relationship references are remapped
+        too; a copied header or footer keeps the rIds of its own.
+        """
+        annotations = []
+        for e in elm.iter(etree.Element):
+            tag, val = e.tag, e.get(_w_val)
+            if tag in _style_ref_tags and val is not None:
+                e.set(_w_val, self._style_id(val))
+            elif tag == _numId_tag and val is not None:
+                e.set(_w_val, self._numId(val))
+            elif tag == _docPr_tag and in_story:
+                e.set('id', '%d' % self._new_id('shape'))
+            if not in_story:
+                continue
+            if tag in _annotation_tags:
+                annotations.append(e)
+                continue
+            if not in_body:
+                continue
+            for name, value in e.items():
+                if name.startswith(_r_ns):
+                    e.set(name, self._rId(value))
+        for e in annotations:
+            e.getparent().remove(e)
+
+    def _import_part(self, part, reltype):
+        """
+        Return the copy in the composed document of *part*, a part of the
+        document being appended, copying it and the parts it relates to on
+        first use. An image already in the composed document is used rather
+        than copied. The XML of a header or footer is remapped as body
+        content is, less its relationship references.
+        """
+        if part in self._parts:
+            return self._parts[part]
+        if reltype == RT.IMAGE:
+            imported_part = self._package.image_parts.import_image_part(part)
+            self._parts[part] = imported_part
+            return imported_part
+        blob = part.blob
+        if reltype in _story_reltypes:
+            root = parse_xml(blob)
+            self._import_ids(root, in_story=True)
+            blob = serialize_part_xml(root)
+        imported_part = PartFactory(
+            self._new_partname(part.partname), part.content_type, reltype,
+            blob, self._package
+        )
+        self._parts[part] = imported_part
+        # the rIds are kept, being referred to in the blob of the part
+        for rel in part.rels.values():
+            target = (
+                rel.target_ref if rel.is_external else
+                self._import_part(rel.target_part, rel.reltype)
+            )
+            imported_part.load_rel(
+                rel.reltype, target, rel.rId, rel.is_external
+            )
+        return imported_part
+
+    def _new_id(self, kind):
+        """
+        Return a new integer id for an ``'abstractNum'`` or ``'num'``
+        numbering definition or a ``'shape'``, one greater than any in use
+        in the composed document, shape ids being unique across its body,
+        headers and footers.
+        """
+        if kind not in self._next_ids:
+            if kind == 'shape':
+                ids = [
+                    id_str for root in self._story_roots()
+                    for id_str in root.xpath('//@id')
+                ]
+            else:
+                ids = self._roots[RT.NUMBERING].xpath(
+                    './w:%s/@w:%sId' % (kind, kind)
+                )
+            used_ids = [int(id_str) for id_str in ids if id_str.isdigit()]
+            self._next_ids[kind] = max(used_ids + [0]) + 1
+        new_id = self._next_ids[kind]
+        self._next_ids[kind] += 1
+        return new_id
+
+    def _new_partname(self, partname):
+        """
+        Return a partname for the copy of a part at *partname* in the
+        document being appended, unused in the composed document and
+        numbered after it, e.g. '/word/header3.xml' for '/word/header1.xml'.
+        """
+        base, ext = posixpath.splitext(partname)
+        tmpl = '%s%%d%s' % (base.rstrip('0123456789'), ext)
+        idx = self._partname_idxs.get(tmpl, 1)
+        while True:
+            candidate = PackURI(tmpl % idx)
+            idx += 1
+            if candidate in self._partnames:
+                continue
+            try:
+                self._package.part_with_partname(candidate)
+            except KeyError:
+                break
+        self._partname_idxs[tmpl] = idx
+        self._partnames.add(candidate)
+        return candidate
+
+    def _numId(self, numId):
+        """
+        Return the id of the copy in the composed document of the numbering
+        definition having *numId* in the document being appended, copying it
+        on first use.
+        """
+        if numId in self._numIds:
+            return self._numIds[numId]
+        if self._definitions(RT.NUMBERING) is None:
+            return numId
+        num = self._source_definition(
+            RT.NUMBERING, 'w:num', 'w:numId', numId
+        )
+        if num is None:
+            return numId
+        new_numId = '%d' % self._new_id('num')
+        self._numIds[numId] = new_numId
+        num = deepcopy(num)
+        num.set(qn('w:numId'), new_numId)
+        abstractNumId = num.find(qn('w:abstractNumId'))
+        abstractNumId.set(
+            _w_val, self._abstractNumId(abstractNumId.get(_w_val))
+        )
+        self._add_definition(
+            self._roots[RT.NUMBERING], num, 'w:numIdMacAtCleanup'
+        )
+        return new_numId
+
+    def _rId(self, rId):
+        """
+        Return the rId of the relationship of the composed document
+        equivalent to that having *rId* in the document being appended,
+        relating to a copy of its target part on first use.
+        """
+        if rId in self._rIds:
+            return self._rIds[rId]
+        try:
+            rel = self._source_part.rels[rId]
+        except KeyError:
+            return rId
+        if rel.is_external:
+            new_rId = self._document_part.relate_to(
+                rel.target_ref, rel.reltype, is_external=True
+            )
+        else:
+            new_rId = self._document_part.relate_to(
+                self._import_part(rel.target_part, rel.reltype), rel.reltype
+            )
+        self._rIds[rId] = new_rId
+        return new_rId
+
+    def _source_definition(self, reltype, tagname, id_attr, id_):
+        """
+        Return the child element having *tagname* and *id_* for its
+        *id_attr* attribute of the styles or numbering part, according to
+        *reltype*, of the document being appended, or |None| if there is
+        none. The children are indexed by id on first use.
+        """
+        definitions = self._source_definitions.get(tagname)
+        if definitions is None:
+            root = self._source_roots[reltype]
+            children = () if root is None else root.iterchildren(qn(tagname))
+            definitions = self._source_definitions[tagname] = dict(
+                (child.get(qn(id_attr)), child) for child in children
+            )
+        return definitions.get(id_)
+
+    def _story_roots(self):
+        """
+        Generate the root element of the main document part of the composed
+        document and of each header and footer part it relates to.
+        """
+        yield self._document_part._element
+        for rel in list(self._document_part.rels.values()):
+            if rel.is_external or rel.reltype not in _story_reltypes:
+                continue
+            part = rel.target_part
+            if isinstance(part, XmlPart):
+                yield part._element
+                continue
+            yield parse_xml(part.blob)
+
+    def _style_id(self, style_id):
+        """
+        Return *style_id*, a style id used in the document being appended,
+        after copying that style to the composed document, along with the
+        styles it is based on or linked to, unless a style having that id is
+        already there.
+        """
+        styles = self._definitions(RT.STYLES)
+        if styles is None or style_id in self._style_ids:
+            return style_id
+        style = self._source_definition(
+            RT.STYLES, 'w:style', 'w:styleId', style_id
+        )
+        if style is None:
+            return style_id
+        self._style_ids.add(style_id)
+        style = deepcopy(style)
+        styles.append(style)
+        self._import_ids(style)
+        return style_id
+
+
+# refer by id to a footnote, endnote or comment in a part of their own
+_annotation_tags = frozenset(qn(tagname) for tagname in (
+    'w:commentRangeEnd', 'w:commentRangeStart', 'w:commentReference',
+    'w:endnoteReference', 'w:footnoteReference',
+))
+_docPr_tag = qn('wp:docPr')
+_numId_tag = qn('w:numId')
+_r_ns = '{%s}' % nsmap['r']
+# parts holding content of their own, as the body does
+_story_reltypes = frozenset((RT.FOOTER, RT.HEADER))
+_style_ref_tags = frozenset(qn(tagname) for tagname in (
+    'w:basedOn', 'w:link', 'w:next', 'w:numStyleLink', 'w:pStyle',
+    'w:rStyle', 'w:styleLink', 'w:tblStyle',
+))
+_w_val = qn('w:val')
+
+
+def _copy_of(document):
+    """
+    Return a new |Document| having the content of *document*, either
+    a |Document| instance or a path or stream ``Document()`` can open.
+    """
+    if not isinstance(document, Document):
+        return Document(document)
+    # saving and reopening copies every part and relationship at once
+    stream = BytesIO()
+    document.save(stream)
+    return Document(stream)
+
+
+def _related_part(part, reltype):
+    """
+    Return the part *part* relates to by *reltype*, or |None| if there is
+    none.
+    """
+    try:
+        return part.part_related_by(reltype)
+    except KeyError:
+        return None
+
+
+def _related_root(part, reltype):
+    """
+    Return the root element of the part *part* relates to by *reltype*, or
+    |None| if there is none.
+    """
+    related_part = _related_part(part, reltype)
+    return None if related_part is None else related_part._element
@@ -0,0 +1,644 @@
+# encoding: utf-8
+
+"""
+Export of the body of a document to plain text, Markdown or simple HTML.
+
+An |Exporter| visits the block-level children of ``<w:body>`` once, in
+document order, dispatching on the tag of each element to a handler method,
+and writes each block to its output as soon as it is visited. Handlers work
+on the XML directly, so no proxy objects are created, and :func:`export`
+can stream the body of a .docx file through :func:`lxml.etree.iterparse`
+without loading the package or holding its whole XML tree in memory.
+Subclassing an exporter and overriding its handlers changes how each kind
+of content is rendered.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import re
+
+from io import BytesIO, StringIO
+from xml.sax.saxutils import escape, quoteattr
+
+from lxml import etree
+
+from .api import Document
+from .opc.constants import RELATIONSHIP_TYPE as RT
+from .opc.packuri import PACKAGE_URI, PackURI
+from .opc.phys_pkg import PhysPkgReader
+from .oxml.ns import qn
+from .oxml.text import run_content_text, sym_text
+
+
+def export(source, out=None, format='text'):
+    """
+    Write the body content of *source* to *out* in *format*, one of
+    ``'text'``, ``'markdown'`` or ``'html'``. *source* is either
+    a |Document| instance or the path to, or a file-like object containing,
+    a .docx file, in which case the main document part is parsed
+    incrementally and the package is not otherwise loaded. *out* is a text
+    stream; if it is |None|, the output is returned as a string instead.
+    """
+    exporter_cls = exporter_classes.get(format)
+    if exporter_cls is None:
+        raise ValueError('unsupported export format %r' % format)
+    stream = StringIO() if out is None else out
+    if isinstance(source, Document):
+        document_part = source._document_part
+        targets = dict(
+            (rId, rel.target_ref) for rId, rel in document_part.rels.items()
+        )
+        try:
+            numbering = document_part.part_related_by(RT.NUMBERING)._element
+        except KeyError:
+            numbering = None
+        blocks = document_part._element.body.iterchildren()
+        exporter_cls(stream, targets, _list_formats(numbering)).export(
+            blocks
+        )
+    else:
+        phys_reader = PhysPkgReader(source)
+        try:
+            partname = _main_document_partname(phys_reader)
+            rels_xml = phys_reader.rels_xml_for(partname)
+            numbering = _numbering_root(phys_reader, partname, rels_xml)
+            blocks = _iterparse_blocks(phys_reader.blob_for(partname))
+            exporter_cls(
+                stream, _targets(rels_xml), _list_formats(numbering)
+            ).export(blocks)
+        finally:
+            phys_reader.close()
+    if out is None:
+        return stream.getvalue()
+
+
+class Exporter(object):
+    """
+    Base class for exporters, writing to *out*, a text stream. *targets*
+    maps the rIds of the main document part to the targets of their
+    relationships, such as the URL of a hyperlink or the relative reference
+    of an image, e.g. ``'media/image1.png'``. *list_formats* maps
+    a ``(numId, ilvl)`` 2-tuple of strings to the number format of that
+    level of a list, such as ``'bullet'`` or ``'decimal'``.
+
+    :meth:`block` dispatches each block-level element by tag through
+    :attr:`block_handlers` to :meth:`paragraph`, :meth:`table` or
+    :meth:`sdt`, which write their output. Paragraph content is dispatched
+    through :attr:`inline_handlers` to :meth:`run`, :meth:`hyperlink` and
+    others, and run content through :attr:`run_handlers` to :meth:`text`,
+    :meth:`drawing` and others, each of which returns the string rendering
+    its element. This base class renders every element as an empty string;
+    subclasses override the handlers they need.
+    """
+    block_handlers = {
+        qn('w:p'): 'paragraph',
+        qn('w:sdt'): 'sdt',
+        qn('w:tbl'): 'table',
+    }
+    inline_handlers = {
+        qn('w:fldSimple'): 'inline_container',
+        qn('w:hyperlink'): 'hyperlink',
+        qn('w:ins'): 'inline_container',
+        qn('w:r'): 'run',
+        qn('w:sdt'): 'inline_sdt',
+        qn('w:smartTag'): 'inline_container',
+    }
+    run_handlers = {
+        qn('w:br'): 'line_break',
+        qn('w:cr'): 'line_break',
+        qn('w:drawing'): 'drawing',
+        qn('w:sym'): 'sym',
+        qn('w:t'): 'text',
+        qn('w:tab'): 'tab',
+    }
+
+    def __init__(self, out, targets=None, list_formats=None):
+        super(Exporter, self).__init__()
+        self._writes = [out.write]
+        self._targets = {} if targets is None else targets
+        self._list_formats = {} if list_formats is None else list_formats
+
+    def block(self, elm):
+        """
+        Visit *elm*, a block-level element such as a paragraph or table,
+        dispatching it to its handler. Elements of other kinds are skipped.
+        """
+        handler = self.block_handlers.get(elm.tag)
+        if handler is not None:
+            getattr(self, handler)(elm)
+
+    def cell(self, tc):
+        """
+        Return the rendering of the block items in table cell *tc*.
+        """
+        return self.capture(tc.iterchildren())
+
+    def capture(self, blocks):
+        """
+        Return the output written while visiting each of *blocks*, rather
+        than writing it, e.g. to render the content of a table cell.
+        """
+        chunks = []
+        self._writes.append(chunks.append)
+        try:
+            for block in blocks:
+                self.block(block)
+        finally:
+            self._writes.pop()
+        return ''.join(chunks)
+
+    def drawing(self, drawing):
+        return ''
+
+    def end(self):
+        """
+        Called after the last block is visited.
+        """
+
+    def export(self, blocks):
+        """
+        Write each of *blocks*, the block-level children of a ``<w:body>``
+        element, in order.
+        """
+        self.start()
+        for block in blocks:
+            self.block(block)
+        self.end()
+
+    def hyperlink(self, hyperlink):
+        return self.inline_container(hyperlink)
+
+    def inline(self, p):
+        """
+        Return the rendering of the content of paragraph *p*, or of another
+        element containing runs.
+        """
+        inline_handlers = self.inline_handlers
+        chunks = []
+        for child in p.iterchildren():
+            handler = inline_handlers.get(child.tag)
+            if handler is not None:
+                chunks.append(getattr(self, handler)(child))
+        return ''.join(chunks)
+
+    def inline_container(self, elm):
+        """
+        Return the rendering of the runs and other inline content in *elm*,
+        such as an inserted revision or a simple field.
+        """
+        return self.inline(elm)
+
+    def inline_sdt(self, sdt):
+        sdtContent = sdt.find(qn('w:sdtContent'))
+        return '' if sdtContent is None else self.inline(sdtContent)
+
+    def line_break(self, br):
+        return ''
+
+    def paragraph(self, p):
+        pass
+
+    def run(self, r):
+        """
+        Return the rendering of the content of run *r*.
+        """
+        run_handlers = self.run_handlers
+        chunks = []
+        for child in r.iterchildren():
+            handler = run_handlers.get(child.tag)
+            if handler is not None:
+                chunks.append(getattr(self, handler)(child))
+        return ''.join(chunks)
+
+    def sdt(self, sdt):
+        """
+        Visit the block-level content of structured document tag *sdt*.
+        """
+        sdtContent = sdt.find(qn('w:sdtContent'))
+        if sdtContent is None:
+            return
+        for block in sdtContent.iterchildren():
+            self.block(block)
+
+    def start(self):
+        """
+        Called before the first block is visited.
+        """
+
+    def sym(self, sym):
+        return ''
+
+    def tab(self, tab):
+        return ''
+
+    def table(self, tbl):
+        pass
+
+    def text(self, t):
+        return ''
+
+    def write(self, text):
+        """
+        Write *text* to the output, or to the capture in progress.
+        """
+        self._writes[-1](text)
+
+    def _rows(self, tbl):
+        """
+        Return a list of the rows of *tbl*, each a list of the rendering of
+        each of its cells.
+        """
+        return [
+            [self.cell(tc) for tc in tr.iterchildren(qn('w:tc'))]
+            for tr in tbl.iterchildren(qn('w:tr'))
+        ]
+
+
+class TextExporter(Exporter):
+    """
+    Renders each paragraph as a line of plain text, and each table row as
+    a line of its cells separated by tabs.
+    """
+    def cell(self, tc):
+        text = super(TextExporter, self).cell(tc)
+        return ' '.join(text.split('\n')).strip()
+
+    def line_break(self, br):
+        return run_content_text(br)
+
+    def paragraph(self, p):
+        self.write(self.inline(p) + '\n')
+
+    def sym(self, sym):
+        return sym_text(sym)
+
+    def tab(self, tab):
+        return run_content_text(tab)
+
+    def table(self, tbl):
+        for cells in self._rows(tbl):
+            self.write('\t'.join(cells) + '\n')
+
+    def text(self, t):
+        return run_content_text(t)
+
+
+class MarkdownExporter(TextExporter):
+    """
+    Renders headings, list items, bold and italic runs, hyperlinks, pictures
+    and tables as Markdown. Each block is followed by a blank line.
+    """
+    def cell(self, tc):
+        text = super(MarkdownExporter, self).cell(tc)
+        return text.replace('|', '\\|')
+
+    def drawing(self, drawing):
+        alt_text, src = _picture(drawing, self._targets)
+        if src is None:
+            return ''
+        return '![%s](%s)' % (_md_escape(alt_text), _md_url(src))
+
+    def hyperlink(self, hyperlink):
+        text = self.inline(hyperlink)
+        url = _safe_url(self._targets.get(hyperlink.get(qn('r:id'))))
+        return text if url is None else '[%s](%s)' % (text, _md_url(url))
+
+    def line_break(self, br):
+        return '  \n'
+
+    def paragraph(self, p):
+        text = self.inline(p)
+        if not text.strip():
+            return
+        kind, level = _paragraph_kind(p, self._list_formats)
+        if kind == 'heading':
+            prefix = '#' * level + ' '
+        elif kind == 'bullet':
+            prefix = '   ' * level + '- '
+        elif kind == 'number':
+            prefix = '   ' * level + '1. '
+        else:
+            prefix = ''
+        self.write(prefix + text + '\n\n')
+
+    def run(self, r):
+        text = super(MarkdownExporter, self).run(r)
+        if not text.strip():
+            return text
+        bold, italic = _run_emphasis(r)
+        if italic:
+            text = '*%s*' % text
+        if bold:
+            text = '**%s**' % text
+        return text
+
+    def table(self, tbl):
+        rows = self._rows(tbl)
+        if not rows:
+            return
+        width = max(len(cells) for cells in rows)
+        lines = []
+        for idx, cells in enumerate(rows):
+            cells = cells + [''] * (width - len(cells))
+            lines.append('| %s |' % ' | '.join(cells))
+            if idx == 0:
+                lines.append('|%s' % (' --- |' * width))
+        self.write('\n'.join(lines) + '\n\n')
+
+    def text(self, t):
+        return _md_escape(run_content_text(t))
+
+
+class HtmlExporter(Exporter):
+    """
+    Renders the body as an HTML fragment of ``<p>``, ``<h1>`` to ``<h6>``,
+    ``<table>``, ``<strong>``, ``<em>``, ``<a>`` and ``<img>`` elements, one
+    block per line.
+    """
+    def cell(self, tc):
+        # a cell of a single paragraph, the usual case, needs no <p>
+        ps = tc.findall(qn('w:p'))
+        if len(ps) == 1 and len(tc) - (tc[0].tag == qn('w:tcPr')) == 1:
+            return '<td>%s</td>' % self.inline(ps[0])
+        return '<td>%s</td>' % super(HtmlExporter, self).cell(tc).strip()
+
+    def drawing(self, drawing):
+        alt_text, src = _picture(drawing, self._targets)
+        if src is None:
+            return ''
+        return '<img src=%s alt=%s>' % (quoteattr(src), quoteattr(alt_text))
+
+    def hyperlink(self, hyperlink):
+        text = self.inline(hyperlink)
+        url = _safe_url(self._targets.get(hyperlink.get(qn('r:id'))))
+        if url is None:
+            return text
+        return '<a href=%s>%s</a>' % (quoteattr(url), text)
+
+    def line_break(self, br):
+        return '<br>'
+
+    def paragraph(self, p):
+        kind, level = _paragraph_kind(p, self._list_formats)
+        tag = 'h%d' % min(level, 6) if kind == 'heading' else 'p'
+        self.write('<%s>%s</%s>\n' % (tag, self.inline(p), tag))
+
+    def run(self, r):
+        text = super(HtmlExporter, self).run(r)
+        if not text:
+            return text
+        bold, italic = _run_emphasis(r)
+        if italic:
+            text = '<em>%s</em>' % text
+        if bold:
+            text = '<strong>%s</strong>' % text
+        return text
+
+    def sym(self, sym):
+        return escape(sym_text(sym))
+
+    def tab(self, tab):
+        return run_content_text(tab)
+
+    def table(self, tbl):
+        self.write('<table>\n')
+        for cells in self._rows(tbl):
+            self.write('<tr>%s</tr>\n' % ''.join(cells))
+        self.write('</table>\n')
+
+    def text(self, t):
+        return escape(run_content_text(t))
+
+
+exporter_classes = {
+    'html': HtmlExporter,
+    'markdown': MarkdownExporter,
+    'text': TextExporter,
+}
+
+
+_md_special = re.compile(r'([\\`*_\[\]#])')
+
+# characters ending or breaking a Markdown link destination
+_md_url_special = re.compile(r'[\s()<>\\]')
+
+# schemes of URLs safe to render as a link or image source; a relative URL
+# has none
+_safe_schemes = frozenset(('ftp', 'http', 'https', 'mailto'))
+
+_url_scheme = re.compile(r'([A-Za-z][A-Za-z0-9+.-]*):')
+
+
+def _iterparse_blocks(blob):
+    """
+    Generate each block-level child of the ``<w:body>`` element in *blob*,
+    the XML of a main document part, as soon as it is parsed. Each is
+    discarded once the next is requested, so the memory used does not grow
+    with the length of the document.
+    """
+    body_tag = qn('w:body')
+    context = etree.iterparse(
+        BytesIO(blob), events=('end',), remove_blank_text=True
+    )
+    for event, elm in context:
+        parent = elm.getparent()
+        if parent is None or parent.tag != body_tag:
+            continue
+        yield elm
+        elm.clear()
+        while elm.getprevious() is not None:
+            del parent[0]
+
+
+def _is_on(elm):
+    """
+    Return |True| if *elm* is a present toggle property element, such as
+    ``<w:b/>``, not turned off by its ``w:val`` attribute.
+    """
+    if elm is None:
+        return False
+    return elm.get(qn('w:val')) not in ('0', 'false', 'off')
+
+
+def _main_document_partname(phys_reader):
+    """
+    Return the partname of the main document part of the package read by
+    *phys_reader*.
+    """
+    for reltype, target in _rels(phys_reader.rels_xml_for(PACKAGE_URI)):
+        if reltype == RT.OFFICE_DOCUMENT:
+            return PackURI.from_rel_ref(PACKAGE_URI.baseURI, target)
+    raise KeyError('package has no main document part')
+
+
+def _level_formats(elm):
+    """
+    Return a dict mapping the ``w:ilvl`` of each ``<w:lvl>`` child of *elm*,
+    an abstract numbering definition or level override, to its number
+    format.
+    """
+    level_formats = {}
+    for lvl in elm.iterchildren(qn('w:lvl')):
+        numFmt = lvl.find(qn('w:numFmt'))
+        if numFmt is not None:
+            level_formats[lvl.get(qn('w:ilvl'))] = numFmt.get(qn('w:val'))
+    return level_formats
+
+
+def _list_formats(numbering):
+    """
+    Return a dict mapping a ``(numId, ilvl)`` 2-tuple of strings to the
+    number format of that level of each numbering definition in
+    *numbering*, the root element of a numbering part, which may be |None|.
+    """
+    if numbering is None:
+        return {}
+    abstract_formats = dict(
+        (abstractNum.get(qn('w:abstractNumId')), _level_formats(abstractNum))
+        for abstractNum in numbering.iterchildren(qn('w:abstractNum'))
+    )
+    list_formats = {}
+    for num in numbering.iterchildren(qn('w:num')):
+        abstractNumId = num.find(qn('w:abstractNumId'))
+        level_formats = dict(abstract_formats.get(
+            None if abstractNumId is None else abstractNumId.get(qn('w:val')),
+            {}
+        ))
+        for lvlOverride in num.iterchildren(qn('w:lvlOverride')):
+            level_formats.update(_level_formats(lvlOverride))
+        numId = num.get(qn('w:numId'))
+        for ilvl, numFmt in level_formats.items():
+            list_formats[(numId, ilvl)] = numFmt
+    return list_formats
+
+
+def _md_escape(text):
+    return _md_special.sub(r'\\\1', text)
+
+
+def _md_url(url):
+    """
+    Return *url* with each character that would end or break a Markdown
+    link destination percent-encoded.
+    """
+    return _md_url_special.sub(lambda m: '%%%02X' % ord(m.group()), url)
+
+
+def _numbering_root(phys_reader, partname, rels_xml):
+    """
+    Return the root element of the numbering part related to the main
+    document part at *partname*, whose rels item XML is *rels_xml*, or
+    |None| if it has none.
+    """
+    for reltype, target in _rels(rels_xml):
+        if reltype != RT.NUMBERING:
+            continue
+        try:
+            blob = phys_reader.blob_for(
+                PackURI.from_rel_ref(partname.baseURI, target)
+            )
+        except KeyError:
+            return None
+        return etree.fromstring(blob)
+    return None
+
+
+def _paragraph_kind(p, list_formats):
+    """
+    Return a ``(kind, level)`` 2-tuple for paragraph *p*, *kind* being one
+    of ``'heading'``, ``'bullet'``, ``'number'`` or ``'body'``, judged by
+    its style id and numbering, and *level* the heading level or the list
+    level. Whether a numbered paragraph is a bullet is looked up in
+    *list_formats*, mapping as described for |Exporter|.
+    """
+    pPr = p.find(qn('w:pPr'))
+    if pPr is None:
+        return 'body', 0
+    pStyle = pPr.find(qn('w:pStyle'))
+    style_id = '' if pStyle is None else pStyle.get(qn('w:val'), '')
+    if style_id == 'Title':
+        return 'heading', 1
+    if style_id.startswith('Heading') and style_id[7:].isdigit():
+        return 'heading', int(style_id[7:])
+    if style_id.startswith('ListNumber'):
+        return 'number', 0
+    if style_id.startswith('ListBullet'):
+        return 'bullet', 0
+    numPr = pPr.find(qn('w:numPr'))
+    if numPr is None:
+        return 'body', 0
+    numId, ilvl = numPr.find(qn('w:numId')), numPr.find(qn('w:ilvl'))
+    numId = None if numId is None else numId.get(qn('w:val'))
+    ilvl = '0' if ilvl is None else ilvl.get(qn('w:val'), '0')
+    if numId == '0':
+        return 'body', 0
+    numFmt = list_formats.get((numId, ilvl))
+    kind = 'bullet' if numFmt in (None, 'bullet') else 'number'
+    return kind, int(ilvl) if ilvl.isdigit() else 0
+
+
+def _picture(drawing, targets):
+    """
+    Return an ``(alt_text, src)`` 2-tuple for the picture in *drawing*,
+    *src* being the relationship target of its image, or |None| if it
+    contains no embedded picture.
+    """
+    blip = next(drawing.iter(qn('a:blip')), None)
+    src = None if blip is None else _safe_url(
+        targets.get(blip.get(qn('r:embed')))
+    )
+    docPr = next(drawing.iter(qn('wp:docPr')), None)
+    alt_text = '' if docPr is None else (
+        docPr.get('descr') or docPr.get('name') or ''
+    )
+    return alt_text, src
+
+
+def _rels(rels_xml):
+    """
+    Generate a ``(reltype, target)`` 2-tuple for each relationship in
+    *rels_xml*, the XML of a rels item, which may be |None|.
+    """
+    if rels_xml is None:
+        return
+    for rel in etree.fromstring(rels_xml):
+        yield rel.get('Type'), rel.get('Target')
+
+
+def _run_emphasis(r):
+    """
+    Return a ``(bold, italic)`` 2-tuple of booleans for run *r*, judged by
+    its direct formatting.
+    """
+    rPr = r.find(qn('w:rPr'))
+    if rPr is None:
+        return False, False
+    return _is_on(rPr.find(qn('w:b'))), _is_on(rPr.find(qn('w:i')))
+
+
+def _safe_url(url):
+    """
+    Return *url* if it is relative or its scheme is a safe one, such as
+    ``http``, otherwise |None|, so a ``javascript:`` URL is never rendered
+    as a link or image source. A browser ignores whitespace and control
+    characters in a scheme, so they are dropped before it is checked.
+    """
+    if url is None:
+        return None
+    match = _url_scheme.match(re.sub('[\x00-\x20]', '', url))
+    if match is not None and match.group(1).lower() not in _safe_schemes:
+        return None
+    return url
+
+
+def _targets(rels_xml):
+    """
+    Return a dict mapping the rId of each relationship in *rels_xml*, the
+    XML of a rels item which may be |None|, to its target.
+    """
+    if rels_xml is None:
+        return {}
+    return dict(
+        (rel.get('Id'), rel.get('Target'))
+        for rel in etree.fromstring(rels_xml)
+    )
@@ -7,7 +7,6 @@ size, as a required step in including them in a document.
 
 from __future__ import absolute_import, division, print_function
 
-import hashlib
 import os
 
 from ..compat import BytesIO, is_string
@@ -122,6 +121,7 @@ class Image(object):
         """
         SHA1 hash digest of the image blob
         """
+        import hashlib  # deferred, loads OpenSSL
         return hashlib.sha1(self._blob).hexdigest()
 
     @classmethod
@@ -141,7 +141,7 @@ def _ImageHeaderFactory(stream):
     Return a |BaseImageHeader| subclass instance that knows how to parse the
     headers of the image in *stream*.
     """
-    from docx.image import SIGNATURES
+    from docx.image.signatures import SIGNATURES
 
     def read_32(stream):
         stream.seek(0)
@@ -0,0 +1,225 @@
+# encoding: utf-8
+
+"""
+Opt-in timing of the phases of opening and saving a document, for finding
+out where the time went on a slow one. Recording is off by default and costs
+a single global lookup per phase while off.
+
+Typical use::
+
+    from docx import instrumentation
+
+    with instrumentation.recording() as recorder:
+        document = Document('slow.docx')
+        document.save('out.docx')
+    print(recorder.report())
+
+Phases recorded, each with elapsed seconds and, where meaningful, the number
+of bytes processed:
+
+* ``read``, all of :meth:`PackageReader.from_file`, made up of
+  ``read.rels`` per rels item and ``read.inflate`` per part
+* ``unmarshal``, all of :meth:`Unmarshaller.unmarshal`, made up of
+  ``unmarshal.part`` per part constructed, which includes ``parse`` for the
+  XML of each XML part, then ``unmarshal.rels`` and
+  ``unmarshal.after_unmarshal``
+* ``save.before_marshal``
+* ``write``, all of :meth:`PackageWriter.write`, made up of
+  ``write.serialize`` and ``write.deflate`` per part and rels item
+
+A single recorder is active at a time and is shared by all threads.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import threading
+
+from timeit import default_timer
+
+
+_recorder = None
+
+
+def enable(callback=None):
+    """
+    Start recording phases into a new |Recorder| instance and return it.
+    If *callback* is not |None|, it is called with each |PhaseTiming| as
+    soon as that phase completes, e.g. to feed a metrics system.
+    """
+    global _recorder
+    _recorder = Recorder(callback)
+    return _recorder
+
+
+def disable():
+    """
+    Stop recording phases and return the |Recorder| that was active, or
+    |None| if recording was not enabled.
+    """
+    global _recorder
+    recorder, _recorder = _recorder, None
+    return recorder
+
+
+class recording(object):
+    """
+    Context manager that records phases for the duration of its block and
+    produces the |Recorder| as its target. The recorder active on entry, if
+    any, is restored on exit.
+    """
+    def __init__(self, callback=None):
+        self._callback = callback
+        self._outer = None
+
+    def __enter__(self):
+        self._outer = _recorder
+        return enable(self._callback)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        global _recorder
+        _recorder = self._outer
+
+
+def phase(name, partname=None):
+    """
+    Return a context manager timing the phase *name*, for *partname* when
+    the phase concerns a single part. Bytes processed are reported by
+    calling ``add_blob(blob)`` on the context manager within the block.
+    """
+    recorder = _recorder
+    if recorder is None:
+        return _null_phase
+    return _Phase(recorder, name, partname)
+
+
+class PhaseTiming(object):
+    """
+    Value object recording one completed phase.
+    """
+    __slots__ = ('name', 'partname', 'seconds', 'nbytes')
+
+    def __init__(self, name, partname, seconds, nbytes):
+        self.name = name
+        self.partname = partname
+        self.seconds = seconds
+        self.nbytes = nbytes
+
+    def __repr__(self):
+        return 'PhaseTiming(%r, %r, %r, %r)' % (
+            self.name, self.partname, self.seconds, self.nbytes
+        )
+
+
+class Recorder(object):
+    """
+    Accumulates the |PhaseTiming| of each phase completed while it is the
+    active recorder.
+    """
+    def __init__(self, callback=None):
+        super(Recorder, self).__init__()
+        self._callback = callback
+        self._lock = threading.Lock()
+        self._timings = []
+
+    def add(self, timing):
+        """
+        Record *timing*, a |PhaseTiming| instance.
+        """
+        with self._lock:
+            self._timings.append(timing)
+        if self._callback is not None:
+            self._callback(timing)
+
+    def counters(self, prefix='docx'):
+        """
+        Return a flat dict of counters for export to a metrics system, three
+        per phase name, e.g. ``docx.read.inflate.count``,
+        ``docx.read.inflate.seconds`` and ``docx.read.inflate.bytes``.
+        """
+        counters = {}
+        for name, totals in self.report()['phases'].items():
+            for key, value in totals.items():
+                counters['%s.%s.%s' % (prefix, name, key)] = value
+        return counters
+
+    def report(self):
+        """
+        Return a dict summarizing the recorded phases. Its ``phases`` item
+        maps each phase name to its total ``count``, ``seconds`` and
+        ``bytes``. Its ``parts`` item maps each partname to a dict of the
+        ``seconds`` and ``bytes`` of each phase concerning that part.
+        """
+        phases, parts = {}, {}
+        for timing in self.timings:
+            totals = phases.setdefault(
+                timing.name, {'count': 0, 'seconds': 0.0, 'bytes': 0}
+            )
+            totals['count'] += 1
+            totals['seconds'] += timing.seconds
+            totals['bytes'] += timing.nbytes
+            if timing.partname is None:
+                continue
+            part = parts.setdefault(str(timing.partname), {})
+            totals = part.setdefault(
+                timing.name, {'seconds': 0.0, 'bytes': 0}
+            )
+            totals['seconds'] += timing.seconds
+            totals['bytes'] += timing.nbytes
+        return {'phases': phases, 'parts': parts}
+
+    @property
+    def timings(self):
+        """
+        List of the |PhaseTiming| instances recorded so far, in order of
+        completion.
+        """
+        with self._lock:
+            return list(self._timings)
+
+
+class _Phase(object):
+    """
+    Context manager timing one phase into a |Recorder|.
+    """
+    __slots__ = ('_recorder', '_name', '_partname', '_nbytes', '_start')
+
+    def __init__(self, recorder, name, partname):
+        self._recorder = recorder
+        self._name = name
+        self._partname = partname
+        self._nbytes = 0
+
+    def __enter__(self):
+        self._start = default_timer()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        seconds = default_timer() - self._start
+        self._recorder.add(
+            PhaseTiming(self._name, self._partname, seconds, self._nbytes)
+        )
+
+    def add_blob(self, blob):
+        """
+        Add the length of *blob* to the bytes processed by this phase.
+        """
+        self._nbytes += len(blob)
+
+
+class _NullPhase(object):
+    """
+    Stands in for |_Phase| while recording is off, doing nothing.
+    """
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def add_blob(self, blob):
+        pass
+
+
+_null_phase = _NullPhase()
@@ -0,0 +1,172 @@
+# encoding: utf-8
+
+"""
+Mail merge through a |CompiledTemplate|, which finds the placeholders in
+a document once so that each merged copy of it costs little more than
+compressing its package.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import re
+import uuid
+
+from copy import deepcopy
+from io import BytesIO
+from xml.sax.saxutils import escape
+from zipfile import ZipFile
+
+from .compat import is_string, Unicode
+from .opc.oxml import serialize_part_xml
+from .opc.packuri import PackURI
+from .opc.phys_pkg import PhysPkgReader, PhysPkgWriter
+from .oxml.ns import qn
+from .oxml.text import TextMap
+
+
+class CompiledTemplate(object):
+    """
+    A document compiled for filling its placeholders with different values
+    many times over. A placeholder is text in the body of *document*
+    matching *pattern*, a regular expression whose first group, if it has
+    one, is the name of the placeholder; ``{{name}}`` by default. As for
+    :meth:`Document.replace`, a placeholder may span several runs, and its
+    value takes the formatting of the run it starts in.
+
+    *document* is serialized once, when the template is compiled. The XML
+    of its main document part is kept as the byte fragments between
+    placeholders and every other member of its package is kept as it is
+    stored, so :meth:`render` neither builds nor serializes any XML tree.
+    Changes made to *document* afterward do not affect the template.
+    """
+    def __init__(self, document, pattern=r'\{\{\s*(\w+)\s*\}\}'):
+        super(CompiledTemplate, self).__init__()
+        document_part = document._document_part
+        self._partname = document_part.partname
+        self._fragments, self._slots = self._compile_xml(
+            document_part._element, re.compile(pattern)
+        )
+        self._members = self._compile_members(document, self._partname)
+
+    def render(self, values, path_or_stream):
+        """
+        Write a copy of the template document to *path_or_stream*, either
+        a path (a string) or a writable file-like object, with each
+        placeholder replaced by the value *values* maps its name to. A value
+        that is not a string is converted to one. A tab or newline in
+        a value becomes a tab or line break in the document. Raises
+        |KeyError| if *values* has no value for a placeholder.
+        """
+        value_xml = dict(
+            (name, _value_xml(values[name])) for name in set(self._slots)
+        )
+        fragments = iter(self._fragments)
+        chunks = [next(fragments)]
+        for name, fragment in zip(self._slots, fragments):
+            chunks.append(value_xml[name])
+            chunks.append(fragment)
+        phys_writer = PhysPkgWriter(path_or_stream)
+        for member in self._members:
+            if member is None:
+                phys_writer.write(self._partname, b''.join(chunks))
+                continue
+            phys_writer.write_member(member)
+        phys_writer.close()
+
+    @property
+    def slots(self):
+        """
+        List of the names of the placeholders in this template in document
+        order, a name appearing once for each time its placeholder does.
+        """
+        return list(self._slots)
+
+    @staticmethod
+    def _compile_members(document, partname):
+        """
+        Return a list of the members of the package of *document*, each
+        ready to be written, in the order they are saved, with |None|
+        standing in for the main document part at *partname*.
+        """
+        stream = BytesIO()
+        document.save(stream)
+        membernames = ZipFile(stream).namelist()
+        phys_reader = PhysPkgReader(stream)
+        members = [
+            None if membername == partname.membername else
+            phys_reader.member_for(PackURI('/%s' % membername))
+            for membername in membernames
+        ]
+        phys_reader.close()
+        return members
+
+    @staticmethod
+    def _compile_xml(document_elm, regex):
+        """
+        Return a ``(fragments, slots)`` 2-tuple for the XML of a copy of
+        *document_elm* in which each match of *regex* is a placeholder.
+        *fragments* is the list of the serialized byte fragments between
+        placeholders, one more than there are placeholders, and *slots* the
+        list of the placeholder names in document order.
+        """
+        document_elm = deepcopy(document_elm)
+        marker = 'docx%s' % uuid.uuid4().hex
+        slots = []
+        for p in list(document_elm.iter(qn('w:p'))):
+            text_map = TextMap(p)
+            matches = list(regex.finditer(text_map.text))
+            first = len(slots)
+            slots.extend(
+                match.group(1) if regex.groups else match.group(0)
+                for match in matches
+            )
+            for idx in reversed(range(len(matches))):
+                match = matches[idx]
+                text_map.replace(
+                    match.start(), match.end(),
+                    '%s-%d-' % (marker, first + idx)
+                )
+        # a value is spliced in as is, so may have edge whitespace
+        for t in document_elm.iter(qn('w:t')):
+            if t.text and marker in t.text:
+                t.set(qn('xml:space'), 'preserve')
+        xml = serialize_part_xml(document_elm)
+        # a text box paragraph is visited after the paragraph it is nested
+        # in but serialized within it, so each fragment is matched up with
+        # its placeholder by the index in the marker rather than by order
+        split_xml = re.split(('%s-(\\d+)-' % marker).encode('ascii'), xml)
+        slots = [slots[int(idx)] for idx in split_xml[1::2]]
+        return split_xml[::2], slots
+
+
+_invalid_chars = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+
+_special_chars = re.compile('[\t\r\n]')
+
+
+def _special_char_xml(match):
+    """
+    Return the XML ending the ``<w:t>`` element a value is placed in at the
+    tab or line break character *match* matched, inserting the equivalent
+    run content element, and starting a new one.
+    """
+    element = '<w:tab/>' if match.group() == '\t' else '<w:br/>'
+    return '</w:t>%s<w:t xml:space="preserve">' % element
+
+
+def _value_xml(value):
+    """
+    Return the UTF-8 encoded XML of *value* as placed in a ``<w:t>``
+    element. Raises |ValueError| if *value* contains a character XML does
+    not allow, such as a control character, as assigning it to the text of
+    an element does.
+    """
+    if not is_string(value):
+        value = Unicode(value)
+    if _invalid_chars.search(value):
+        raise ValueError(
+            'All strings must be XML compatible: Unicode or ASCII, no NULL '
+            'bytes or control characters'
+        )
+    xml = _special_chars.sub(_special_char_xml, escape(value))
+    return xml.encode('utf-8')
@@ -57,6 +57,15 @@ def serialize_part_xml(part_elm):
     return etree.tostring(part_elm, encoding='UTF-8', standalone=True)
 
 
+def serialize_canonical_xml(part_elm):
+    """
+    Serialize *part_elm* etree element to Canonical XML (C14N), such that
+    two elements differing only in insignificant ways, such as attribute
+    order or where namespaces are declared, produce the same bytes.
+    """
+    return etree.tostring(part_elm, method='c14n')
+
+
 def serialize_for_reading(element):
     """
     Serialize *element* to human-readable XML suitable for tests. No XML
@@ -7,11 +7,20 @@ writing presentations to and from a .pptx file.
 
 from __future__ import absolute_import, print_function, unicode_literals
 
-from .compat import cls_method_fn
+import os
+
+from lxml import etree
+from zipfile import is_zipfile
+
+from ..instrumentation import phase
+from .compat import cls_method_fn, is_string, replace_file
 from .constants import RELATIONSHIP_TYPE as RT
-from .oxml import CT_Relationships, serialize_part_xml
-from ..oxml import parse_xml
+from .oxml import (
+    CT_Relationships, serialize_canonical_xml, serialize_part_xml
+)
+from ..oxml import parse_xml, parse_xml_chunks, xml_change_count
 from .packuri import PACKAGE_URI, PackURI
+from .phys_pkg import BlobReference
 from .pkgreader import PackageReader
 from .pkgwriter import PackageWriter
 from .shared import lazyproperty
@@ -25,6 +34,8 @@ class OpcPackage(object):
     """
     def __init__(self):
         super(OpcPackage, self).__init__()
+        self._source_path = None
+        self._part_index = None
 
     def after_unmarshal(self):
         """
@@ -35,13 +46,32 @@ class OpcPackage(object):
         # subclass
         pass
 
+    def content_digest(self):
+        """
+        Return the SHA1 hex digest of the content of this package, covering
+        the partname, content type and :meth:`Part.digest` of each part and
+        all relationships. Packages differing only in how they are stored,
+        such as zip member order, timestamps or compression, have the same
+        digest.
+        """
+        import hashlib  # deferred, loads OpenSSL
+        sha1 = hashlib.sha1(self.rels.xml)
+        for part in sorted(self.parts, key=lambda part: part.partname):
+            sha1.update(b'\0'.join((
+                part.partname.encode('utf-8'),
+                part.content_type.encode('utf-8'),
+                part.digest().encode('ascii'),
+                part.rels.xml if len(part.rels) else b'',
+            )))
+        return sha1.hexdigest()
+
     def iter_rels(self):
         """
         Generate exactly one reference to each relationship in the package by
         performing a depth-first traversal of the rels graph.
         """
         def walk_rels(source, visited=None):
-            visited = [] if visited is None else visited
+            visited = set() if visited is None else visited
             for rel in source.rels.values():
                 yield rel
                 if rel.is_external:
@@ -49,7 +79,7 @@ class OpcPackage(object):
                 part = rel.target_part
                 if part in visited:
                     continue
-                visited.append(part)
+                visited.add(part)
                 new_source = part
                 for rel in walk_rels(new_source, visited):
                     yield rel
@@ -62,14 +92,14 @@ class OpcPackage(object):
         Generate exactly one reference to each of the parts in the package by
         performing a depth-first traversal of the rels graph.
         """
-        def walk_parts(source, visited=list()):
+        def walk_parts(source, visited=set()):
             for rel in source.rels.values():
                 if rel.is_external:
                     continue
                 part = rel.target_part
                 if part in visited:
                     continue
-                visited.append(part)
+                visited.add(part)
                 yield part
                 new_source = part
                 for part in walk_parts(new_source, visited):
@@ -78,6 +108,15 @@ class OpcPackage(object):
         for part in walk_parts(self):
             yield part
 
+    def index_parts(self, parts):
+        """
+        Index *parts*, all the parts in this package, by partname and content
+        type. Intended for use at the end of loading from a serialized
+        package, when the parts are already at hand. Otherwise the index is
+        built from the rels graph on first use.
+        """
+        self._part_index = _PartIndex(parts)
+
     def load_rel(self, reltype, target, rId, is_external=False):
         """
         Return newly added |_Relationship| instance of *reltype* between this
@@ -100,14 +139,24 @@ class OpcPackage(object):
         return self.part_related_by(RT.OFFICE_DOCUMENT)
 
     @classmethod
-    def open(cls, pkg_file):
+    def open(cls, pkg_file, use_mmap=False, blob_threshold=None):
         """
         Return an |OpcPackage| instance loaded with the contents of
-        *pkg_file*.
-        """
-        pkg_reader = PackageReader.from_file(pkg_file)
+        *pkg_file*. If *use_mmap* is |True| and *pkg_file* is a path, the
+        file is memory-mapped rather than read into memory member by member.
+        If *blob_threshold* is not |None|, binary parts larger than that many
+        bytes, such as media, are not held in memory. Their blobs are read
+        back from *pkg_file* when it is a path, or else from a temporary file
+        they are spilled to, only when needed. Saving streams them through
+        chunk by chunk.
+        """
+        pkg_reader = PackageReader.from_file(
+            pkg_file, use_mmap, blob_threshold
+        )
         package = cls()
         Unmarshaller.unmarshal(pkg_reader, package, PartFactory)
+        if is_string(pkg_file):
+            package._source_path = os.path.abspath(pkg_file)
         return package
 
     def part_related_by(self, reltype):
@@ -118,6 +167,20 @@ class OpcPackage(object):
         """
         return self.rels.part_with_reltype(reltype)
 
+    def part_with_partname(self, partname):
+        """
+        Return the part in this package having *partname*, raising
+        |KeyError| if there is none.
+        """
+        return self._index.part_with_partname(partname)
+
+    def parts_with_content_type(self, content_type):
+        """
+        Return a list of the parts in this package having *content_type*,
+        in the order they were added. The list is empty if there are none.
+        """
+        return self._index.parts_with_content_type(content_type)
+
     @property
     def parts(self):
         """
@@ -132,6 +195,7 @@ class OpcPackage(object):
         relationship if there is one, otherwise a newly created one.
         """
         rel = self.rels.get_or_add(reltype, part)
+        self._index_related_part(part)
         return rel.rId
 
     @lazyproperty
@@ -142,14 +206,159 @@ class OpcPackage(object):
         """
         return Relationships(PACKAGE_URI.baseURI)
 
-    def save(self, pkg_file):
+    def save(self, pkg_file, workers=None, incremental=False, format='zip',
+             deterministic=False):
         """
         Save this package to *pkg_file*, where *file* can be either a path to
-        a file (a string) or a file-like object.
+        a file (a string) or a file-like object. If *workers* is a positive
+        integer, parts are serialized on that many threads. If *incremental*
+        is |True|, the member of each part not dirty since the package was
+        opened is copied from the original file, keeping the compression it
+        has there, without the part being serialized. *pkg_file* may then
+        be the
+        path the package was opened from, in which case that file is
+        replaced only once the new one has been completely written. Raises
+        |ValueError| if *incremental* is |True| and the package was not
+        opened from a path to a zip file. If *format* is ``'dir'``, the
+        package is written uncompressed into the directory at path
+        *pkg_file*, which is created if it doesn't exist, in the same layout
+        :meth:`open` accepts. A zip file saved over the one this package was
+        opened from replaces it only once completely written, since blobs
+        may still be read from it meanwhile. If *deterministic* is |True|,
+        the zip file is written with fixed member timestamps and with parts
+        in partname order, so saving the same content always produces the
+        same bytes.
+        It cannot be combined with *incremental*, whose reused members come
+        from a file written by whatever produced it.
+        """
+        if format == 'dir':
+            if not is_string(pkg_file) or incremental:
+                raise ValueError(
+                    "format='dir' requires a path and is not incremental"
+                )
+            if not os.path.isdir(pkg_file):
+                os.makedirs(pkg_file)
+        elif format != 'zip':
+            raise ValueError("format must be 'zip' or 'dir', got %r" % format)
+        if incremental and deterministic:
+            raise ValueError('a deterministic save cannot be incremental')
+        with phase('save.before_marshal'):
+            for part in self.parts:
+                part.before_marshal()
+        if incremental:
+            self._save_incrementally(pkg_file, workers)
+            return
+        if self._is_source_file(pkg_file):
+            self._replace_source_file(workers, deterministic=deterministic)
+            return
+        PackageWriter.write(
+            pkg_file, self.rels, self.parts, workers,
+            deterministic=deterministic
+        )
+
+    @property
+    def _index(self):
+        """
+        The |_PartIndex| for this package, built from the rels graph if it
+        doesn't already exist.
+        """
+        if self._part_index is None:
+            self._part_index = _PartIndex(self.iter_parts())
+        return self._part_index
+
+    def _index_related_part(self, part):
+        """
+        Add *part*, newly the target of a relationship, to the part index,
+        along with any parts reachable from it that are not already there.
+        Does nothing when the index has not been built yet.
+        """
+        index = self._part_index
+        if index is None:
+            return
+        # parts already indexed have had everything they reach indexed too
+        unindexed = [part]
+        while unindexed:
+            part = unindexed.pop()
+            if part in index:
+                continue
+            index.add(part)
+            unindexed.extend(
+                rel.target_part for rel in part.rels.values()
+                if not rel.is_external
+            )
+
+    def _invalidate_part_index(self):
+        """
+        Discard the part index, to be rebuilt from the rels graph on next
+        use. Called when a relationship is dropped, since that can leave any
+        number of parts unreachable and so no longer in the package.
         """
-        for part in self.parts:
-            part.before_marshal()
-        PackageWriter.write(pkg_file, self.rels, self.parts)
+        self._part_index = None
+
+    def _is_source_file(self, pkg_file):
+        """
+        Return |True| if *pkg_file* is the path of the zip file this package
+        was opened from.
+        """
+        source = self._source_path
+        if source is None or not is_string(pkg_file):
+            return False
+        if os.path.abspath(pkg_file) != source:
+            return False
+        return not os.path.isdir(source)
+
+    def _reindex_part(self, part, old_partname):
+        """
+        Update the part index for *part* having been renamed from
+        *old_partname*.
+        """
+        if self._part_index is not None:
+            self._part_index.rename(part, old_partname)
+
+    def _replace_source_file(self, workers, source=None, deterministic=False):
+        """
+        Save this package over the zip file it was opened from, writing to
+        a temporary file alongside it first and replacing it only once the
+        new one has been completely written. Parts may read members of the
+        original file while the new one is being written, whether to reuse
+        them when *source* is its path or for a blob loaded as
+        a |BlobReference|.
+        """
+        # deferred, tempfile is costly to import and only needed here
+        import tempfile
+
+        fd, tmp_path = tempfile.mkstemp(
+            suffix='.tmp', dir=os.path.dirname(self._source_path)
+        )
+        os.close(fd)
+        replaced = False
+        try:
+            PackageWriter.write(
+                tmp_path, self.rels, self.parts, workers, source,
+                deterministic=deterministic
+            )
+            replace_file(tmp_path, self._source_path)
+            replaced = True
+        finally:
+            if not replaced:
+                os.remove(tmp_path)
+
+    def _save_incrementally(self, pkg_file, workers):
+        """
+        Save this package to *pkg_file*, reusing the unchanged members of the
+        zip file it was opened from, writing to a temporary file alongside
+        that file first when *pkg_file* is the same path.
+        """
+        source = self._source_path
+        if source is None or not is_zipfile(source):
+            raise ValueError(
+                'incremental save requires a package opened from a path to '
+                'a zip file'
+            )
+        if self._is_source_file(pkg_file):
+            self._replace_source_file(workers, source)
+            return
+        PackageWriter.write(pkg_file, self.rels, self.parts, workers, source)
 
 
 class Part(object):
@@ -164,6 +373,8 @@ class Part(object):
         self._content_type = content_type
         self._blob = blob
         self._package = package
+        self._digest = None
+        self._loaded_partname = None
 
     def after_unmarshal(self):
         """
@@ -190,9 +401,13 @@ class Part(object):
         """
         Contents of this package part as a sequence of bytes. May be text or
         binary. Intended to be overridden by subclasses. Default behavior is
-        to return load blob.
+        to return load blob, read back in full on each access when it was
+        loaded as a |BlobReference|.
         """
-        return self._blob
+        blob = self._blob
+        if isinstance(blob, BlobReference):
+            return blob.read()
+        return blob
 
     @property
     def content_type(self):
@@ -201,6 +416,38 @@ class Part(object):
         """
         return self._content_type
 
+    def digest(self):
+        """
+        Return the SHA1 hex digest of the content of this part. The content
+        of a part having an XML content type, such as a header not loaded as
+        an |XmlPart|, is canonicalized first, so it has the same digest as
+        it would as an |XmlPart|. The content of this part never changes
+        once it is loaded, so its digest is computed only once.
+        """
+        if self._digest is None:
+            import hashlib  # deferred, loads OpenSSL
+            blob = self._blob
+            if _is_xml_content_type(self._content_type):
+                sha1 = hashlib.sha1(_canonical_xml(self.blob))
+            elif isinstance(blob, BlobReference):
+                sha1 = hashlib.sha1()
+                for chunk in blob.iter_chunks():
+                    sha1.update(chunk)
+            else:
+                sha1 = hashlib.sha1(self.blob)
+            self._digest = sha1.hexdigest()
+        return self._digest
+
+    @property
+    def is_dirty(self):
+        """
+        |False| if this part was loaded from a package and still has the
+        partname it had there, so its member in that package can be copied
+        as it is. The blob of a part never changes once it is loaded, but
+        |XmlPart| overrides this, its XML being open to change in place.
+        """
+        return self._partname != self._loaded_partname
+
     def drop_rel(self, rId):
         """
         Remove the relationship identified by *rId* if its reference count
@@ -209,6 +456,8 @@ class Part(object):
         """
         if self._rel_ref_count(rId) < 2:
             del self.rels[rId]
+            if self._package is not None:
+                self._package._invalidate_part_index()
 
     @classmethod
     def load(cls, partname, content_type, blob, package):
@@ -238,7 +487,9 @@ class Part(object):
         if not isinstance(partname, PackURI):
             tmpl = "partname must be instance of PackURI, got '%s'"
             raise TypeError(tmpl % type(partname).__name__)
-        self._partname = partname
+        old_partname, self._partname = self._partname, partname
+        if self._package is not None:
+            self._package._reindex_part(self, old_partname)
 
     @property
     def package(self):
@@ -265,6 +516,8 @@ class Part(object):
             return self.rels.get_or_add_ext_rel(reltype, target)
         else:
             rel = self.rels.get_or_add(reltype, target)
+            if self._package is not None:
+                self._package._index_related_part(target)
             return rel.rId
 
     @property
@@ -312,14 +565,47 @@ class XmlPart(Part):
             partname, content_type, package=package
         )
         self._element = element
+        self._digest_change_count = None
 
     @property
     def blob(self):
         return serialize_part_xml(self._element)
 
+    def digest(self):
+        """
+        Return the SHA1 hex digest of the canonicalized XML of this part.
+        The XML can be changed in place through any object holding one of
+        its elements without this part being told, so the digest is cached
+        along with the count of changes made to any element tree (see
+        :func:`.xml_change_count`), and is computed afresh only once another
+        change has been made.
+        """
+        change_count = xml_change_count()
+        if change_count != self._digest_change_count:
+            import hashlib  # deferred, loads OpenSSL
+            self._digest = hashlib.sha1(
+                serialize_canonical_xml(self._element)
+            ).hexdigest()
+            self._digest_change_count = change_count
+        return self._digest
+
+    @property
+    def is_dirty(self):
+        """
+        Always |True|, since the XML of this part can be changed in place
+        through any object holding one of its elements without this part
+        being told.
+        """
+        return True
+
     @classmethod
     def load(cls, partname, content_type, blob, package):
-        element = parse_xml(blob)
+        with phase('parse', partname) as p:
+            p.add_blob(blob)
+            if isinstance(blob, BlobReference):
+                element = parse_xml_chunks(blob.iter_chunks())
+            else:
+                element = parse_xml(blob)
         return cls(partname, content_type, element, package)
 
     @property
@@ -373,11 +659,30 @@ class PartFactory(object):
 class Relationships(dict):
     """
     Collection object for |_Relationship| instances, having list semantics.
+    Relationships are indexed by target as well as by rId, so finding the
+    relationship to a given target, as :meth:`get_or_add` does, takes
+    constant time however many relationships there are.
     """
     def __init__(self, baseURI):
         super(Relationships, self).__init__()
         self._baseURI = baseURI
         self._target_parts_by_rId = {}
+        self._rels_by_target = {}
+        # every rId of the form 'rId9' numbered below this one is in use
+        self._rId_floor = 1
+
+    def __delitem__(self, rId):
+        self._unindex(self[rId])
+        super(Relationships, self).__delitem__(rId)
+        self._target_parts_by_rId.pop(rId, None)
+        if is_string(rId) and rId.startswith('rId') and rId[3:].isdigit():
+            self._rId_floor = min(self._rId_floor, int(rId[3:]))
+
+    def __setitem__(self, rId, rel):
+        if rId in self:
+            self._unindex(self[rId])
+        super(Relationships, self).__setitem__(rId, rel)
+        self._rels_by_target.setdefault(_target_key(rel), rel)
 
     def add_relationship(self, reltype, target, rId, is_external=False):
         """
@@ -434,10 +739,13 @@ class Relationships(dict):
     def xml(self):
         """
         Serialize this relationship collection into XML suitable for storage
-        as a .rels file in an OPC package.
+        as a .rels file in an OPC package. Relationships appear in rId order,
+        numerically for rIds like 'rId9', so the XML depends only on the
+        relationships and not on the order they were added in.
         """
         rels_elm = CT_Relationships.new()
-        for rel in self.values():
+        for rId in sorted(self, key=_rId_sort_key):
+            rel = self[rId]
             rels_elm.add_rel(
                 rel.rId, rel.reltype, rel.target_ref, rel.is_external
             )
@@ -448,20 +756,7 @@ class Relationships(dict):
         Return relationship of matching *reltype*, *target*, and
         *is_external* from collection, or None if not found.
         """
-        def matches(rel, reltype, target, is_external):
-            if rel.reltype != reltype:
-                return False
-            if rel.is_external != is_external:
-                return False
-            rel_target = rel.target_ref if rel.is_external else rel.target_part
-            if rel_target != target:
-                return False
-            return True
-
-        for rel in self.values():
-            if matches(rel, reltype, target, is_external):
-                return rel
-        return None
+        return self._rels_by_target.get((reltype, is_external, target))
 
     def _get_rel_of_type(self, reltype):
         """
@@ -484,11 +779,119 @@ class Relationships(dict):
         Next available rId in collection, starting from 'rId1' and making use
         of any gaps in numbering, e.g. 'rId2' for rIds ['rId1', 'rId3'].
         """
-        for n in range(1, len(self)+2):
+        for n in range(self._rId_floor, len(self)+2):
             rId_candidate = 'rId%d' % n  # like 'rId19'
             if rId_candidate not in self:
+                self._rId_floor = n
                 return rId_candidate
 
+    def _unindex(self, rel):
+        """
+        Remove *rel*, about to be removed from this collection, from the
+        index by target, indexing instead any other relationship having the
+        same target.
+        """
+        key = _target_key(rel)
+        if self._rels_by_target.get(key) is not rel:
+            return
+        del self._rels_by_target[key]
+        for other in self.values():
+            if other is not rel and _target_key(other) == key:
+                self._rels_by_target[key] = other
+                return
+
+
+class _PartIndex(object):
+    """
+    Index of the parts in a package by partname and by content type, kept
+    current by the package as parts are related, renamed and dropped.
+    """
+    def __init__(self, parts):
+        super(_PartIndex, self).__init__()
+        self._parts_by_partname = {}
+        self._parts_by_content_type = {}
+        for part in parts:
+            self.add(part)
+
+    def __contains__(self, part):
+        return self._parts_by_partname.get(part.partname) is part
+
+    def add(self, part):
+        """
+        Add *part* to the index.
+        """
+        self._parts_by_partname[part.partname] = part
+        self._parts_by_content_type.setdefault(
+            part.content_type, []
+        ).append(part)
+
+    def part_with_partname(self, partname):
+        """
+        Return the indexed part having *partname*, raising |KeyError| if
+        there is none.
+        """
+        return self._parts_by_partname[partname]
+
+    def parts_with_content_type(self, content_type):
+        """
+        Return a new list of the indexed parts having *content_type*.
+        """
+        return list(self._parts_by_content_type.get(content_type, ()))
+
+    def rename(self, part, old_partname):
+        """
+        Re-key *part* in the index, its partname having changed from
+        *old_partname*.
+        """
+        if self._parts_by_partname.get(old_partname) is not part:
+            return
+        del self._parts_by_partname[old_partname]
+        self._parts_by_partname[part.partname] = part
+
+
+def _canonical_xml(blob):
+    """
+    Return *blob*, the content of an XML part, as canonical XML, parsed the
+    same way as the XML of an |XmlPart|. *blob* itself is returned if it is
+    not well-formed XML.
+    """
+    try:
+        element = parse_xml(bytes(blob))
+    except etree.XMLSyntaxError:
+        return blob
+    return serialize_canonical_xml(element)
+
+
+def _is_xml_content_type(content_type):
+    """
+    Return |True| if *content_type* is that of XML content, such as
+    ``'application/xml'`` or any ``'...+xml'`` type.
+    """
+    if content_type is None:
+        return False
+    return content_type in ('application/xml', 'text/xml') or (
+        content_type.endswith('+xml')
+    )
+
+
+def _target_key(rel):
+    """
+    Return the key under which |Relationships| indexes *rel* by target.
+    """
+    target = rel.target_ref if rel.is_external else rel.target_part
+    return (rel.reltype, rel.is_external, target)
+
+
+def _rId_sort_key(rId):
+    """
+    Return a sort key placing rIds of the usual form 'rId9' in numeric order,
+    ahead of any others, which sort as strings.
+    """
+    digits = rId[3:]
+    if rId.startswith('rId') and digits.isdigit():
+        return (0, int(digits), rId)
+    return (1, 0, rId)
+
 
 class Unmarshaller(object):
     """
@@ -502,13 +905,19 @@ class Unmarshaller(object):
         contents of *pkg_reader*, delegating construction of each part to
         *part_factory*. Package relationships are added to *pkg*.
         """
-        parts = Unmarshaller._unmarshal_parts(
-            pkg_reader, package, part_factory
-        )
-        Unmarshaller._unmarshal_relationships(pkg_reader, package, parts)
-        for part in parts.values():
-            part.after_unmarshal()
-        package.after_unmarshal()
+        with phase('unmarshal'):
+            parts = Unmarshaller._unmarshal_parts(
+                pkg_reader, package, part_factory
+            )
+            with phase('unmarshal.rels'):
+                Unmarshaller._unmarshal_relationships(
+                    pkg_reader, package, parts
+                )
+            package.index_parts(parts.values())
+            with phase('unmarshal.after_unmarshal'):
+                for part in parts.values():
+                    part.after_unmarshal()
+                package.after_unmarshal()
 
     @staticmethod
     def _unmarshal_parts(pkg_reader, package, part_factory):
@@ -519,9 +928,12 @@ class Unmarshaller(object):
         """
         parts = {}
         for partname, content_type, reltype, blob in pkg_reader.iter_sparts():
-            parts[partname] = part_factory(
-                partname, content_type, reltype, blob, package
-            )
+            with phase('unmarshal.part', partname):
+                part = part_factory(
+                    partname, content_type, reltype, blob, package
+                )
+            part._loaded_partname = partname
+            parts[partname] = part
         return parts
 
     @staticmethod
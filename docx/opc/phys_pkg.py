@@ -6,15 +6,34 @@ Provides a general interface to a *physical* OPC package, such as a zip file.
 
 from __future__ import absolute_import
 
+import mmap
 import os
+import struct
+import sys
+import time
+import zlib
 
-from zipfile import ZipFile, is_zipfile, ZIP_DEFLATED
+from contextlib import contextmanager
+from copy import copy
+from zipfile import ZipFile, ZipInfo, is_zipfile, ZIP_DEFLATED, ZIP_STORED
 
 from .compat import is_string
 from .exceptions import PackageNotFoundError
 from .packuri import CONTENT_TYPES_URI
 
 
+# timestamp of every member of a deterministic zip package, the earliest
+# a zip file header can represent
+DETERMINISTIC_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+# size of each chunk a |BlobReference| is read in when streamed
+BLOB_CHUNK_SIZE = 1024 * 1024
+
+# zip local file header: signature, version, flags, method, time, date, crc,
+# compressed size, uncompressed size, filename length, extra length
+_local_header = struct.Struct('<4s5H3L2H')
+
+
 class PhysPkgReader(object):
     """
     Factory for physical package reader objects.
@@ -40,8 +59,13 @@ class PhysPkgWriter(object):
     """
     Factory for physical package writer objects.
     """
-    def __new__(cls, pkg_file):
-        return super(PhysPkgWriter, cls).__new__(_ZipPkgWriter)
+    def __new__(cls, pkg_file, deterministic=False):
+        # a path to an existing directory receives an expanded package
+        if is_string(pkg_file) and os.path.isdir(pkg_file):
+            writer_cls = _DirPkgWriter
+        else:
+            writer_cls = _ZipPkgWriter
+        return super(PhysPkgWriter, cls).__new__(writer_cls)
 
 
 class _DirPkgReader(PhysPkgReader):
@@ -66,6 +90,14 @@ class _DirPkgReader(PhysPkgReader):
             blob = f.read()
         return blob
 
+    def blob_reference_for(self, pack_uri):
+        """
+        Return a |BlobReference| to the file corresponding to *pack_uri* in
+        the package directory, read only when the blob is needed.
+        """
+        path = os.path.join(self._path, pack_uri.membername)
+        return _FileBlob(path, os.path.getsize(path))
+
     def close(self):
         """
         Provides interface consistency with |ZipFileSystem|, but does
@@ -80,6 +112,12 @@ class _DirPkgReader(PhysPkgReader):
         """
         return self.blob_for(CONTENT_TYPES_URI)
 
+    def member_size(self, pack_uri):
+        """
+        Return the size in bytes of the file corresponding to *pack_uri*.
+        """
+        return os.path.getsize(os.path.join(self._path, pack_uri.membername))
+
     def rels_xml_for(self, source_uri):
         """
         Return rels item XML for source with *source_uri*, or None if the
@@ -92,6 +130,63 @@ class _DirPkgReader(PhysPkgReader):
         return rels_xml
 
 
+class _DirPkgWriter(PhysPkgWriter):
+    """
+    Implements |PhysPkgWriter| interface for an OPC package expanded into a
+    directory, each member written uncompressed to its own file.
+    """
+    def __init__(self, path, deterministic=False):
+        """
+        *path* is the path to an existing directory to receive the package.
+        The files written carry no timestamps of their own, so their content
+        is deterministic either way.
+        """
+        super(_DirPkgWriter, self).__init__()
+        self._path = os.path.abspath(path)
+
+    def close(self):
+        """
+        Provides interface consistency with |_ZipPkgWriter|, but does
+        nothing, each member file is closed as soon as it is written.
+        """
+        pass
+
+    @staticmethod
+    def prepare_member(pack_uri, blob):
+        """
+        Return a (pack_uri, blob) 2-tuple for :meth:`write_member`. No
+        compression is involved, so there is nothing to prepare.
+        """
+        return (pack_uri, blob)
+
+    def write(self, pack_uri, blob):
+        """
+        Write *blob* to the file corresponding to *pack_uri* in the package
+        directory, creating intermediate directories as required. A
+        |BlobReference| is copied chunk by chunk.
+        """
+        path = os.path.join(self._path, pack_uri.membername)
+        if isinstance(blob, _FileBlob) and blob.path == path:
+            return  # saving in place, the file is already there
+        dirname = os.path.dirname(path)
+        if not os.path.isdir(dirname):
+            os.makedirs(dirname)
+        with open(path, 'wb') as f:
+            if isinstance(blob, BlobReference):
+                for chunk in blob.iter_chunks():
+                    f.write(chunk)
+                return
+            f.write(blob)
+
+    def write_member(self, member):
+        """
+        Write *member*, a (pack_uri, blob) 2-tuple produced by
+        :meth:`prepare_member`, to the package directory.
+        """
+        pack_uri, blob = member
+        self.write(pack_uri, blob)
+
+
 class _ZipPkgReader(PhysPkgReader):
     """
     Implements |PhysPkgReader| interface for a zip file OPC package.
@@ -99,6 +194,9 @@ class _ZipPkgReader(PhysPkgReader):
     def __init__(self, pkg_file):
         super(_ZipPkgReader, self).__init__()
         self._zipf = ZipFile(pkg_file, 'r')
+        self._path = None
+        if is_string(pkg_file):
+            self._path = os.path.abspath(pkg_file)
 
     def blob_for(self, pack_uri):
         """
@@ -107,12 +205,48 @@ class _ZipPkgReader(PhysPkgReader):
         """
         return self._zipf.read(pack_uri.membername)
 
+    def blob_reference_for(self, pack_uri):
+        """
+        Return a |BlobReference| to the member corresponding to *pack_uri*.
+        When the package was read from a path, the member is read from that
+        file again only when the blob is needed. Otherwise it is inflated now
+        into a temporary file, chunk by chunk.
+        """
+        zinfo = self._zipf.getinfo(pack_uri.membername)
+        if self._path is not None:
+            return _ZipMemberBlob(self._path, zinfo)
+        with self._zipf.open(zinfo) as f:
+            return _SpilledBlob.spill(f, zinfo.file_size)
+
     def close(self):
         """
         Close the zip archive, releasing any resources it is using.
         """
         self._zipf.close()
 
+    def member_for(self, pack_uri):
+        """
+        Return a |_ZipMember| instance holding the content of the member
+        corresponding to *pack_uri* along with a copy of its header, so it
+        can be written to another package stored the same way. When the
+        package was read from a path, the content is a |BlobReference| read
+        from that file only as the member is written. Raises |KeyError| if
+        no matching member is present in zip archive.
+        """
+        zinfo = copy(self._zipf.getinfo(pack_uri.membername))
+        # sizes and CRC are known, so no data descriptor follows the data
+        zinfo.flag_bits &= ~0x08
+        if self._path is not None:
+            return _ZipMember(zinfo, self.blob_reference_for(pack_uri))
+        return _ZipMember(zinfo, self.blob_for(pack_uri))
+
+    def member_size(self, pack_uri):
+        """
+        Return the uncompressed size in bytes of the member corresponding to
+        *pack_uri*.
+        """
+        return self._zipf.getinfo(pack_uri.membername).file_size
+
     @property
     def content_types_xml(self):
         """
@@ -132,13 +266,102 @@ class _ZipPkgReader(PhysPkgReader):
         return rels_xml
 
 
+class _MmapZipPkgReader(_ZipPkgReader):
+    """
+    Implements |PhysPkgReader| interface for a zip file OPC package at a
+    filesystem path, reading members directly out of a read-only memory map
+    of the file. The blob of a STORED member is a zero-copy |memoryview| of
+    the mapping and the blob of a DEFLATED member is inflated straight from
+    the mapping, without first reading its compressed bytes into a copy.
+    """
+    def __new__(cls, path):
+        return object.__new__(cls)
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        super(_MmapZipPkgReader, self).__init__(self._mmap)
+        self._path = os.path.abspath(path)
+
+    def blob_for(self, pack_uri):
+        """
+        Return blob corresponding to *pack_uri*, a |memoryview| into the
+        mapped file when the member is stored uncompressed. Raises |KeyError|
+        if no matching member is present in zip archive.
+        """
+        zinfo = self._zipf.getinfo(pack_uri.membername)
+        encrypted = zinfo.flag_bits & 0x1
+        if encrypted or zinfo.compress_type not in (ZIP_STORED, ZIP_DEFLATED):
+            return self._zipf.read(zinfo)
+        data = self._member_data(zinfo)
+        if zinfo.compress_type == ZIP_STORED:
+            return data
+        return zlib.decompress(data, -15, zinfo.file_size or 1)
+
+    def blob_reference_for(self, pack_uri):
+        """
+        Return a |BlobReference| to the member corresponding to *pack_uri*,
+        read straight out of the mapped file, and inflated chunk by chunk
+        when it is compressed, each time it is read.
+        """
+        zinfo = self._zipf.getinfo(pack_uri.membername)
+        encrypted = zinfo.flag_bits & 0x1
+        if encrypted or zinfo.compress_type not in (ZIP_STORED, ZIP_DEFLATED):
+            return super(_MmapZipPkgReader, self).blob_reference_for(pack_uri)
+        return _MappedMemberBlob(self._member_data(zinfo), zinfo)
+
+    @staticmethod
+    def can_map(pkg_file):
+        """
+        Return |True| if *pkg_file* is a path to a zip file that can be read
+        by this class, as opposed to a stream or an expanded directory.
+        Before Python 3, a memory map can neither be viewed by |memoryview|
+        nor read by ``ZipFile``, so this is always |False| there.
+        """
+        if sys.version_info < (3, 0):
+            return False
+        if not is_string(pkg_file) or os.path.isdir(pkg_file):
+            return False
+        return is_zipfile(pkg_file)
+
+    def close(self):
+        """
+        Close the zip archive and the mapping of its file. A mapping still
+        viewed by a blob can't be closed, so |memoryview| blobs remain valid
+        after this call; the file is then unmapped once the last of them is
+        garbage collected.
+        """
+        self._zipf.close()
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+
+    def _member_data(self, zinfo):
+        """
+        Return a |memoryview| of the mapped file spanning the stored bytes of
+        the member described by *zinfo*.
+        """
+        offset = zinfo.header_offset
+        fields = _local_header.unpack_from(self._mmap, offset)
+        filename_len, extra_len = fields[9], fields[10]
+        start = offset + _local_header.size + filename_len + extra_len
+        return memoryview(self._mmap)[start:start+zinfo.compress_size]
+
+
 class _ZipPkgWriter(PhysPkgWriter):
     """
     Implements |PhysPkgWriter| interface for a zip file OPC package.
     """
-    def __init__(self, pkg_file):
+    def __init__(self, pkg_file, deterministic=False):
+        """
+        If *deterministic* is |True|, every member is given the fixed
+        timestamp ``DETERMINISTIC_DATE_TIME`` rather than the current time.
+        """
         super(_ZipPkgWriter, self).__init__()
         self._zipf = ZipFile(pkg_file, 'w', compression=ZIP_DEFLATED)
+        self._source = None
+        self._date_time = DETERMINISTIC_DATE_TIME if deterministic else None
 
     def close(self):
         """
@@ -146,10 +369,283 @@ class _ZipPkgWriter(PhysPkgWriter):
         releasing any resources it's using.
         """
         self._zipf.close()
+        if self._source is not None:
+            self._source.close()
+
+    def prepare_member(self, pack_uri, blob):
+        """
+        Return a |_ZipMember| instance for writing *blob* under the
+        membername corresponding to *pack_uri*. Does not touch the archive,
+        so it is safe to call from a worker thread while other members are
+        being written.
+        """
+        zinfo = _ZipMember.new_zinfo(pack_uri.membername, self._date_time)
+        return _ZipMember(zinfo, blob)
+
+    def reuse_members_from(self, path):
+        """
+        Make the zip package at *path* the source of the members returned
+        by :meth:`source_member`.
+        """
+        if _MmapZipPkgReader.can_map(path):
+            self._source = _MmapZipPkgReader(path)
+        else:
+            self._source = _ZipPkgReader(path)
+
+    def source_member(self, pack_uri):
+        """
+        Return the |_ZipMember| stored under *pack_uri* in the source package
+        set by :meth:`reuse_members_from`, for copying to this package with
+        the compression it has there. Safe to call from a worker thread.
+        Raises |KeyError| if the source package has no such member.
+        """
+        return self._source.member_for(pack_uri)
 
     def write(self, pack_uri, blob):
         """
         Write *blob* to this zip package with the membername corresponding to
-        *pack_uri*.
+        *pack_uri*. A |BlobReference| is compressed and written chunk by
+        chunk.
+        """
+        self.write_member(self.prepare_member(pack_uri, blob))
+
+    def write_member(self, member):
+        """
+        Write *member*, a |_ZipMember| instance, to this zip package,
+        compressed as its header specifies. A |BlobReference| is compressed
+        and written chunk by chunk. *member* itself is left unchanged, so the
+        same member can be written to any number of packages. Before Python
+        3.6, ``ZipFile`` can't write a member incrementally, so its content
+        is read in full instead.
+        """
+        zinfo = copy(member.zinfo)
+        data = member.data
+        is_reference = isinstance(data, BlobReference)
+        zinfo.file_size = len(data)
+        if sys.version_info < (3, 6):
+            data = data.read() if is_reference else bytes(data)
+            self._zipf.writestr(zinfo, data)
+            return
+        chunks = data.iter_chunks() if is_reference else (data,)
+        with self._zipf.open(zinfo, 'w') as f:
+            for chunk in chunks:
+                f.write(chunk)
+
+
+class _ZipMember(object):
+    """
+    Value object for a zip archive member ready to be written, its content
+    along with the |ZipInfo| header describing it.
+    """
+    def __init__(self, zinfo, data):
+        super(_ZipMember, self).__init__()
+        self._zinfo = zinfo
+        self._data = data
+
+    @property
+    def data(self):
+        """
+        The uncompressed content of this member, bytes or a |BlobReference|.
+        """
+        return self._data
+
+    @staticmethod
+    def new_zinfo(membername, date_time=None):
+        """
+        Return a new |ZipInfo| instance for a deflated member named
+        *membername* and timestamped *date_time*, or with the current local
+        time if it is |None|. An explicit *date_time* also fixes the
+        creating system recorded in the header, which otherwise depends on
+        the platform.
+        """
+        if date_time is None:
+            zinfo = ZipInfo(membername, time.localtime(time.time())[:6])
+        else:
+            zinfo = ZipInfo(membername, date_time)
+            zinfo.create_system = 3
+        zinfo.external_attr = 0o600 << 16
+        zinfo.compress_type = ZIP_DEFLATED
+        return zinfo
+
+    @property
+    def zinfo(self):
+        """
+        |ZipInfo| instance describing this member.
+        """
+        return self._zinfo
+
+
+class BlobReference(object):
+    """
+    Base class standing in for the blob of a large binary part, to keep it
+    out of memory until it is needed. The bytes are read back on demand from
+    wherever they are stored, either in full or chunk by chunk. ``len()``
+    gives their size without reading anything.
+    """
+    def __init__(self, size):
+        super(BlobReference, self).__init__()
+        self._size = size
+
+    def __len__(self):
+        return self._size
+
+    def crc32(self):
+        """
+        Return the CRC-32 of the referenced bytes, as a zip header records
+        it.
+        """
+        crc = 0
+        for chunk in self.iter_chunks():
+            crc = zlib.crc32(chunk, crc)
+        return crc & 0xffffffff
+
+    def iter_chunks(self):
+        """
+        Generate the referenced bytes in successive chunks of at most
+        ``BLOB_CHUNK_SIZE`` bytes.
+        """
+        with self._open() as f:
+            while True:
+                chunk = f.read(BLOB_CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+
+    def read(self):
+        """
+        Return the referenced bytes, read into memory in full.
+        """
+        with self._open() as f:
+            return f.read()
+
+    def _open(self):
         """
-        self._zipf.writestr(pack_uri.membername, blob)
+        Return a context manager producing a binary file-like object
+        positioned at the start of the referenced bytes.
+        """
+        raise NotImplementedError('must be implemented by each subclass')
+
+
+class _FileBlob(BlobReference):
+    """
+    |BlobReference| to the contents of a file, such as a member of an
+    expanded package directory.
+    """
+    def __init__(self, path, size):
+        super(_FileBlob, self).__init__(size)
+        self._path = path
+
+    @property
+    def path(self):
+        """
+        Absolute path of the referenced file.
+        """
+        return self._path
+
+    def _open(self):
+        return open(self._path, 'rb')
+
+
+class _MappedMemberBlob(BlobReference):
+    """
+    |BlobReference| to the stored bytes of a zip member in a memory-mapped
+    file, given as a |memoryview| of the mapping. A DEFLATED member is
+    inflated chunk by chunk straight out of the mapping each time it is
+    read.
+    """
+    def __init__(self, data, zinfo):
+        super(_MappedMemberBlob, self).__init__(zinfo.file_size)
+        self._data = data
+        self._deflated = zinfo.compress_type == ZIP_DEFLATED
+        self._crc = zinfo.CRC
+
+    def crc32(self):
+        """
+        Return the CRC-32 recorded for the member, without reading it.
+        """
+        return self._crc
+
+    def iter_chunks(self):
+        """
+        Generate the bytes of the member in successive chunks of at most
+        ``BLOB_CHUNK_SIZE`` bytes, inflating them if the member is DEFLATED.
+        """
+        data = self._data
+        if not self._deflated:
+            for start in range(0, len(data), BLOB_CHUNK_SIZE):
+                yield data[start:start+BLOB_CHUNK_SIZE].tobytes()
+            return
+        decompressor = zlib.decompressobj(-15)
+        pending = data
+        while pending:
+            chunk = decompressor.decompress(pending, BLOB_CHUNK_SIZE)
+            pending = decompressor.unconsumed_tail
+            if chunk:
+                yield chunk
+        chunk = decompressor.flush()
+        if chunk:
+            yield chunk
+
+    def read(self):
+        """
+        Return the bytes of the member, inflated in full if it is DEFLATED.
+        """
+        if not self._deflated:
+            return self._data.tobytes()
+        return zlib.decompress(self._data, -15, len(self) or 1)
+
+
+class _SpilledBlob(BlobReference):
+    """
+    |BlobReference| to bytes spilled into an anonymous temporary file, which
+    is deleted when this object is garbage collected.
+    """
+    def __init__(self, tmp_file, size):
+        super(_SpilledBlob, self).__init__(size)
+        self._tmp_file = tmp_file
+
+    @classmethod
+    def spill(cls, f, size):
+        """
+        Return a new |_SpilledBlob| instance holding the *size* bytes read
+        from file-like object *f*, copied chunk by chunk.
+        """
+        # deferred, tempfile is costly to import and only needed here
+        import tempfile
+
+        tmp_file = tempfile.TemporaryFile()
+        while True:
+            chunk = f.read(BLOB_CHUNK_SIZE)
+            if not chunk:
+                break
+            tmp_file.write(chunk)
+        return cls(tmp_file, size)
+
+    @contextmanager
+    def _open(self):
+        self._tmp_file.seek(0)
+        yield self._tmp_file
+
+
+class _ZipMemberBlob(BlobReference):
+    """
+    |BlobReference| to a member of the zip file at a filesystem path, which
+    is opened afresh each time the member is read.
+    """
+    def __init__(self, path, zinfo):
+        super(_ZipMemberBlob, self).__init__(zinfo.file_size)
+        self._path = path
+        self._membername = zinfo.filename
+        self._crc = zinfo.CRC
+
+    def crc32(self):
+        """
+        Return the CRC-32 recorded for the member, without reading it.
+        """
+        return self._crc
+
+    @contextmanager
+    def _open(self):
+        with ZipFile(self._path, 'r') as zipf:
+            with zipf.open(self._membername) as f:
+                yield f
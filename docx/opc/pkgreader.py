@@ -7,10 +7,11 @@ Provides a low-level, read-only API to a serialized Open Packaging Convention
 
 from __future__ import absolute_import
 
+from ..instrumentation import phase
 from .constants import RELATIONSHIP_TARGET_MODE as RTM
 from .oxml import parse_xml
 from .packuri import PACKAGE_URI, PackURI
-from .phys_pkg import PhysPkgReader
+from .phys_pkg import _MmapZipPkgReader, PhysPkgReader
 from .shared import CaseInsensitiveDict
 
 
@@ -25,17 +26,36 @@ class PackageReader(object):
         self._sparts = sparts
 
     @staticmethod
-    def from_file(pkg_file):
+    def from_file(pkg_file, use_mmap=False, blob_threshold=None):
         """
         Return a |PackageReader| instance loaded with contents of *pkg_file*.
-        """
-        phys_reader = PhysPkgReader(pkg_file)
-        content_types = _ContentTypeMap.from_xml(phys_reader.content_types_xml)
-        pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
-        sparts = PackageReader._load_serialized_parts(
-            phys_reader, pkg_srels, content_types
-        )
-        phys_reader.close()
+        If *use_mmap* is |True| and *pkg_file* is a path to a zip file, the
+        file is memory-mapped and part blobs are read directly out of the
+        mapping; uncompressed members are then not copied at all and the
+        XML of each part is parsed as it is inflated, chunk by chunk. If
+        *blob_threshold* is not |None|, the blob of each binary part larger
+        than that many bytes is a |BlobReference| rather than bytes in
+        memory.
+        """
+        with phase('read'):
+            if use_mmap and _MmapZipPkgReader.can_map(pkg_file):
+                phys_reader = _MmapZipPkgReader(pkg_file)
+            else:
+                phys_reader = PhysPkgReader(pkg_file)
+                use_mmap = False
+            content_types = _ContentTypeMap.from_xml(
+                phys_reader.content_types_xml
+            )
+            pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
+            part_reader = phys_reader
+            if use_mmap or blob_threshold is not None:
+                part_reader = _PartBlobReader(
+                    phys_reader, content_types, blob_threshold, use_mmap
+                )
+            sparts = PackageReader._load_serialized_parts(
+                part_reader, pkg_srels, content_types
+            )
+            phys_reader.close()
         return PackageReader(content_types, pkg_srels, sparts)
 
     def iter_sparts(self):
@@ -80,9 +100,12 @@ class PackageReader(object):
         Return |_SerializedRelationships| instance populated with
         relationships for source identified by *source_uri*.
         """
-        rels_xml = phys_reader.rels_xml_for(source_uri)
-        return _SerializedRelationships.load_from_xml(
-            source_uri.baseURI, rels_xml)
+        with phase('read.rels', source_uri) as p:
+            rels_xml = phys_reader.rels_xml_for(source_uri)
+            if rels_xml is not None:
+                p.add_blob(rels_xml)
+            return _SerializedRelationships.load_from_xml(
+                source_uri.baseURI, rels_xml)
 
     @staticmethod
     def _walk_phys_parts(phys_reader, srels, visited_partnames=None):
@@ -102,7 +125,9 @@ class PackageReader(object):
             visited_partnames.append(partname)
             reltype = srel.reltype
             part_srels = PackageReader._srels_for(phys_reader, partname)
-            blob = phys_reader.blob_for(partname)
+            with phase('read.inflate', partname) as p:
+                blob = phys_reader.blob_for(partname)
+                p.add_blob(blob)
             yield (partname, blob, reltype, part_srels)
             next_walker = PackageReader._walk_phys_parts(
                 phys_reader, part_srels, visited_partnames
@@ -111,6 +136,43 @@ class PackageReader(object):
                 yield (partname, blob, reltype, srels)
 
 
+class _PartBlobReader(object):
+    """
+    Wraps a physical package reader such that the blob of a part is
+    a |BlobReference| rather than bytes where the part content type calls
+    for it. If *threshold* is not |None|, that is the case for each binary
+    part larger than *threshold* bytes. If *stream_xml* is |True|, it is the
+    case for each XML part, whose XML is then parsed chunk by chunk as it
+    is read rather than from a copy held in full. Otherwise XML parts are
+    read in full, since they are parsed straight away.
+    """
+    def __init__(self, phys_reader, content_types, threshold=None,
+                 stream_xml=False):
+        super(_PartBlobReader, self).__init__()
+        self._phys_reader = phys_reader
+        self._content_types = content_types
+        self._threshold = threshold
+        self._stream_xml = stream_xml
+
+    def blob_for(self, pack_uri):
+        """
+        Return the blob of the part having *pack_uri*, or a |BlobReference|
+        to it if it is an XML part being streamed or a large binary part.
+        """
+        phys_reader = self._phys_reader
+        if self._content_types[pack_uri].endswith('xml'):
+            if self._stream_xml:
+                return phys_reader.blob_reference_for(pack_uri)
+            return phys_reader.blob_for(pack_uri)
+        threshold = self._threshold
+        if threshold is None or phys_reader.member_size(pack_uri) <= threshold:
+            return phys_reader.blob_for(pack_uri)
+        return phys_reader.blob_reference_for(pack_uri)
+
+    def rels_xml_for(self, source_uri):
+        return self._phys_reader.rels_xml_for(source_uri)
+
+
 class _ContentTypeMap(object):
     """
     Value type providing dictionary semantics for looking up content type by
@@ -7,10 +7,11 @@ Convention (OPC) package, essentially an implementation of OpcPackage.save()
 
 from __future__ import absolute_import
 
+from ..instrumentation import phase
 from .constants import CONTENT_TYPE as CT
 from .oxml import CT_Types, serialize_part_xml
 from .packuri import CONTENT_TYPES_URI, PACKAGE_URI
-from .phys_pkg import PhysPkgWriter
+from .phys_pkg import BlobReference, PhysPkgWriter
 from .shared import CaseInsensitiveDict
 from .spec import default_content_types
 
@@ -23,17 +24,61 @@ class PackageWriter(object):
     be instantiated.
     """
     @staticmethod
-    def write(pkg_file, pkg_rels, parts):
+    def write(pkg_file, pkg_rels, parts, workers=None, source=None,
+              deterministic=False):
         """
         Write a physical package (.pptx file) to *pkg_file* containing
         *pkg_rels* and *parts* and a content types stream based on the
-        content types of the parts.
+        content types of the parts. When *workers* is a positive integer,
+        the parts are serialized concurrently on that many threads;
+        otherwise they are processed one after the other. When *source* is
+        the path of a zip package the parts were loaded from, the member of
+        each part not dirty since then is copied from there, keeping the
+        compression it has there, without the part being serialized. When
+        *deterministic* is |True|,
+        parts are written in partname order and zip members carry a fixed
+        timestamp, so the same content always produces the same bytes.
+        """
+        with phase('write'):
+            phys_writer = PhysPkgWriter(pkg_file, deterministic)
+            if deterministic:
+                parts = sorted(parts, key=lambda part: part.partname)
+            reuse = source is not None
+            if reuse:
+                phys_writer.reuse_members_from(source)
+            PackageWriter._write_content_types_stream(phys_writer, parts)
+            PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
+            if workers:
+                PackageWriter._write_parts_concurrently(
+                    phys_writer, parts, workers, reuse
+                )
+            else:
+                PackageWriter._write_parts(phys_writer, parts, reuse)
+            phys_writer.close()
+
+    @staticmethod
+    def _serialize(part):
+        """
+        Return the blob of *part*, serializing its XML if it is an XML part.
+        A part whose blob was left in its source file is returned as the
+        |BlobReference| it holds, to be streamed from there when written.
+        """
+        with phase('write.serialize', part.partname) as p:
+            blob = part._blob
+            if not isinstance(blob, BlobReference):
+                blob = part.blob
+            p.add_blob(blob)
+        return blob
+
+    @staticmethod
+    def _serialize_rels(part):
+        """
+        Return the XML of the rels item for the relationships of *part*.
         """
-        phys_writer = PhysPkgWriter(pkg_file)
-        PackageWriter._write_content_types_stream(phys_writer, parts)
-        PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
-        PackageWriter._write_parts(phys_writer, parts)
-        phys_writer.close()
+        with phase('write.serialize', part.partname.rels_uri) as p:
+            rels_xml = part._rels.xml
+            p.add_blob(rels_xml)
+        return rels_xml
 
     @staticmethod
     def _write_content_types_stream(phys_writer, parts):
@@ -45,15 +90,69 @@ class PackageWriter(object):
         phys_writer.write(CONTENT_TYPES_URI, cti.blob)
 
     @staticmethod
-    def _write_parts(phys_writer, parts):
+    def _write_parts(phys_writer, parts, reuse=False):
         """
         Write the blob of each part in *parts* to the package, along with a
-        rels item for its relationships if and only if it has any.
+        rels item for its relationships if and only if it has any. If
+        *reuse* is |True|, the member of each part that is not dirty is
+        copied from the source package of *phys_writer* instead.
         """
         for part in parts:
-            phys_writer.write(part.partname, part.blob)
+            if reuse and not part.is_dirty:
+                with phase('write.deflate', part.partname):
+                    phys_writer.write_member(
+                        phys_writer.source_member(part.partname)
+                    )
+            else:
+                blob = PackageWriter._serialize(part)
+                with phase('write.deflate', part.partname) as p:
+                    p.add_blob(blob)
+                    phys_writer.write(part.partname, blob)
             if len(part._rels):
-                phys_writer.write(part.partname.rels_uri, part._rels.xml)
+                rels_uri = part.partname.rels_uri
+                rels_xml = PackageWriter._serialize_rels(part)
+                with phase('write.deflate', rels_uri) as p:
+                    p.add_blob(rels_xml)
+                    phys_writer.write(rels_uri, rels_xml)
+
+    @staticmethod
+    def _write_parts_concurrently(phys_writer, parts, workers, reuse=False):
+        """
+        Write the same members as :meth:`_write_parts`, in the same order,
+        but serialize them on a pool of *workers* threads. lxml serialization
+        releases the GIL, so parts are serialized while the members already
+        prepared are compressed and written to *phys_writer*, which happens
+        sequentially since ``ZipFile`` compresses each member as it writes
+        it.
+        """
+        def prepare_member(pack_uri, blob):
+            with phase('write.deflate', pack_uri) as p:
+                p.add_blob(blob)
+                return phys_writer.prepare_member(pack_uri, blob)
+
+        def prepare_members(part):
+            if reuse and not part.is_dirty:
+                members = [phys_writer.source_member(part.partname)]
+            else:
+                blob = PackageWriter._serialize(part)
+                members = [prepare_member(part.partname, blob)]
+            if len(part._rels):
+                members.append(prepare_member(
+                    part.partname.rels_uri, PackageWriter._serialize_rels(part)
+                ))
+            return members
+
+        # deferred, multiprocessing is costly to import and rarely needed
+        from multiprocessing.pool import ThreadPool
+
+        pool = ThreadPool(workers)
+        try:
+            for members in pool.imap(prepare_members, parts):
+                for member in members:
+                    phys_writer.write_member(member)
+        finally:
+            pool.close()
+            pool.join()
 
     @staticmethod
     def _write_pkg_rels(phys_writer, pkg_rels):
@@ -2,11 +2,15 @@
 
 """
 Initializes oxml sub-package, including registering custom element classes
-corresponding to Open XML elements.
+corresponding to Open XML elements. The modules defining those classes are
+imported and the classes registered on first use of the parser rather than
+on import of this package, so importing |docx| stays cheap.
 """
 
 from __future__ import absolute_import
 
+import threading
+
 from lxml import etree
 
 from .ns import NamespacePrefixedTag, nsmap
@@ -18,6 +22,26 @@ oxml_parser = etree.XMLParser(remove_blank_text=True)
 oxml_parser.set_element_class_lookup(element_class_lookup)
 
 
+class _XmlChanges(object):
+    """
+    Count of the changes made to any oxml element tree through the methods
+    of its elements.
+    """
+    count = 0
+
+
+_xml_changes = _XmlChanges()
+
+
+def note_xml_change():
+    """
+    Count a change made to an oxml element tree. Called by each method of
+    |BaseOxmlElement| that changes an element, and by code changing an
+    element through its ``attrib`` mapping, which it can't see.
+    """
+    _xml_changes.count += 1
+
+
 def parse_xml(xml):
     """
     Return root lxml element obtained by parsing XML character string in
@@ -25,10 +49,38 @@ def parse_xml(xml):
     parser is used, so custom element classes are produced for elements in
     *xml* that have them.
     """
+    if not _element_classes_registered:
+        _register_element_classes()
     root_element = etree.fromstring(xml, oxml_parser)
     return root_element
 
 
+def parse_xml_chunks(chunks):
+    """
+    Return root lxml element obtained by parsing the XML byte strings
+    generated by *chunks* one after the other, as :func:`parse_xml` does
+    for XML held in full, so the XML is never held in memory in full. The
+    chunks are fed to a copy of the custom parser, since a parser being fed
+    can't be shared with another thread.
+    """
+    if not _element_classes_registered:
+        _register_element_classes()
+    parser = oxml_parser.copy()
+    for chunk in chunks:
+        parser.feed(chunk)
+    return parser.close()
+
+
+def xml_change_count():
+    """
+    Return the number of changes made so far to any oxml element tree. An
+    object caching something computed from a tree, such as a digest of its
+    XML, can hold on to the count it was computed at and compute it afresh
+    only when the count has moved on.
+    """
+    return _xml_changes.count
+
+
 def register_element_cls(tag, cls):
     """
     Register *cls* to be constructed when the oxml parser encounters an
@@ -52,6 +104,8 @@ def OxmlElement(nsptag_str, attrs=None, nsdecls=None):
     a single namespace declaration is added based on the prefix on
     *nsptag_str*.
     """
+    if not _element_classes_registered:
+        _register_element_classes()
     nsptag = NamespacePrefixedTag(nsptag_str)
     if nsdecls is None:
         nsdecls = nsptag.nsmap
@@ -64,100 +118,133 @@ def OxmlElement(nsptag_str, attrs=None, nsdecls=None):
 # custom element class mappings
 # ===========================================================================
 
-from docx.oxml.shared import CT_DecimalNumber, CT_OnOff, CT_String
-
-from docx.oxml.shape import (
-    CT_Blip, CT_BlipFillProperties, CT_GraphicalObject,
-    CT_GraphicalObjectData, CT_Inline, CT_NonVisualDrawingProps, CT_Picture,
-    CT_PictureNonVisual, CT_Point2D, CT_PositiveSize2D, CT_ShapeProperties,
-    CT_Transform2D
-)
-register_element_cls('a:blip',        CT_Blip)
-register_element_cls('a:ext',         CT_PositiveSize2D)
-register_element_cls('a:graphic',     CT_GraphicalObject)
-register_element_cls('a:graphicData', CT_GraphicalObjectData)
-register_element_cls('a:off',         CT_Point2D)
-register_element_cls('a:xfrm',        CT_Transform2D)
-register_element_cls('pic:blipFill',  CT_BlipFillProperties)
-register_element_cls('pic:cNvPr',     CT_NonVisualDrawingProps)
-register_element_cls('pic:nvPicPr',   CT_PictureNonVisual)
-register_element_cls('pic:pic',       CT_Picture)
-register_element_cls('pic:spPr',      CT_ShapeProperties)
-register_element_cls('wp:docPr',      CT_NonVisualDrawingProps)
-register_element_cls('wp:extent',     CT_PositiveSize2D)
-register_element_cls('wp:inline',     CT_Inline)
-
-from docx.oxml.parts.document import CT_Body, CT_Document
-register_element_cls('w:body',     CT_Body)
-register_element_cls('w:document', CT_Document)
-
-from docx.oxml.parts.numbering import (
-    CT_Num, CT_Numbering, CT_NumLvl, CT_NumPr
-)
-register_element_cls('w:abstractNumId', CT_DecimalNumber)
-register_element_cls('w:ilvl',          CT_DecimalNumber)
-register_element_cls('w:lvlOverride',   CT_NumLvl)
-register_element_cls('w:num',           CT_Num)
-register_element_cls('w:numId',         CT_DecimalNumber)
-register_element_cls('w:numPr',         CT_NumPr)
-register_element_cls('w:numbering',     CT_Numbering)
-register_element_cls('w:startOverride', CT_DecimalNumber)
-
-from docx.oxml.parts.styles import CT_Style, CT_Styles
-register_element_cls('w:style',  CT_Style)
-register_element_cls('w:styles', CT_Styles)
-
-from docx.oxml.section import CT_PageMar, CT_PageSz, CT_SectPr, CT_SectType
-register_element_cls('w:pgMar',  CT_PageMar)
-register_element_cls('w:pgSz',   CT_PageSz)
-register_element_cls('w:sectPr', CT_SectPr)
-register_element_cls('w:type',   CT_SectType)
-
-from docx.oxml.table import (
-    CT_Row, CT_Tbl, CT_TblGrid, CT_TblGridCol, CT_TblLayoutType, CT_TblPr,
-    CT_TblWidth, CT_Tc, CT_TcPr
-)
-register_element_cls('w:gridCol',   CT_TblGridCol)
-register_element_cls('w:tbl',       CT_Tbl)
-register_element_cls('w:tblGrid',   CT_TblGrid)
-register_element_cls('w:tblLayout', CT_TblLayoutType)
-register_element_cls('w:tblPr',     CT_TblPr)
-register_element_cls('w:tblStyle',  CT_String)
-register_element_cls('w:tc',        CT_Tc)
-register_element_cls('w:tcPr',      CT_TcPr)
-register_element_cls('w:tcW',       CT_TblWidth)
-register_element_cls('w:tr',        CT_Row)
-
-from docx.oxml.text import (
-    CT_Br, CT_Jc, CT_P, CT_PPr, CT_R, CT_RPr, CT_Text, CT_Underline
-)
-register_element_cls('w:b',          CT_OnOff)
-register_element_cls('w:bCs',        CT_OnOff)
-register_element_cls('w:br',         CT_Br)
-register_element_cls('w:caps',       CT_OnOff)
-register_element_cls('w:cs',         CT_OnOff)
-register_element_cls('w:dstrike',    CT_OnOff)
-register_element_cls('w:emboss',     CT_OnOff)
-register_element_cls('w:i',          CT_OnOff)
-register_element_cls('w:iCs',        CT_OnOff)
-register_element_cls('w:imprint',    CT_OnOff)
-register_element_cls('w:jc',         CT_Jc)
-register_element_cls('w:noProof',    CT_OnOff)
-register_element_cls('w:oMath',      CT_OnOff)
-register_element_cls('w:outline',    CT_OnOff)
-register_element_cls('w:p',          CT_P)
-register_element_cls('w:pPr',        CT_PPr)
-register_element_cls('w:pStyle',     CT_String)
-register_element_cls('w:r',          CT_R)
-register_element_cls('w:rPr',        CT_RPr)
-register_element_cls('w:rStyle',     CT_String)
-register_element_cls('w:rtl',        CT_OnOff)
-register_element_cls('w:shadow',     CT_OnOff)
-register_element_cls('w:smallCaps',  CT_OnOff)
-register_element_cls('w:snapToGrid', CT_OnOff)
-register_element_cls('w:specVanish', CT_OnOff)
-register_element_cls('w:strike',     CT_OnOff)
-register_element_cls('w:t',          CT_Text)
-register_element_cls('w:u',          CT_Underline)
-register_element_cls('w:vanish',     CT_OnOff)
-register_element_cls('w:webHidden',  CT_OnOff)
+_element_classes_registered = False
+_registration_lock = threading.Lock()
+
+
+def _register_element_classes():
+    """
+    Register the custom element classes with the oxml parser unless that is
+    already done. Called before the first element is parsed or created.
+    A thread arriving while another is registering waits for it to finish,
+    so no element is produced before every class is registered.
+    """
+    global _element_classes_registered
+    with _registration_lock:
+        if _element_classes_registered:
+            return
+        _register_all_element_classes()
+        _element_classes_registered = True
+
+
+def _register_all_element_classes():
+    """
+    Import the custom element classes and register each with the oxml
+    parser.
+    """
+    from docx.oxml.shared import CT_DecimalNumber, CT_OnOff, CT_String
+
+    from docx.oxml.shape import (
+        CT_Blip, CT_BlipFillProperties, CT_GraphicalObject,
+        CT_GraphicalObjectData, CT_Inline, CT_NonVisualDrawingProps,
+        CT_Picture, CT_PictureNonVisual, CT_Point2D, CT_PositiveSize2D,
+        CT_ShapeProperties, CT_Transform2D
+    )
+    register_element_cls('a:blip',        CT_Blip)
+    register_element_cls('a:ext',         CT_PositiveSize2D)
+    register_element_cls('a:graphic',     CT_GraphicalObject)
+    register_element_cls('a:graphicData', CT_GraphicalObjectData)
+    register_element_cls('a:off',         CT_Point2D)
+    register_element_cls('a:xfrm',        CT_Transform2D)
+    register_element_cls('pic:blipFill',  CT_BlipFillProperties)
+    register_element_cls('pic:cNvPr',     CT_NonVisualDrawingProps)
+    register_element_cls('pic:nvPicPr',   CT_PictureNonVisual)
+    register_element_cls('pic:pic',       CT_Picture)
+    register_element_cls('pic:spPr',      CT_ShapeProperties)
+    register_element_cls('wp:docPr',      CT_NonVisualDrawingProps)
+    register_element_cls('wp:extent',     CT_PositiveSize2D)
+    register_element_cls('wp:inline',     CT_Inline)
+
+    from docx.oxml.parts.document import CT_Body, CT_Document
+    register_element_cls('w:body',     CT_Body)
+    register_element_cls('w:document', CT_Document)
+
+    from docx.oxml.parts.numbering import (
+        CT_Num, CT_Numbering, CT_NumLvl, CT_NumPr
+    )
+    register_element_cls('w:abstractNumId', CT_DecimalNumber)
+    register_element_cls('w:ilvl',          CT_DecimalNumber)
+    register_element_cls('w:lvlOverride',   CT_NumLvl)
+    register_element_cls('w:num',           CT_Num)
+    register_element_cls('w:numId',         CT_DecimalNumber)
+    register_element_cls('w:numPr',         CT_NumPr)
+    register_element_cls('w:numbering',     CT_Numbering)
+    register_element_cls('w:startOverride', CT_DecimalNumber)
+
+    from docx.oxml.parts.styles import CT_Style, CT_Styles
+    register_element_cls('w:style',  CT_Style)
+    register_element_cls('w:styles', CT_Styles)
+
+    from docx.oxml.section import (
+        CT_PageMar, CT_PageSz, CT_SectPr, CT_SectType
+    )
+    register_element_cls('w:pgMar',  CT_PageMar)
+    register_element_cls('w:pgSz',   CT_PageSz)
+    register_element_cls('w:sectPr', CT_SectPr)
+    register_element_cls('w:type',   CT_SectType)
+
+    from docx.oxml.table import (
+        CT_Row, CT_Tbl, CT_TblGrid, CT_TblGridCol, CT_TblLayoutType, CT_TblPr,
+        CT_TblWidth, CT_Tc, CT_TcPr
+    )
+    register_element_cls('w:gridCol',   CT_TblGridCol)
+    register_element_cls('w:tbl',       CT_Tbl)
+    register_element_cls('w:tblGrid',   CT_TblGrid)
+    register_element_cls('w:tblLayout', CT_TblLayoutType)
+    register_element_cls('w:tblPr',     CT_TblPr)
+    register_element_cls('w:tblStyle',  CT_String)
+    register_element_cls('w:tc',        CT_Tc)
+    register_element_cls('w:tcPr',      CT_TcPr)
+    register_element_cls('w:tcW',       CT_TblWidth)
+    register_element_cls('w:tr',        CT_Row)
+
+    from docx.oxml.text import (
+        CT_Br, CT_Jc, CT_P, CT_PPr, CT_R, CT_RPr, CT_Text, CT_Underline
+    )
+    register_element_cls('w:b',          CT_OnOff)
+    register_element_cls('w:bCs',        CT_OnOff)
+    register_element_cls('w:br',         CT_Br)
+    register_element_cls('w:caps',       CT_OnOff)
+    register_element_cls('w:cs',         CT_OnOff)
+    register_element_cls('w:dstrike',    CT_OnOff)
+    register_element_cls('w:emboss',     CT_OnOff)
+    register_element_cls('w:i',          CT_OnOff)
+    register_element_cls('w:iCs',        CT_OnOff)
+    register_element_cls('w:imprint',    CT_OnOff)
+    register_element_cls('w:jc',         CT_Jc)
+    register_element_cls('w:noProof',    CT_OnOff)
+    register_element_cls('w:oMath',      CT_OnOff)
+    register_element_cls('w:outline',    CT_OnOff)
+    register_element_cls('w:p',          CT_P)
+    register_element_cls('w:pPr',        CT_PPr)
+    register_element_cls('w:pStyle',     CT_String)
+    register_element_cls('w:r',          CT_R)
+    register_element_cls('w:rPr',        CT_RPr)
+    register_element_cls('w:rStyle',     CT_String)
+    register_element_cls('w:rtl',        CT_OnOff)
+    register_element_cls('w:shadow',     CT_OnOff)
+    register_element_cls('w:smallCaps',  CT_OnOff)
+    register_element_cls('w:snapToGrid', CT_OnOff)
+    register_element_cls('w:specVanish', CT_OnOff)
+    register_element_cls('w:strike',     CT_OnOff)
+    register_element_cls('w:t',          CT_Text)
+    register_element_cls('w:u',          CT_Underline)
+    register_element_cls('w:vanish',     CT_OnOff)
+    register_element_cls('w:webHidden',  CT_OnOff)
+
+    # an element having no custom class gets the base class, so changes
+    # made to it are counted too
+    from docx.oxml.xmlchemy import BaseOxmlElement
+    element_class_lookup.set_fallback(
+        etree.ElementDefaultClassLookup(element=BaseOxmlElement)
+    )
@@ -11,9 +11,11 @@ nsmap = {
     'a':   ('http://schemas.openxmlformats.org/drawingml/2006/main'),
     'c':   ('http://schemas.openxmlformats.org/drawingml/2006/chart'),
     'dgm': ('http://schemas.openxmlformats.org/drawingml/2006/diagram'),
+    'o':   ('urn:schemas-microsoft-com:office:office'),
     'pic': ('http://schemas.openxmlformats.org/drawingml/2006/picture'),
     'r':   ('http://schemas.openxmlformats.org/officeDocument/2006/relations'
             'hips'),
+    'v':   ('urn:schemas-microsoft-com:vml'),
     'w':   ('http://schemas.openxmlformats.org/wordprocessingml/2006/main'),
     'wp':  ('http://schemas.openxmlformats.org/drawingml/2006/wordprocessing'
             'Drawing'),
@@ -5,7 +5,9 @@ Custom element classes that correspond to the document part, e.g.
 <w:document>.
 """
 
+from ..ns import qn
 from ..table import CT_Tbl
+from ..text import CT_P
 from ..xmlchemy import BaseOxmlElement, ZeroOrOne, ZeroOrMore
 
 
@@ -21,7 +23,10 @@ class CT_Document(BaseOxmlElement):
         Return a list containing a reference to each ``<w:sectPr>`` element
         in the document, in the order encountered.
         """
-        return self.xpath('.//w:sectPr')
+        body = self.body
+        if body is None:
+            return []
+        return body.sectPr_lst
 
 
 class CT_Body(BaseOxmlElement):
@@ -47,6 +52,21 @@ class CT_Body(BaseOxmlElement):
         p.set_sectPr(cloned_sectPr)
         return sentinel_sectPr
 
+    def add_p_lst(self, paragraphs):
+        """
+        Return a list of new ``<w:p>`` elements, one for each ``(text,
+        style)`` 2-tuple in *paragraphs*, appended to the block content
+        elements in a single splice before any ``<w:sectPr>``.
+        """
+        p_lst = CT_P.new_p_lst(paragraphs)
+        return self.insert_elements_before(p_lst, 'w:sectPr')
+
+    def _insert_p(self, p):
+        return self._insert_block_item(p)
+
+    def _insert_tbl(self, tbl):
+        return self._insert_block_item(tbl)
+
     def _new_tbl(self):
         return CT_Tbl.new()
 
@@ -61,3 +81,40 @@ class CT_Body(BaseOxmlElement):
             content_elms = self[:]
         for content_elm in content_elms:
             self.remove(content_elm)
+
+    @property
+    def sectPr_lst(self):
+        """
+        Return a list containing a reference to each ``<w:sectPr>`` element
+        ending a section of this body, in document order: that in the
+        ``<w:pPr>`` of each paragraph ending a section, then that of the body
+        itself. Only the children of the body are scanned, so this takes
+        time proportional to the number of block items, not to the size of
+        the document.
+        """
+        pPr_tag, sectPr_tag = qn('w:pPr'), qn('w:sectPr')
+        sectPr_lst = []
+        for child in self.iterchildren(qn('w:p'), sectPr_tag):
+            if child.tag == sectPr_tag:
+                sectPr_lst.append(child)
+                continue
+            # a <w:pPr> is always the first child of its paragraph
+            if not len(child) or child[0].tag != pPr_tag:
+                continue
+            sectPr = child[0].find(sectPr_tag)
+            if sectPr is not None:
+                sectPr_lst.append(sectPr)
+        return sectPr_lst
+
+    def _insert_block_item(self, elm):
+        """
+        Return *elm* after appending it to the block content elements. The
+        ``<w:sectPr>`` of the body, when present, is always its last child,
+        so only that child is checked rather than searching for it.
+        """
+        last_child = next(self.iterchildren(reversed=True), None)
+        if last_child is not None and last_child.tag == qn('w:sectPr'):
+            last_child.addprevious(elm)
+        else:
+            self.append(elm)
+        return elm
@@ -9,7 +9,7 @@ type in the associated XML schema.
 from __future__ import absolute_import, print_function
 
 from ..exceptions import InvalidXmlError
-from ..shared import Emu, Twips
+from ..shared import Emu, Length, Twips
 
 
 class BaseSimpleType(object):
@@ -255,9 +255,8 @@ class ST_SignedTwipsMeasure(XsdInt):
 
     @classmethod
     def convert_to_xml(cls, value):
-        emu = Emu(value)
-        twips = emu.twips
-        return str(twips)
+        # same as str(Emu(value).twips) without the intermediate Length
+        return str(int(round(value / float(Length._EMUS_PER_TWIP))))
 
 
 class ST_String(XsdString):
@@ -298,9 +297,8 @@ class ST_TwipsMeasure(XsdUnsignedLong):
 
     @classmethod
     def convert_to_xml(cls, value):
-        emu = Emu(value)
-        twips = emu.twips
-        return str(twips)
+        # same as str(Emu(value).twips) without the intermediate Length
+        return str(int(round(value / float(Length._EMUS_PER_TWIP))))
 
 
 class ST_UniversalMeasure(BaseSimpleType):
@@ -7,11 +7,12 @@ Custom element classes for tables
 from __future__ import absolute_import, print_function, unicode_literals
 
 from . import parse_xml
-from .ns import nsdecls
+from .ns import nsdecls, qn
 from ..shared import Emu, Twips
 from .simpletypes import (
     ST_TblLayoutType, ST_TblWidth, ST_TwipsMeasure, XsdInt
 )
+from .text import CT_P, run_content_text, sym_text
 from .xmlchemy import (
     BaseOxmlElement, OneAndOnlyOne, OneOrMore, OptionalAttribute,
     RequiredAttribute, ZeroOrOne, ZeroOrMore
@@ -45,6 +46,60 @@ class CT_Tbl(BaseOxmlElement):
         tbl = parse_xml(cls._tbl_xml())
         return tbl
 
+    @staticmethod
+    def set_cell_texts(cells):
+        """
+        Replace the content of each ``<w:tc>`` element in *cells*, a sequence
+        of ``(tc, text)`` 2-tuples, with a single paragraph containing
+        *text* in a single run, as assigning ``_Cell.text`` does; its
+        ``<w:tcPr>`` is kept. The paragraphs for all the cells are generated
+        as a single string of XML and parsed once.
+        """
+        p_lst = CT_P.new_p_lst((text, None) for tc, text in cells)
+        for (tc, text), p in zip(cells, p_lst):
+            tc.clear_content()
+            tc.append(p)
+
+    def text_grid(self):
+        """
+        Return a list containing, for each ``<w:tr>`` child, a list of the
+        text of its cell at each grid column, found in a single pass. A cell
+        spanning several grid columns (``w:gridSpan``) has its text at each
+        of them, and a cell continuing a vertical merge (``w:vMerge``) has
+        the text of the cell above. The text of each paragraph in a cell is
+        as for |Paragraph|, those of a cell being separated by ``'\\n'``.
+        Grid columns a row skips, and those beyond its last cell, are
+        ``''``.
+        """
+        rows = []
+        above = ()
+        for tr in self.iterchildren(_tr_tag):
+            row = []
+            trPr = tr.find(_trPr_tag)
+            if trPr is not None:
+                row.extend([''] * _int_val(trPr.find(_gridBefore_tag), 0))
+            for tc in tr.iterchildren(_tc_tag):
+                span, merge = 1, None
+                tcPr = tc.find(_tcPr_tag)
+                if tcPr is not None:
+                    span = _int_val(tcPr.find(_gridSpan_tag), 1)
+                    vMerge = tcPr.find(_vMerge_tag)
+                    if vMerge is not None:
+                        merge = vMerge.get(_w_val, 'continue')
+                col_idx = len(row)
+                if merge == 'continue' and col_idx < len(above):
+                    text = above[col_idx]
+                else:
+                    text = _tc_text(tc)
+                row.extend([text] * span)
+            rows.append(row)
+            above = row
+        gridCols = self.findall('%s/%s' % (_tblGrid_tag, _gridCol_tag))
+        width = max([len(gridCols)] + [len(row) for row in rows])
+        for row in rows:
+            row.extend([''] * (width - len(row)))
+        return rows
+
     @classmethod
     def _tbl_xml(cls):
         return (
@@ -176,6 +231,16 @@ class CT_Tc(BaseOxmlElement):
         self.insert(0, tcPr)
         return tcPr
 
+    def add_p_lst(self, paragraphs):
+        """
+        Return a list of new ``<w:p>`` elements, one for each ``(text,
+        style)`` 2-tuple in *paragraphs*, appended to the content of this
+        cell in a single splice.
+        """
+        p_lst = CT_P.new_p_lst(paragraphs)
+        self.extend(p_lst)
+        return p_lst
+
     def _new_tbl(self):
         return CT_Tbl.new()
 
@@ -248,3 +313,46 @@ class CT_TcPr(BaseOxmlElement):
     def width(self, value):
         tcW = self.get_or_add_tcW()
         tcW.width = value
+
+
+_gridBefore_tag = qn('w:gridBefore')
+_gridCol_tag = qn('w:gridCol')
+_gridSpan_tag = qn('w:gridSpan')
+_p_tag = qn('w:p')
+_r_tag = qn('w:r')
+_sym_tag = qn('w:sym')
+_tc_tag = qn('w:tc')
+_tblGrid_tag = qn('w:tblGrid')
+_tcPr_tag = qn('w:tcPr')
+_tr_tag = qn('w:tr')
+_trPr_tag = qn('w:trPr')
+_vMerge_tag = qn('w:vMerge')
+_w_val = qn('w:val')
+
+
+def _int_val(elm, default):
+    """
+    Return the integer value of the ``w:val`` attribute of *elm*, or
+    *default* if *elm* is |None| or the attribute is missing or invalid.
+    """
+    if elm is None:
+        return default
+    try:
+        return int(elm.get(_w_val))
+    except (TypeError, ValueError):
+        return default
+
+
+def _tc_text(tc):
+    """
+    Return the text of the paragraphs of *tc*, separated by ``'\\n'``,
+    a ``<w:sym>`` element contributing the character it specifies.
+    """
+    texts = []
+    for p in tc.iterchildren(_p_tag):
+        texts.append(''.join(
+            sym_text(child) if child.tag == _sym_tag else
+            run_content_text(child)
+            for r in p.iterchildren(_r_tag) for child in r.iterchildren()
+        ))
+    return '\n'.join(texts)
@@ -5,8 +5,15 @@ Custom element classes related to text, such as paragraph (CT_P) and runs
 (CT_R).
 """
 
+import re
+
+from bisect import bisect_right
+from xml.sax.saxutils import escape
+
+from . import parse_xml
+from ..compat import is_string, unichr, Unicode
 from ..enum.text import WD_ALIGN_PARAGRAPH, WD_UNDERLINE
-from .ns import qn
+from .ns import nsdecls, qn
 from .simpletypes import ST_BrClear, ST_BrType
 from .xmlchemy import (
     BaseOxmlElement, OptionalAttribute, OxmlElement, RequiredAttribute,
@@ -48,6 +55,39 @@ class CT_P(BaseOxmlElement):
         self.addprevious(new_p)
         return new_p
 
+    @classmethod
+    def new_p_lst(cls, paragraphs):
+        """
+        Return a list of new "loose" ``<w:p>`` elements, one for each
+        ``(text, style)`` 2-tuple in *paragraphs*. The XML for all of them
+        is generated as a single string and parsed once, which is much
+        faster than building each paragraph element by element. *text* is
+        translated into run content as by |_RunContentAppender| and *style*
+        is a style id, or |None| for no ``<w:pStyle>`` element.
+        """
+        xml = ''.join(
+            cls._p_xml(text, style) for text, style in paragraphs
+        )
+        body = parse_xml('<w:body %s>%s</w:body>' % (nsdecls('w'), xml))
+        return list(body)
+
+    @staticmethod
+    def _p_xml(text, style):
+        """
+        Return the XML for a ``<w:p>`` element having *style* and containing
+        *text* in a single run.
+        """
+        pPr_xml = r_xml = ''
+        if style is not None:
+            pPr_xml = '<w:pPr><w:pStyle w:val="%s"/></w:pPr>' % escape(
+                style, {'"': '&quot;'}
+            )
+        if text:
+            r_xml = '<w:r>%s</w:r>' % _RunContentAppender.run_content_xml(
+                text
+            )
+        return '<w:p>%s%s</w:p>' % (pPr_xml, r_xml)
+
     @property
     def alignment(self):
         """
@@ -234,16 +274,7 @@ class CT_R(BaseOxmlElement):
         child elements like ``<w:tab/>`` translated to their Python
         equivalent.
         """
-        text = ''
-        for child in self:
-            if child.tag == qn('w:t'):
-                t_text = child.text
-                text += t_text if t_text is not None else ''
-            elif child.tag == qn('w:tab'):
-                text += '\t'
-            elif child.tag in (qn('w:br'), qn('w:cr')):
-                text += '\n'
-        return text
+        return ''.join(run_content_text(child) for child in self)
 
     @text.setter
     def text(self, text):
@@ -375,6 +406,76 @@ class CT_Underline(BaseOxmlElement):
         self.set(qn('w:val'), val)
 
 
+class TextMap(object):
+    """
+    Maps each character of the text of a ``<w:p>`` element, the text of its
+    runs concatenated as |Paragraph| reports it, back to the run content
+    element it comes from. A span of that text can then be replaced in
+    place, even when Word has split it across several runs, keeping the
+    formatting of the run the span starts in.
+    """
+    def __init__(self, p):
+        super(TextMap, self).__init__()
+        chunks, starts, segments, offset = [], [], [], 0
+        for r in p.iterchildren(qn('w:r')):
+            for child in r:
+                chunk = run_content_text(child)
+                if not chunk:
+                    continue
+                chunks.append(chunk)
+                starts.append(offset)
+                segments.append((offset, offset + len(chunk), child))
+                offset += len(chunk)
+        self._starts = starts
+        self._segments = segments
+        self.text = ''.join(chunks)
+
+    def replace(self, start, end, text):
+        """
+        Replace the characters of the mapped text from offset *start* up to
+        but not including *end* with *text*, placed in the run containing
+        the character at *start*. *end* must be greater than *start*.
+        *text* is converted to a string if it is not one, and each tab or
+        line break character in it becomes a ``<w:tab/>`` or ``<w:br/>``
+        element, as when the text of a run is assigned. Offsets are those of
+        the text as originally mapped, so several spans of it must be
+        replaced in reverse order of position, last first.
+        """
+        if not is_string(text):
+            text = Unicode(text)
+        special = _RunContentAppender.has_special_chars(text)
+        idx = max(bisect_right(self._starts, start) - 1, 0)
+        for seg_start, seg_end, child in self._segments[idx:]:
+            if seg_start >= end:
+                break
+            if seg_end <= start:
+                continue
+            if child.tag != qn('w:t'):
+                # a tab or break, entirely within the span
+                if text:
+                    for elm in _run_content_elements(text):
+                        child.addprevious(elm)
+                    text = ''
+                child.getparent().remove(child)
+                continue
+            t_text = child.text
+            head = t_text[:start-seg_start] if start > seg_start else ''
+            tail = t_text[end-seg_start:] if end < seg_end else ''
+            new_text = head + text + tail
+            if special and text:
+                elms = _run_content_elements(new_text)
+                # child keeps the head, which any span before this refers to
+                first = elms[0]
+                new_text = first.text if first.tag == qn('w:t') else ''
+                for elm in reversed(elms[1:] if new_text else elms):
+                    child.addnext(elm)
+            text = ''
+            if not new_text:
+                child.getparent().remove(child)
+                continue
+            _set_t_text(child, new_text)
+
+
 class _RunContentAppender(object):
     """
     Service object that knows how to translate a Python string into run
@@ -384,6 +485,8 @@ class _RunContentAppender(object):
     appended. Likewise a newline or carriage return character ('\n', '\r')
     causes a ``<w:cr>`` element to be appended.
     """
+    _special_chars = re.compile('([\t\r\n])')
+
     def __init__(self, r):
         self._r = r
         self._bfr = []
@@ -398,6 +501,36 @@ class _RunContentAppender(object):
         appender = cls(r)
         appender.add_text(text)
 
+    @classmethod
+    def run_content_xml(cls, text):
+        """
+        Return the XML for the run content elements corresponding to *text*,
+        the same elements ``append_to_run_from_text()`` would append.
+        """
+        xml = []
+        for chunk in cls._special_chars.split(text):
+            if not chunk:
+                continue
+            if chunk == '\t':
+                xml.append('<w:tab/>')
+            elif chunk in '\r\n':
+                xml.append('<w:br/>')
+            elif len(chunk.strip()) < len(chunk):
+                xml.append(
+                    '<w:t xml:space="preserve">%s</w:t>' % escape(chunk)
+                )
+            else:
+                xml.append('<w:t>%s</w:t>' % escape(chunk))
+        return ''.join(xml)
+
+    @classmethod
+    def has_special_chars(cls, text):
+        """
+        Return |True| if *text* contains a tab, newline or carriage return
+        character, each of which has its own run content element.
+        """
+        return cls._special_chars.search(text) is not None
+
     def add_text(self, text):
         """
         Append the run content elements corresponding to *text* to the
@@ -429,3 +562,62 @@ class _RunContentAppender(object):
         if text:
             self._r.add_t(text)
         del self._bfr[:]
+
+
+_br_tags = frozenset((qn('w:br'), qn('w:cr')))
+_t_tag = qn('w:t')
+_tab_tag = qn('w:tab')
+_w_char = qn('w:char')
+
+
+def run_content_text(child):
+    """
+    Return the text *child*, a child element of a ``<w:r>`` element,
+    contributes to the text of its run: the text of a ``<w:t>`` element,
+    a tab for ``<w:tab/>`` and a line break for ``<w:br/>`` or ``<w:cr/>``.
+    Any other child, such as ``<w:rPr>`` or ``<w:sym>``, contributes an
+    empty string. Everything reading the text of runs goes through here, so
+    all agree on it.
+    """
+    tag = child.tag
+    if tag == _t_tag:
+        return child.text or ''
+    if tag == _tab_tag:
+        return '\t'
+    if tag in _br_tags:
+        return '\n'
+    return ''
+
+
+def sym_text(sym):
+    """
+    Return the character ``<w:sym>`` element *sym* specifies, or an empty
+    string if its ``w:char`` attribute is missing or invalid. Not part of
+    the text of a run, it is read only where a symbol is wanted, such as
+    when extracting table text or exporting.
+    """
+    try:
+        return unichr(int(sym.get(_w_char), 16))
+    except (TypeError, ValueError):
+        return ''
+
+
+def _run_content_elements(text):
+    """
+    Return a list of the run content elements corresponding to *text*, the
+    same elements ``_RunContentAppender`` would append to a run.
+    """
+    r = parse_xml('<w:r %s>%s</w:r>' % (
+        nsdecls('w'), _RunContentAppender.run_content_xml(text)
+    ))
+    return list(r)
+
+
+def _set_t_text(t, text):
+    """
+    Set the text of ``<w:t>`` element *t* to *text*, preserving any edge
+    whitespace in it.
+    """
+    t.text = text
+    if len(text.strip()) < len(text):
+        t.set(qn('xml:space'), 'preserve')
@@ -10,8 +10,9 @@ from __future__ import absolute_import
 from lxml import etree
 
 import re
+import threading
 
-from . import OxmlElement
+from . import OxmlElement, note_xml_change
 from ..compat import Unicode
 from .exceptions import InvalidXmlError
 from .ns import NamespacePrefixedTag, nsmap, qn
@@ -107,10 +108,39 @@ class MetaOxmlElement(type):
                 value.populate_class_members(cls, key)
 
 
+class unchecked(object):
+    """
+    Context manager within whose block values assigned to attribute
+    properties are converted to their XML form without first being
+    validated, for trusted bulk writes where the values are known to be
+    valid. An invalid value assigned within the block may be written as-is
+    or raise an arbitrary exception. Blocks may be nested. Validation is
+    turned off only for the thread executing the block.
+    """
+    def __enter__(self):
+        _unchecked_depth.value += 1
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _unchecked_depth.value -= 1
+
+
+class _UncheckedDepth(threading.local):
+    """
+    Number of |unchecked| blocks the current thread is executing within.
+    """
+    value = 0
+
+
+_unchecked_depth = _UncheckedDepth()
+
+
 class BaseAttribute(object):
     """
     Base class for OptionalAttribute and RequiredAttribute, providing common
-    methods.
+    methods. The getter and setter of the property added to the element
+    class are compiled when the class is created, with the Clark name and
+    conversion functions of the attribute bound as closure variables, so
+    no lookups beyond those are repeated on each access.
     """
     def __init__(self, attr_name, simple_type):
         super(BaseAttribute, self).__init__()
@@ -142,6 +172,25 @@ class BaseAttribute(object):
             return qn(self._attr_name)
         return self._attr_name
 
+    @property
+    def _converters(self):
+        """
+        Return a (from_xml, validate, convert_to_xml) 3-tuple of the
+        functions translating values of this attribute's simple type. For
+        a |BaseSimpleType| subclass these are its ``convert_from_xml()``,
+        ``validate()`` and ``convert_to_xml()`` methods, called directly
+        rather than through ``from_xml()`` and ``to_xml()``. Any other
+        simple type, such as an XML enumeration, validates in ``to_xml()``,
+        so has no separate validation.
+        """
+        simple_type = self._simple_type
+        if not hasattr(simple_type, 'convert_to_xml'):
+            return simple_type.from_xml, _no_validation, simple_type.to_xml
+        return (
+            simple_type.convert_from_xml, simple_type.validate,
+            simple_type.convert_to_xml
+        )
+
 
 class OptionalAttribute(BaseAttribute):
     """
@@ -159,11 +208,14 @@ class OptionalAttribute(BaseAttribute):
         Return a function object suitable for the "get" side of the attribute
         property descriptor.
         """
+        clark_name, default = self._clark_name, self._default
+        from_xml = self._converters[0]
+
         def get_attr_value(obj):
-            attr_str_value = obj.get(self._clark_name)
+            attr_str_value = obj.get(clark_name)
             if attr_str_value is None:
-                return self._default
-            return self._simple_type.from_xml(attr_str_value)
+                return default
+            return from_xml(attr_str_value)
         get_attr_value.__doc__ = self._docstring
         return get_attr_value
 
@@ -186,13 +238,17 @@ class OptionalAttribute(BaseAttribute):
         Return a function object suitable for the "set" side of the attribute
         property descriptor.
         """
+        clark_name, default = self._clark_name, self._default
+        _, validate, convert_to_xml = self._converters
+
         def set_attr_value(obj, value):
-            if value is None or value == self._default:
-                if self._clark_name in obj.attrib:
-                    del obj.attrib[self._clark_name]
+            if value is None or value == default:
+                obj.attrib.pop(clark_name, None)
+                note_xml_change()
                 return
-            str_value = self._simple_type.to_xml(value)
-            obj.set(self._clark_name, str_value)
+            if not _unchecked_depth.value:
+                validate(value)
+            obj.set(clark_name, convert_to_xml(value))
         return set_attr_value
 
 
@@ -211,14 +267,17 @@ class RequiredAttribute(BaseAttribute):
         Return a function object suitable for the "get" side of the attribute
         property descriptor.
         """
+        clark_name, attr_name = self._clark_name, self._attr_name
+        from_xml = self._converters[0]
+
         def get_attr_value(obj):
-            attr_str_value = obj.get(self._clark_name)
+            attr_str_value = obj.get(clark_name)
             if attr_str_value is None:
                 raise InvalidXmlError(
                     "required '%s' attribute not present on element %s" %
-                    (self._attr_name, obj.tag)
+                    (attr_name, obj.tag)
                 )
-            return self._simple_type.from_xml(attr_str_value)
+            return from_xml(attr_str_value)
         get_attr_value.__doc__ = self._docstring
         return get_attr_value
 
@@ -239,9 +298,13 @@ class RequiredAttribute(BaseAttribute):
         Return a function object suitable for the "set" side of the attribute
         property descriptor.
         """
+        clark_name = self._clark_name
+        _, validate, convert_to_xml = self._converters
+
         def set_attr_value(obj, value):
-            str_value = self._simple_type.to_xml(value)
-            obj.set(self._clark_name, str_value)
+            if not _unchecked_depth.value:
+                validate(value)
+            obj.set(clark_name, convert_to_xml(value))
         return set_attr_value
 
 
@@ -689,6 +752,40 @@ class ZeroOrOneChoice(_BaseChildElement):
         return '_remove_%s' % self._prop_name
 
 
+def _changing(name):
+    """
+    Return an override of the ``lxml`` element method *name* that counts
+    the change it makes, with :func:`.note_xml_change`.
+    """
+    method = getattr(etree.ElementBase, name)
+
+    def change(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            note_xml_change()
+
+    change.__name__ = name
+    change.__doc__ = method.__doc__
+    return change
+
+
+def _changing_property(name):
+    """
+    Return an override of the ``lxml`` element property *name* that counts
+    each assignment to it, with :func:`.note_xml_change`.
+    """
+    descriptor = getattr(etree.ElementBase, name)
+
+    def fset(self, value):
+        try:
+            descriptor.__set__(self, value)
+        finally:
+            note_xml_change()
+
+    return property(descriptor.__get__, fset, doc=descriptor.__doc__)
+
+
 class _OxmlElementBase(etree.ElementBase):
     """
     Effective base class for all custom element classes, to add standardized
@@ -699,6 +796,22 @@ class _OxmlElementBase(etree.ElementBase):
 
     __metaclass__ = MetaOxmlElement
 
+    # each method changing an element counts the change, so a digest of the
+    # XML of a part can be cached until one is made
+    __delitem__ = _changing('__delitem__')
+    __setitem__ = _changing('__setitem__')
+    addnext = _changing('addnext')
+    addprevious = _changing('addprevious')
+    append = _changing('append')
+    clear = _changing('clear')
+    extend = _changing('extend')
+    insert = _changing('insert')
+    remove = _changing('remove')
+    replace = _changing('replace')
+    set = _changing('set')
+    tail = _changing_property('tail')
+    text = _changing_property('text')
+
     def __repr__(self):
         return "<%s '<%s>' at 0x%0x>" % (
             self.__class__.__name__, self._nsptag, id(self)
@@ -723,6 +836,17 @@ class _OxmlElementBase(etree.ElementBase):
             self.append(elm)
         return elm
 
+    def insert_elements_before(self, elms, *tagnames):
+        """
+        Insert each element in *elms*, in order, directly before the first
+        child found having a tagname in *tagnames*, or at the end if there
+        is none, in a single splice. Return *elms*.
+        """
+        successor = self.first_child_found_in(*tagnames)
+        idx = len(self) if successor is None else self.index(successor)
+        self[idx:idx] = elms
+        return elms
+
     def remove_all(self, *tagnames):
         """
         Remove all child elements whose tagname (e.g. 'a:p') appears in
@@ -759,3 +883,10 @@ class _OxmlElementBase(etree.ElementBase):
 BaseOxmlElement = MetaOxmlElement(
     'BaseOxmlElement', (etree.ElementBase,), dict(_OxmlElementBase.__dict__)
 )
+
+
+def _no_validation(value):
+    """
+    Stands in for the ``validate()`` method of a simple type that validates
+    in ``to_xml()``.
+    """
@@ -7,7 +7,6 @@ WordprocessingML Package class and related objects
 from __future__ import absolute_import, print_function, unicode_literals
 
 from docx.image.image import Image
-from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.package import OpcPackage
 from docx.opc.packuri import PackURI
 from docx.parts.image import ImagePart
@@ -36,14 +35,12 @@ class Package(OpcPackage):
         """
         Load the image part collection with all the image parts in package.
         """
-        for rel in self.iter_rels():
-            if rel.is_external:
+        for part in self.iter_parts():
+            if not isinstance(part, ImagePart):
                 continue
-            if rel.reltype != RT.IMAGE:
+            if part in self.image_parts:
                 continue
-            if rel.target_part in self.image_parts:
-                continue
-            self.image_parts.append(rel.target_part)
+            self.image_parts.append(part)
 
 
 class ImageParts(object):
@@ -54,6 +51,7 @@ class ImageParts(object):
     def __init__(self):
         super(ImageParts, self).__init__()
         self._image_parts = []
+        self._image_parts_by_sha1 = None
 
     def __contains__(self, item):
         return self._image_parts.__contains__(item)
@@ -66,6 +64,8 @@ class ImageParts(object):
 
     def append(self, item):
         self._image_parts.append(item)
+        if self._image_parts_by_sha1 is not None:
+            self._image_parts_by_sha1.setdefault(item.sha1, item)
 
     def get_or_add_image_part(self, image_descriptor):
         """
@@ -79,6 +79,27 @@ class ImageParts(object):
             return matching_image_part
         return self._add_image_part(image)
 
+    def import_image_part(self, image_part):
+        """
+        Return an |ImagePart| instance containing the same image as
+        *image_part*, an image part of another package, newly created as
+        a copy of it if a matching one is not present in the collection.
+        """
+        matching_image_part = self._get_by_sha1(image_part.sha1)
+        if matching_image_part is not None:
+            return matching_image_part
+        partname = self._next_image_partname(image_part.partname.ext)
+        new_image_part = ImagePart(
+            partname, image_part.content_type, image_part.blob
+        )
+        self.append(new_image_part)
+        return new_image_part
+
+    def remove(self, item):
+        self._image_parts.remove(item)
+        # rebuilt on next use, another part may have the same hash
+        self._image_parts_by_sha1 = None
+
     def _add_image_part(self, image):
         """
         Return an |ImagePart| instance newly created from image and appended
@@ -92,12 +113,15 @@ class ImageParts(object):
     def _get_by_sha1(self, sha1):
         """
         Return the image part in this collection having a SHA1 hash matching
-        *sha1*, or |None| if not found.
+        *sha1*, or |None| if not found. The parts are indexed by hash on
+        first use, so each later lookup takes constant time.
         """
-        for image_part in self._image_parts:
-            if image_part.sha1 == sha1:
-                return image_part
-        return None
+        if self._image_parts_by_sha1 is None:
+            image_parts_by_sha1 = {}
+            for image_part in self._image_parts:
+                image_parts_by_sha1.setdefault(image_part.sha1, image_part)
+            self._image_parts_by_sha1 = image_parts_by_sha1
+        return self._image_parts_by_sha1.get(sha1)
 
     def _next_image_partname(self, ext):
         """
@@ -108,7 +132,7 @@ class ImageParts(object):
         """
         def image_partname(n):
             return PackURI('/word/media/image%d.%s' % (n, ext))
-        used_numbers = [image_part.partname.idx for image_part in self]
+        used_numbers = set(image_part.partname.idx for image_part in self)
         for n in range(1, len(self)+1):
             if n not in used_numbers:
                 return image_partname(n)
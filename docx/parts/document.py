@@ -14,8 +14,9 @@ from ..blkcntnr import BlockItemContainer
 from ..enum.section import WD_SECTION
 from ..opc.constants import RELATIONSHIP_TYPE as RT
 from ..opc.package import XmlPart
+from ..oxml import xml_change_count
 from ..section import Section
-from ..shape import InlineShape
+from ..shape import InlineShape, PictureInfo
 from ..shared import lazyproperty, Parented
 
 
@@ -29,6 +30,12 @@ class DocumentPart(XmlPart):
         """
         return self.body.add_paragraph(text, style)
 
+    def add_paragraphs(self, paragraphs):
+        """
+        Return a list of paragraphs newly added to the end of body content.
+        """
+        return self.body.add_paragraphs(paragraphs)
+
     def add_section(self, start_type=WD_SECTION.NEW_PAGE):
         """
         Return a |Section| object representing a new section added at the end
@@ -36,6 +43,7 @@ class DocumentPart(XmlPart):
         """
         new_sectPr = self._element.body.add_section_break()
         new_sectPr.start_type = start_type
+        self.invalidate_body_indexes()
         return Section(new_sectPr)
 
     def add_table(self, rows, cols):
@@ -52,6 +60,13 @@ class DocumentPart(XmlPart):
         """
         return _Body(self._element.body, self)
 
+    def find_all(self, pattern):
+        """
+        Return a list of ``(paragraph, match)`` 2-tuples, one for each match
+        of *pattern* in the text of the paragraphs in body content.
+        """
+        return self.body.find_all(pattern)
+
     def get_or_add_image_part(self, image_descriptor):
         """
         Return an ``(image_part, rId)`` 2-tuple for the image identified by
@@ -73,6 +88,16 @@ class DocumentPart(XmlPart):
         """
         return InlineShapes(self._element.body, self)
 
+    def invalidate_body_indexes(self):
+        """
+        Discard what is cached about the structure of body content, such as
+        where its sections and inline shapes are, to be found again on next
+        use. Called after changing body content in a way that may change it.
+        """
+        self.body._invalidate_block_items()
+        self.inline_shapes._invalidate()
+        self.sections._invalidate()
+
     @property
     def next_id(self):
         """
@@ -89,12 +114,20 @@ class DocumentPart(XmlPart):
     @property
     def paragraphs(self):
         """
-        A list of |Paragraph| instances corresponding to the paragraphs in
-        the document, in document order. Note that paragraphs within revision
-        marks such as inserted or deleted do not appear in this list.
+        A sequence of |Paragraph| instances corresponding to the paragraphs
+        in the document, in document order. Note that paragraphs within
+        revision marks such as inserted or deleted do not appear in it.
         """
         return self.body.paragraphs
 
+    def replace(self, mapping):
+        """
+        Replace each occurrence of each key of *mapping* in the text of the
+        paragraphs in body content with its value, returning the number of
+        replacements made.
+        """
+        return self.body.replace(mapping)
+
     @lazyproperty
     def sections(self):
         """
@@ -105,9 +138,9 @@ class DocumentPart(XmlPart):
     @property
     def tables(self):
         """
-        A list of |Table| instances corresponding to the tables in the
+        A sequence of |Table| instances corresponding to the tables in the
         document, in document order. Note that tables within revision marks
-        such as ``<w:ins>`` or ``<w:del>`` do not appear in this list.
+        such as ``<w:ins>`` or ``<w:del>`` do not appear in it.
         """
         return self.body.tables
 
@@ -128,17 +161,25 @@ class _Body(BlockItemContainer):
         preserved.
         """
         self._body.clear_content()
+        self.part.invalidate_body_indexes()
         return self
 
 
 class InlineShapes(Parented):
     """
     Sequence of |InlineShape| instances, supporting len(), iteration, and
-    indexed access.
+    indexed access. The inline shapes are found once and cached, so indexed
+    access in a loop takes no search of the body. The cache is refreshed
+    once any element has been changed since it was filled (see
+    :func:`.xml_change_count`), however the change was made, and adding
+    a picture or section, clearing body content or appending a document
+    through this API refreshes it too.
     """
     def __init__(self, body_elm, parent):
         super(InlineShapes, self).__init__(parent)
         self._body = body_elm
+        self._inline_lst_cache = None
+        self._change_count = None
 
     def __getitem__(self, idx):
         """
@@ -168,34 +209,95 @@ class InlineShapes(Parented):
         shape_id = self.part.next_id
         r = run._r
         picture = InlineShape.new_picture(r, image_part, rId, shape_id)
+        self._invalidate()
         return picture
 
+    def picture_info(self):
+        """
+        Return a list of |PictureInfo| objects, one for each inline shape in
+        the document in document order, each reporting the rId and image
+        part of the picture it contains, if any, and its display size. All
+        are gathered in a single pass, which makes auditing the images in
+        a large document much faster than querying each shape in turn.
+        """
+        related_parts = self.part.related_parts
+        picture_info = []
+        for inline in self._inline_lst:
+            rIds = inline.xpath(
+                './a:graphic/a:graphicData/pic:pic/pic:blipFill/a:blip/'
+                '@r:embed'
+            )
+            rId = rIds[0] if rIds else None
+            extent = inline.extent
+            picture_info.append(PictureInfo(
+                InlineShape(inline), rId, related_parts.get(rId), extent.cx,
+                extent.cy
+            ))
+        return picture_info
+
+    def _invalidate(self):
+        """
+        Discard the cached list of ``<wp:inline>`` elements, to be found
+        again on next use.
+        """
+        self._inline_lst_cache = None
+
     @property
     def _inline_lst(self):
-        body = self._body
-        xpath = '//w:p/w:r/w:drawing/wp:inline'
-        return body.xpath(xpath)
+        """
+        The ``<wp:inline>`` element of each inline shape in the body, found
+        again when the cache was invalidated or an element has been changed
+        since it was filled.
+        """
+        inline_lst, change_count = self._inline_lst_cache, xml_change_count()
+        if inline_lst is None or change_count != self._change_count:
+            inline_lst = self._inline_lst_cache = self._body.xpath(
+                './/w:p/w:r/w:drawing/wp:inline'
+            )
+            self._change_count = change_count
+        return inline_lst
 
 
 class Sections(Sequence):
     """
     Sequence of |Section| objects corresponding to the sections in the
-    document. Supports ``len()``, iteration, and indexed access.
+    document. Supports ``len()``, iteration, and indexed access. The
+    sections are found once and cached, so indexed access in a loop takes
+    constant time; adding a section or clearing body content through this
+    API refreshes the cache.
     """
     def __init__(self, document_elm):
         super(Sections, self).__init__()
         self._document_elm = document_elm
+        self._sectPr_lst_cache = None
 
     def __getitem__(self, key):
         if isinstance(key, slice):
-            sectPr_lst = self._document_elm.sectPr_lst[key]
+            sectPr_lst = self._sectPr_lst[key]
             return [Section(sectPr) for sectPr in sectPr_lst]
-        sectPr = self._document_elm.sectPr_lst[key]
+        sectPr = self._sectPr_lst[key]
         return Section(sectPr)
 
     def __iter__(self):
-        for sectPr in self._document_elm.sectPr_lst:
+        for sectPr in self._sectPr_lst:
             yield Section(sectPr)
 
     def __len__(self):
-        return len(self._document_elm.sectPr_lst)
+        return len(self._sectPr_lst)
+
+    def _invalidate(self):
+        """
+        Discard the cached list of ``<w:sectPr>`` elements, to be found again
+        on next use.
+        """
+        self._sectPr_lst_cache = None
+
+    @property
+    def _sectPr_lst(self):
+        """
+        The ``<w:sectPr>`` element of each section in the document, found on
+        first use after the cache was last invalidated.
+        """
+        if self._sectPr_lst_cache is None:
+            self._sectPr_lst_cache = self._document_elm.sectPr_lst
+        return self._sectPr_lst_cache
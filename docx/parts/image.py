@@ -8,8 +8,6 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
-import hashlib
-
 from docx.image.image import Image
 from docx.opc.package import Part
 from docx.shared import Emu, Inches
@@ -86,4 +84,4 @@ class ImagePart(Part):
         """
         SHA1 hash digest of the blob of this image part.
         """
-        return hashlib.sha1(self._blob).hexdigest()
+        return self.digest()
@@ -19,6 +19,8 @@ class InlineShape(object):
     Proxy for an ``<wp:inline>`` element, representing the container for an
     inline graphical object.
     """
+    __slots__ = ('_inline', '__weakref__')
+
     def __init__(self, inline):
         super(InlineShape, self).__init__()
         self._inline = inline
@@ -86,3 +88,24 @@ class InlineShape(object):
         assert isinstance(cx, int)
         assert 0 < cx
         self._inline.extent.cx = cx
+
+
+class PictureInfo(object):
+    """
+    Value object reporting the picture in one inline shape, as produced by
+    :meth:`InlineShapes.picture_info`. *rId* and *image_part* are |None|
+    when the shape contains no embedded picture, such as for a chart.
+    """
+    __slots__ = ('shape', 'rId', 'image_part', 'width', 'height')
+
+    def __init__(self, shape, rId, image_part, width, height):
+        self.shape = shape
+        self.rId = rId
+        self.image_part = image_part
+        self.width = width
+        self.height = height
+
+    def __repr__(self):
+        return 'PictureInfo(%r, %r, %r, %r)' % (
+            self.rId, self.image_part, self.width, self.height
+        )
@@ -20,9 +20,6 @@ class Length(int):
     _EMUS_PER_PX = 12700
     _EMUS_PER_TWIP = 635
 
-    def __new__(cls, emu):
-        return int.__new__(cls, emu)
-
     @property
     def cm(self):
         """
@@ -134,24 +131,44 @@ class Twips(Length):
         return Length.__new__(cls, emu)
 
 
-def lazyproperty(f):
+class lazyproperty(object):
     """
-    @lazyprop decorator. Decorated method will be called only on first access
-    to calculate a cached property value. After that, the cached value is
-    returned.
+    @lazyproperty decorator. Decorated method will be called only on first
+    access to calculate a cached property value. After that, the cached
+    value is returned. The value is cached in the attribute named for the
+    property with a leading underscore, e.g. '_foobar' for 'foobar'. A class
+    defining ``__slots__`` declares that name as one of its slots, so the
+    value is held in the slot rather than in an instance ``__dict__``;
+    a |TypeError| is raised on first access if it doesn't.
     """
-    cache_attr_name = '_%s' % f.__name__  # like '_foobar' for prop 'foobar'
-    docstring = f.__doc__
+    def __init__(self, fget):
+        super(lazyproperty, self).__init__()
+        self._fget = fget
+        self._cache_attr_name = '_%s' % fget.__name__
+        self.__doc__ = fget.__doc__
 
-    def get_prop_value(obj):
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        cache_attr_name = self._cache_attr_name
         try:
             return getattr(obj, cache_attr_name)
         except AttributeError:
-            value = f(obj)
+            pass
+        value = self._fget(obj)
+        try:
             setattr(obj, cache_attr_name, value)
-            return value
+        except AttributeError:
+            raise TypeError(
+                "%s has no slot '%s' to cache lazyproperty '%s' in" % (
+                    type(obj).__name__, cache_attr_name,
+                    self._fget.__name__
+                )
+            )
+        return value
 
-    return property(get_prop_value, doc=docstring)
+    def __set__(self, obj, value):
+        raise AttributeError("can't set attribute")
 
 
 def write_only_property(f):
@@ -171,6 +188,8 @@ class Parented(object):
     such as add or drop a relationship. Provides ``self._parent`` attribute
     to subclasses.
     """
+    __slots__ = ('_parent', '__weakref__')
+
     def __init__(self, parent):
         super(Parented, self).__init__()
         self._parent = parent
@@ -7,6 +7,7 @@ The |Table| object and related proxy classes.
 from __future__ import absolute_import, print_function, unicode_literals
 
 from .blkcntnr import BlockItemContainer
+from .compat import is_string, Unicode
 from .shared import lazyproperty, Parented, write_only_property
 
 
@@ -14,6 +15,8 @@ class Table(Parented):
     """
     Proxy class for a WordprocessingML ``<w:tbl>`` element.
     """
+    __slots__ = ('_tbl', '_columns', '_rows')
+
     def __init__(self, tbl, parent):
         super(Table, self).__init__(parent)
         self._tbl = tbl
@@ -67,6 +70,14 @@ class Table(Parented):
         """
         return _Columns(self._tbl, self)
 
+    def fill_column(self, col_idx, values):
+        """
+        Set the text of the cells of the column at *col_idx* to each of
+        *values* in turn, starting from the top row, as by
+        :meth:`set_values`.
+        """
+        self.set_values([[value] for value in values], (0, col_idx))
+
     @lazyproperty
     def rows(self):
         """
@@ -74,6 +85,38 @@ class Table(Parented):
         """
         return _Rows(self._tbl, self)
 
+    def set_values(self, matrix, start=(0, 0)):
+        """
+        Set the text of a block of cells in this table to the values in
+        *matrix*, a sequence of rows, each a sequence of values. The first
+        value of the first row goes to the cell at *start*, a ``(row_idx,
+        col_idx)`` 2-tuple, as :meth:`cell` would locate it. Each cell is set
+        as by assigning to its ``text`` property, a value that is not a
+        string being converted to one, and |None| leaving the cell empty.
+        All the new cell content is built in a single pass, so this is much
+        faster than setting cells one at a time. Raises |IndexError|, with
+        no cell changed, if *matrix* extends beyond the table.
+        """
+        row_idx, col_idx = start
+        tr_lst = self._tbl.tr_lst
+        cells = []
+        for row_offset, values in enumerate(matrix):
+            try:
+                tc_lst = tr_lst[row_idx + row_offset].tc_lst
+            except IndexError:
+                msg = "row index [%d] out of range" % (row_idx + row_offset)
+                raise IndexError(msg)
+            for col_offset, value in enumerate(values):
+                try:
+                    tc = tc_lst[col_idx + col_offset]
+                except IndexError:
+                    msg = "cell index [%d] is out of range" % (
+                        col_idx + col_offset
+                    )
+                    raise IndexError(msg)
+                cells.append((tc, _text(value)))
+        self._tbl.set_cell_texts(cells)
+
     @property
     def style(self):
         """
@@ -87,6 +130,47 @@ class Table(Parented):
     def style(self, value):
         self._tblPr.style = value
 
+    def to_array(self):
+        """
+        Return a two-dimensional NumPy array of the text of the cells of
+        this table, as :meth:`to_records` would. Requires NumPy.
+        """
+        # NumPy is not a dependency of this package
+        import numpy
+        return numpy.array(self._tbl.text_grid(), dtype=object)
+
+    def to_columns(self):
+        """
+        Return a list containing, for each grid column of this table, a list
+        of the text of its cells, top to bottom. See :meth:`to_records`.
+        """
+        return [list(column) for column in zip(*self._tbl.text_grid())]
+
+    def to_dataframe(self, header=True):
+        """
+        Return a pandas ``DataFrame`` of the text of the cells of this
+        table, as :meth:`to_records` would, the first row providing the
+        column labels when *header* is |True|. Requires pandas.
+        """
+        # pandas is not a dependency of this package
+        import pandas
+        records = self.to_records()
+        if header and records:
+            return pandas.DataFrame(records[1:], columns=records[0])
+        return pandas.DataFrame(records)
+
+    def to_records(self):
+        """
+        Return a list containing, for each row of this table, a tuple of the
+        text of its cell at each grid column, the text of a cell being that
+        of its paragraphs separated by ``'\\n'``. A merged cell has its
+        text at each grid column and in each row it spans, so every tuple
+        has the same length. The text is read in a single pass over the XML,
+        without creating a |_Cell| object for each cell, which makes this
+        much faster than iterating over :attr:`rows` for a large table.
+        """
+        return [tuple(row) for row in self._tbl.text_grid()]
+
     @property
     def _tblPr(self):
         return self._tbl.tblPr
@@ -96,6 +180,8 @@ class _Cell(BlockItemContainer):
     """
     Table cell
     """
+    __slots__ = ('_tc',)
+
     def __init__(self, tc, parent):
         super(_Cell, self).__init__(tc, parent)
         self._tc = tc
@@ -128,16 +214,16 @@ class _Cell(BlockItemContainer):
     @property
     def paragraphs(self):
         """
-        List of paragraphs in the cell. A table cell is required to contain
-        at least one block-level element and end with a paragraph. By
-        default, a new cell contains a single paragraph. Read-only
+        Sequence of paragraphs in the cell. A table cell is required to
+        contain at least one block-level element and end with a paragraph.
+        By default, a new cell contains a single paragraph. Read-only
         """
         return super(_Cell, self).paragraphs
 
     @property
     def tables(self):
         """
-        List of tables in the cell, in the order they appear. Read-only.
+        Sequence of tables in the cell, in the order they appear. Read-only.
         """
         return super(_Cell, self).tables
 
@@ -169,6 +255,8 @@ class _Column(Parented):
     """
     Table column
     """
+    __slots__ = ('_gridCol', '_tbl', '_cells')
+
     def __init__(self, gridCol, tbl, parent):
         super(_Column, self).__init__(parent)
         self._gridCol = gridCol
@@ -200,6 +288,8 @@ class _ColumnCells(Parented):
     Sequence of |_Cell| instances corresponding to the cells in a table
     column.
     """
+    __slots__ = ('_tbl', '_gridCol')
+
     def __init__(self, tbl, gridCol, parent):
         super(_ColumnCells, self).__init__(parent)
         self._tbl = tbl
@@ -240,6 +330,8 @@ class _Columns(Parented):
     Sequence of |_Column| instances corresponding to the columns in a table.
     Supports ``len()``, iteration and indexed access.
     """
+    __slots__ = ('_tbl',)
+
     def __init__(self, tbl, parent):
         super(_Columns, self).__init__(parent)
         self._tbl = tbl
@@ -276,6 +368,8 @@ class _Row(Parented):
     """
     Table row
     """
+    __slots__ = ('_tr', '_cells')
+
     def __init__(self, tr, parent):
         super(_Row, self).__init__(parent)
         self._tr = tr
@@ -293,6 +387,8 @@ class _RowCells(Parented):
     """
     Sequence of |_Cell| instances corresponding to the cells in a table row.
     """
+    __slots__ = ('_tr',)
+
     def __init__(self, tr, parent):
         super(_RowCells, self).__init__(parent)
         self._tr = tr
@@ -320,6 +416,8 @@ class _Rows(Parented):
     Sequence of |_Row| instances corresponding to the rows in a table.
     Supports ``len()``, iteration and indexed access.
     """
+    __slots__ = ('_tbl',)
+
     def __init__(self, tbl, parent):
         super(_Rows, self).__init__(parent)
         self._tbl = tbl
@@ -340,3 +438,14 @@ class _Rows(Parented):
 
     def __len__(self):
         return len(self._tbl.tr_lst)
+
+
+def _text(value):
+    """
+    Return *value* as cell text, |None| being the empty string.
+    """
+    if value is None:
+        return ''
+    if not is_string(value):
+        value = Unicode(value)
+    return value
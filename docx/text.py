@@ -59,6 +59,8 @@ class Paragraph(Parented):
     """
     Proxy object wrapping ``<w:p>`` element.
     """
+    __slots__ = ('_p',)
+
     def __init__(self, p, parent):
         super(Paragraph, self).__init__(parent)
         self._p = p
@@ -171,6 +173,8 @@ class Run(Parented):
     not specified directly on the run and its effective value is taken from
     the style hierarchy.
     """
+    __slots__ = ('_r',)
+
     def __init__(self, r, parent):
         super(Run, self).__init__(parent)
         self._r = r
@@ -484,6 +488,8 @@ class Text(object):
     """
     Proxy object wrapping ``<w:t>`` element.
     """
+    __slots__ = ('_t', '__weakref__')
+
     def __init__(self, t_elm):
         super(Text, self).__init__()
         self._t = t_elm
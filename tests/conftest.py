@@ -0,0 +1,16 @@
+# encoding: utf-8
+
+"""
+pytest configuration for the unit test suite
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import sys
+
+
+collect_ignore = []
+
+# async/await syntax, used by docx.aio and its tests, is new in Python 3.5
+if sys.version_info < (3, 5):
+    collect_ignore.append('test_aio.py')
@@ -7,23 +7,35 @@ Test suite for docx.opc.package module
 from __future__ import absolute_import
 
 import pytest
+import shutil
 
-from docx.opc.oxml import CT_Relationships
+from io import BytesIO
+from zipfile import ZipFile
+
+from docx.opc.oxml import CT_Relationships, serialize_canonical_xml
 from docx.opc.packuri import PACKAGE_URI, PackURI
 from docx.opc.package import (
     OpcPackage, Part, PartFactory, _Relationship, Relationships,
     Unmarshaller, XmlPart
 )
+from docx.opc.phys_pkg import BlobReference
 from docx.opc.pkgreader import PackageReader
+from docx.opc.pkgwriter import PackageWriter
+from docx.oxml import parse_xml
+from docx.oxml.ns import qn
 from docx.oxml.xmlchemy import BaseOxmlElement
 
 from ..unitutil.cxml import element
+from ..unitutil.file import docx_path
 from ..unitutil.mock import (
     call, class_mock, cls_attr_mock, function_mock, initializer_mock,
     instance_mock, loose_mock, method_mock, Mock, patch, PropertyMock
 )
 
 
+test_docx_path = docx_path('test')
+
+
 class DescribeOpcPackage(object):
 
     def it_can_open_a_pkg_file(self, PackageReader_, PartFactory_,
@@ -34,7 +46,7 @@ class DescribeOpcPackage(object):
         # exercise ---------------------
         pkg = OpcPackage.open(pkg_file)
         # verify -----------------------
-        PackageReader_.from_file.assert_called_once_with(pkg_file)
+        PackageReader_.from_file.assert_called_once_with(pkg_file, False, None)
         Unmarshaller_.unmarshal.assert_called_once_with(pkg_reader, pkg,
                                                         PartFactory_)
         assert isinstance(pkg, OpcPackage)
@@ -110,9 +122,178 @@ class DescribeOpcPackage(object):
         for part in parts_:
             part.before_marshal.assert_called_once_with()
         PackageWriter_.write.assert_called_once_with(
-            pkg_file_, pkg._rels, parts_
+            pkg_file_, pkg._rels, parts_, None, deterministic=False
+        )
+
+    def it_can_save_incrementally_to_another_pkg_file(
+            self, pkg_file_, PackageWriter_, parts, parts_):
+        pkg = OpcPackage()
+        pkg._source_path = test_docx_path
+        pkg.save(pkg_file_, incremental=True)
+        PackageWriter_.write.assert_called_once_with(
+            pkg_file_, pkg._rels, parts_, None, test_docx_path
+        )
+
+    def it_serializes_only_dirty_parts_when_saving_incrementally(
+            self, request):
+        _serialize_ = function_mock(
+            request, 'docx.opc.pkgwriter.PackageWriter._serialize',
+            wraps=PackageWriter._serialize
+        )
+        pkg = OpcPackage.open(test_docx_path)
+        stream = BytesIO()
+        pkg.save(stream, incremental=True)
+        serialized = set(c[0][0] for c in _serialize_.call_args_list)
+        assert serialized == set(p for p in pkg.parts if p.is_dirty)
+        assert serialized < set(pkg.parts)
+        source, zipf = ZipFile(test_docx_path), ZipFile(stream)
+        for part in set(pkg.parts) - serialized:
+            membername = part.partname.membername
+            assert zipf.read(membername) == source.read(membername)
+        zipf.close()
+        source.close()
+
+    def it_can_save_incrementally_in_place(self, tmpdir):
+        path = str(tmpdir.join('in_place.docx'))
+        shutil.copy(test_docx_path, path)
+        pkg = OpcPackage.open(path)
+        pkg.save(path, incremental=True)
+        zipf = ZipFile(path)
+        assert zipf.testzip() is None
+        assert sorted(zipf.namelist()) == sorted(
+            ZipFile(test_docx_path).namelist()
+        )
+        zipf.close()
+        assert tmpdir.listdir() == [tmpdir.join('in_place.docx')]
+
+    def it_can_save_to_a_pkg_dir(self, PackageWriter_, parts, parts_,
+                                 tmpdir):
+        pkg_dir = str(tmpdir.join('expanded'))
+        pkg = OpcPackage()
+        pkg.save(pkg_dir, format='dir')
+        assert tmpdir.join('expanded').check(dir=1)
+        PackageWriter_.write.assert_called_once_with(
+            pkg_dir, pkg._rels, parts_, None, deterministic=False
+        )
+
+    def it_can_round_trip_through_a_pkg_dir(self, tmpdir):
+        pkg_dir = str(tmpdir.join('expanded'))
+        OpcPackage.open(test_docx_path).save(pkg_dir, format='dir')
+        assert tmpdir.join('expanded', '[Content_Types].xml').check()
+        pkg = OpcPackage.open(pkg_dir)
+        partnames = sorted(p.partname for p in pkg.parts)
+        expected = sorted(
+            p.partname for p in OpcPackage.open(test_docx_path).parts
+        )
+        assert partnames == expected
+
+    def it_raises_on_an_unsupported_save_format(self, pkg_file_):
+        pkg = OpcPackage()
+        with pytest.raises(ValueError):
+            pkg.save(pkg_file_, format='tar')
+        with pytest.raises(ValueError):
+            pkg.save(pkg_file_, format='dir')
+
+    def it_can_save_deterministically(self):
+        def save():
+            stream = BytesIO()
+            OpcPackage.open(test_docx_path).save(stream, deterministic=True)
+            return stream.getvalue()
+        blob = save()
+        assert save() == blob
+        membernames = ZipFile(BytesIO(blob)).namelist()
+        assert membernames[:2] == ['[Content_Types].xml', '_rels/.rels']
+        partnames = [n for n in membernames[2:] if not n.endswith('.rels')]
+        assert partnames == sorted(partnames)
+
+    def it_raises_on_a_deterministic_incremental_save(self, pkg_file_):
+        pkg = OpcPackage()
+        pkg._source_path = test_docx_path
+        with pytest.raises(ValueError):
+            pkg.save(pkg_file_, incremental=True, deterministic=True)
+
+    def it_can_leave_large_binary_blobs_in_the_pkg_file(self):
+        pkg = OpcPackage.open(test_docx_path, blob_threshold=1024)
+        thumbnail = pkg.part_with_partname(PackURI('/docProps/thumbnail.jpeg'))
+        assert isinstance(thumbnail._blob, BlobReference)
+        assert pkg.main_document._element is not None
+        stream = BytesIO()
+        pkg.save(stream)
+        zipf = ZipFile(stream)
+        assert zipf.testzip() is None
+        assert (
+            zipf.read('docProps/thumbnail.jpeg') ==
+            ZipFile(test_docx_path).read('docProps/thumbnail.jpeg') ==
+            thumbnail.blob
+        )
+        zipf.close()
+
+    def it_parses_the_xml_of_a_memory_mapped_pkg_file_as_it_reads_it(self):
+        pkg = OpcPackage.open(test_docx_path, use_mmap=True)
+        expected = OpcPackage.open(test_docx_path)
+        assert (
+            sorted((p.partname, p.blob) for p in pkg.parts) ==
+            sorted((p.partname, p.blob) for p in expected.parts)
         )
 
+    def it_can_save_over_the_pkg_file_its_blobs_are_left_in(self, tmpdir):
+        path = str(tmpdir.join('in_place.docx'))
+        shutil.copy(test_docx_path, path)
+        pkg = OpcPackage.open(path, blob_threshold=1024)
+        pkg.save(path)
+        zipf = ZipFile(path)
+        assert zipf.testzip() is None
+        assert (
+            zipf.read('docProps/thumbnail.jpeg') ==
+            ZipFile(test_docx_path).read('docProps/thumbnail.jpeg')
+        )
+        zipf.close()
+        assert tmpdir.listdir() == [tmpdir.join('in_place.docx')]
+
+    def it_can_find_a_part_by_partname(self):
+        pkg = OpcPackage.open(test_docx_path)
+        partname = PackURI('/word/document.xml')
+        assert pkg.part_with_partname(partname) is pkg.main_document
+        with pytest.raises(KeyError):
+            pkg.part_with_partname(PackURI('/word/foobar.xml'))
+
+    def it_can_find_the_parts_having_a_content_type(self):
+        pkg = OpcPackage.open(test_docx_path)
+        content_type = pkg.main_document.content_type
+        parts = pkg.parts_with_content_type(content_type)
+        assert parts == [pkg.main_document]
+        assert pkg.parts_with_content_type('foo/bar') == []
+
+    def it_keeps_its_part_index_current(self):
+        pkg = OpcPackage.open(test_docx_path)
+        document_part = pkg.main_document
+        part = Part(PackURI('/word/foo.xml'), 'foo/bar', b'foo', pkg)
+        rId = document_part.relate_to(part, 'http://rt-foo')
+        assert pkg.part_with_partname(PackURI('/word/foo.xml')) is part
+        assert pkg.parts_with_content_type('foo/bar') == [part]
+        part.partname = PackURI('/word/bar.xml')
+        assert pkg.part_with_partname(PackURI('/word/bar.xml')) is part
+        with pytest.raises(KeyError):
+            pkg.part_with_partname(PackURI('/word/foo.xml'))
+        document_part.drop_rel(rId)
+        with pytest.raises(KeyError):
+            pkg.part_with_partname(PackURI('/word/bar.xml'))
+
+    def it_can_compute_a_digest_of_its_content(self, tmpdir):
+        pkg = OpcPackage.open(test_docx_path)
+        digest = pkg.content_digest()
+        path = str(tmpdir.join('resaved.docx'))
+        pkg.save(path, deterministic=True)
+        assert OpcPackage.open(path).content_digest() == digest
+        pkg.main_document._element.body.add_p()
+        assert pkg.content_digest() != digest
+
+    def it_raises_on_incremental_save_when_not_opened_from_a_path(
+            self, pkg_file_):
+        pkg = OpcPackage()
+        with pytest.raises(ValueError):
+            pkg.save(pkg_file_, incremental=True)
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -211,6 +392,14 @@ class DescribePart(object):
         )
         assert isinstance(part, Part)
 
+    def it_knows_whether_it_is_dirty(self):
+        part = Part(PackURI('/word/media/image1.png'), None)
+        assert part.is_dirty is True
+        part._loaded_partname = part.partname
+        assert part.is_dirty is False
+        part.partname = PackURI('/word/media/image2.png')
+        assert part.is_dirty is True
+
     def it_knows_its_partname(self, partname_get_fixture):
         part, expected_partname = partname_get_fixture
         assert part.partname == expected_partname
@@ -238,6 +427,24 @@ class DescribePart(object):
         part, load_blob = blob_fixture
         assert part.blob is load_blob
 
+    def it_computes_its_digest_only_once(self):
+        part = Part(None, None, b'foobar', None)
+        digest = part.digest()
+        assert digest == '8843d7f92416211de9ebb963ff4ce28125932878'
+        part._blob = b'barfoo'
+        assert part.digest() == digest
+
+    def it_computes_the_digest_of_xml_content_from_canonical_xml(self):
+        def digest(blob, content_type='application/xml'):
+            return Part(None, content_type, blob, None).digest()
+        xml_part = XmlPart(None, None, parse_xml(b'<a b="1" c="2"/>'), None)
+        assert digest(b'<a c="2"  b="1"/>') == xml_part.digest()
+        assert digest(b'<a c="2"/>', 'image/svg+xml') != xml_part.digest()
+        assert digest(b'<a c="2"/>', 'image/png') == (
+            '13f7e0b9ec4aacdd5acaf37e4a631cfa7a0ffa37'
+        )
+        assert digest(b'<a') == digest(b'<a', 'image/png')
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -711,6 +918,41 @@ class DescribeRelationships(object):
             any_order=True
         )
 
+    def it_composes_rels_xml_in_rId_order(self):
+        rels = Relationships('/baseURI')
+        for rId in ('rId10', 'foo', 'rId2', 'rId1'):
+            rels.add_relationship('http://rt-hyperlink', 'http://x', rId,
+                                  is_external=True)
+        rels_elm = parse_xml(rels.xml)
+        assert [rel.get('Id') for rel in rels_elm] == [
+            'rId1', 'rId2', 'rId10', 'foo'
+        ]
+
+    def it_finds_a_matching_rel_after_others_are_dropped(self, reltype):
+        part_1, part_2 = Mock(name='part_1'), Mock(name='part_2')
+        rels = Relationships(None)
+        rId_1 = rels.get_or_add(reltype, part_1).rId
+        rId_2 = rels.get_or_add(reltype, part_2).rId
+        del rels[rId_1]
+        assert rels.get_or_add(reltype, part_2).rId == rId_2
+        assert rels.get_or_add(reltype, part_1).rId == rId_1
+        assert len(rels) == 2
+
+    def it_indexes_a_remaining_rel_to_the_same_target(self, reltype, url):
+        rels = Relationships(None)
+        rels.add_relationship(reltype, url, 'rId1', is_external=True)
+        rels.add_relationship(reltype, url, 'rId2', is_external=True)
+        del rels['rId1']
+        assert rels.get_or_add_ext_rel(reltype, url) == 'rId2'
+
+    def it_reuses_the_rIds_of_dropped_rels(self, reltype, url):
+        rels = Relationships(None)
+        for n in range(3):
+            rels.get_or_add_ext_rel(reltype, '%s/%d' % (url, n))
+        del rels['rId2']
+        assert rels.get_or_add_ext_rel(reltype, url) == 'rId2'
+        assert rels.get_or_add_ext_rel(reltype, url + '/new') == 'rId4'
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -811,6 +1053,8 @@ class DescribeUnmarshaller(object):
             ]
         )
         assert parts == parts_dict_
+        for partname, part in parts.items():
+            assert part._loaded_partname is partname
 
     def it_can_unmarshal_relationships(self):
         # test data --------------------
@@ -873,8 +1117,8 @@ class DescribeUnmarshaller(object):
 
     @pytest.fixture
     def parts_(self, request):
-        part_ = instance_mock(request, Part, name='part_')
-        part_2_ = instance_mock(request, Part, name='part_2')
+        part_ = instance_mock(request, Part, name='part_', spec_set=False)
+        part_2_ = instance_mock(request, Part, name='part_2', spec_set=False)
         return part_, part_2_
 
     @pytest.fixture
@@ -934,6 +1178,16 @@ class DescribeXmlPart(object):
         )
         assert isinstance(part, XmlPart)
 
+    def it_parses_a_blob_reference_chunk_by_chunk(self):
+        class Blob(BlobReference):
+            def iter_chunks(self):
+                return iter([b'<w:p xmlns:w="http://schemas.openxmlformat',
+                             b's.org/wordprocessingml/2006/main"/>'])
+
+        part = XmlPart.load(None, None, Blob(80), None)
+
+        assert part._element.tag == qn('w:p')
+
     def it_can_serialize_to_xml(self, blob_fixture):
         xml_part, element_, serialize_part_xml_ = blob_fixture
         blob = xml_part.blob
@@ -944,6 +1198,47 @@ class DescribeXmlPart(object):
         xml_part = part_fixture
         assert xml_part.part is xml_part
 
+    def it_computes_its_digest_from_canonical_xml(self):
+        def digest(cxml):
+            return XmlPart(None, None, element(cxml), None).digest()
+        assert digest('w:p{w:a=1,w:b=2}') == digest('w:p{w:b=2,w:a=1}')
+        assert digest('w:p{w:a=1}') != digest('w:p{w:a=2}')
+
+    def it_computes_its_digest_afresh_after_a_change(self):
+        xml_part = XmlPart(None, None, element('w:p'), None)
+        digest = xml_part.digest()
+        xml_part._element.append(element('w:r'))
+        assert xml_part.digest() != digest
+
+    def it_sees_a_change_made_anywhere_in_its_xml(self):
+        xml_part = XmlPart(
+            None, None, element('w:p/(w:bookmarkStart,w:r/w:t)'), None
+        )
+        bookmarkStart, t = xml_part._element[0], xml_part._element[1][0]
+        digests = set([xml_part.digest()])
+        bookmarkStart.set(qn('w:id'), '1')
+        digests.add(xml_part.digest())
+        t.text = 'foo'
+        digests.add(xml_part.digest())
+        t.tail = 'bar'
+        digests.add(xml_part.digest())
+        del bookmarkStart.getparent()[1]
+        digests.add(xml_part.digest())
+        assert len(digests) == 5
+
+    def it_caches_its_digest_until_its_xml_changes(self, request):
+        serialize_canonical_xml_ = function_mock(
+            request, 'docx.opc.package.serialize_canonical_xml',
+            wraps=serialize_canonical_xml
+        )
+        xml_part = XmlPart(None, None, element('w:p'), None)
+        digest = xml_part.digest()
+        assert xml_part.digest() == digest
+        assert serialize_canonical_xml_.call_count == 1
+        xml_part._element.append(element('w:r'))
+        assert xml_part.digest() != digest
+        assert serialize_canonical_xml_.call_count == 2
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
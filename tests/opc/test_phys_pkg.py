@@ -13,23 +13,32 @@ except ImportError:
 
 import hashlib
 import pytest
+import sys
+import zlib
 
-from zipfile import ZIP_DEFLATED, ZipFile
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 from docx.opc.exceptions import PackageNotFoundError
 from docx.opc.packuri import PACKAGE_URI, PackURI
 from docx.opc.phys_pkg import (
-    _DirPkgReader, PhysPkgReader, PhysPkgWriter, _ZipPkgReader, _ZipPkgWriter
+    BlobReference, _DirPkgReader, _DirPkgWriter, _MmapZipPkgReader,
+    PhysPkgReader, DETERMINISTIC_DATE_TIME, PhysPkgWriter, _ZipPkgReader,
+    _ZipPkgWriter
 )
 
 from ..unitutil.file import absjoin, test_file_dir
-from ..unitutil.mock import class_mock, loose_mock, Mock
+from ..unitutil.mock import class_mock, loose_mock, Mock, var_mock
 
 
 test_docx_path = absjoin(test_file_dir, 'test.docx')
 dir_pkg_path = absjoin(test_file_dir, 'expanded_docx')
 zip_pkg_path = test_docx_path
 
+# a memory map can only be read as a zip file from Python 3 on
+requires_mmap = pytest.mark.skipif(
+    sys.version_info < (3, 0), reason='memory-mapped zip needs Python 3'
+)
+
 
 class DescribeDirPkgReader(object):
 
@@ -56,6 +65,13 @@ class DescribeDirPkgReader(object):
         sha1 = hashlib.sha1(rels_xml).hexdigest()
         assert sha1 == 'ebacdddb3e7843fdd54c2f00bc831551b26ac823'
 
+    def it_can_refer_to_the_blob_for_a_pack_uri(self, dir_reader):
+        pack_uri = PackURI('/word/document.xml')
+        blob_ref = dir_reader.blob_reference_for(pack_uri)
+        assert isinstance(blob_ref, BlobReference)
+        assert len(blob_ref) == dir_reader.member_size(pack_uri)
+        assert blob_ref.read() == dir_reader.blob_for(pack_uri)
+
     def it_returns_none_when_part_has_no_rels_xml(self, dir_reader):
         partname = PackURI('/ppt/viewProps.xml')
         rels_xml = dir_reader.rels_xml_for(partname)
@@ -72,6 +88,53 @@ class DescribeDirPkgReader(object):
         return _DirPkgReader(dir_pkg_path)
 
 
+class DescribeDirPkgWriter(object):
+
+    def it_is_used_by_PhysPkgWriter_when_pkg_is_a_dir(self, tmpdir):
+        phys_writer = PhysPkgWriter(str(tmpdir))
+        assert isinstance(phys_writer, _DirPkgWriter)
+
+    def it_can_write_a_blob(self, tmpdir):
+        pack_uri = PackURI('/part/name.xml')
+        blob = b'<BlobbityFooBlob/>'
+        dir_writer = _DirPkgWriter(str(tmpdir))
+        dir_writer.write(pack_uri, blob)
+        dir_writer.close()
+        assert tmpdir.join('part', 'name.xml').read_binary() == blob
+
+    def it_can_write_a_prepared_member(self, tmpdir):
+        pack_uri = PackURI('/part/name.xml')
+        blob = b'<BlobbityFooBlob/>'
+        dir_writer = _DirPkgWriter(str(tmpdir))
+        dir_writer.write_member(dir_writer.prepare_member(pack_uri, blob))
+        assert tmpdir.join('part', 'name.xml').read_binary() == blob
+
+    def it_can_write_a_blob_reference(self, tmpdir):
+        pack_uri = PackURI('/docProps/thumbnail.jpeg')
+        zip_reader = _ZipPkgReader(zip_pkg_path)
+        dir_writer = _DirPkgWriter(str(tmpdir))
+        dir_writer.write(pack_uri, zip_reader.blob_reference_for(pack_uri))
+        assert (
+            tmpdir.join('docProps', 'thumbnail.jpeg').read_binary() ==
+            zip_reader.blob_for(pack_uri)
+        )
+        zip_reader.close()
+
+    def it_writes_what_DirPkgReader_reads(self, tmpdir):
+        zip_reader = _ZipPkgReader(zip_pkg_path)
+        dir_writer = _DirPkgWriter(str(tmpdir))
+        for membername in zip_reader._zipf.namelist():
+            pack_uri = PackURI('/%s' % membername)
+            dir_writer.write(pack_uri, zip_reader.blob_for(pack_uri))
+        dir_reader = _DirPkgReader(str(tmpdir))
+        assert dir_reader.content_types_xml == zip_reader.content_types_xml
+        assert (
+            dir_reader.rels_xml_for(PACKAGE_URI) ==
+            zip_reader.rels_xml_for(PACKAGE_URI)
+        )
+        zip_reader.close()
+
+
 class DescribePhysPkgReader(object):
 
     def it_raises_when_pkg_path_is_not_a_package(self):
@@ -123,6 +186,53 @@ class DescribeZipPkgReader(object):
         rels_xml = phys_reader.rels_xml_for(partname)
         assert rels_xml is None
 
+    def it_can_refer_to_the_blob_for_a_pack_uri(self, phys_reader):
+        pack_uri = PackURI('/docProps/thumbnail.jpeg')
+        blob = phys_reader.blob_for(pack_uri)
+        blob_ref = phys_reader.blob_reference_for(pack_uri)
+        assert len(blob_ref) == phys_reader.member_size(pack_uri) == 13032
+        assert blob_ref.crc32() == zlib.crc32(blob) & 0xffffffff
+        assert b''.join(blob_ref.iter_chunks()) == blob
+        assert blob_ref.read() == blob
+
+    def it_spills_the_blob_to_refer_to_when_pkg_is_a_stream(self):
+        pack_uri = PackURI('/docProps/thumbnail.jpeg')
+        with open(zip_pkg_path, 'rb') as f:
+            phys_reader = _ZipPkgReader(BytesIO(f.read()))
+        blob_ref = phys_reader.blob_reference_for(pack_uri)
+        blob = phys_reader.blob_for(pack_uri)
+        phys_reader.close()
+        assert len(blob_ref) == 13032
+        assert blob_ref.read() == blob
+
+    def it_can_retrieve_the_member_for_a_pack_uri(self, phys_reader):
+        member = phys_reader.member_for(PackURI('/word/document.xml'))
+        zinfo = member.zinfo
+        assert zinfo.filename == 'word/document.xml'
+        assert zinfo.compress_type == ZIP_DEFLATED
+        assert isinstance(member.data, BlobReference)
+        assert len(member.data) == zinfo.file_size
+        sha1 = hashlib.sha1(member.data.read()).hexdigest()
+        assert sha1 == 'b9b4a98bcac7c5a162825b60c3db7df11e02ac5f'
+
+    def it_can_retrieve_members_from_several_threads_at_once(self):
+        from multiprocessing.pool import ThreadPool
+        with open(zip_pkg_path, 'rb') as f:
+            phys_reader = _ZipPkgReader(BytesIO(f.read()))
+        membernames = phys_reader._zipf.namelist() * 20
+        pool = ThreadPool(8)
+        try:
+            blobs = pool.map(
+                lambda name: phys_reader.member_for(PackURI('/' + name)).data,
+                membernames
+            )
+        finally:
+            pool.close()
+            pool.join()
+        expected = [phys_reader._zipf.read(name) for name in membernames]
+        phys_reader.close()
+        assert blobs == expected
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture(scope='class')
@@ -136,6 +246,88 @@ class DescribeZipPkgReader(object):
         return loose_mock(request)
 
 
+class DescribeMmapZipPkgReader(object):
+
+    def it_knows_which_pkg_files_it_can_map(self):
+        can_map = sys.version_info >= (3, 0)
+        assert _MmapZipPkgReader.can_map(zip_pkg_path) is can_map
+        assert _MmapZipPkgReader.can_map(dir_pkg_path) is False
+        assert _MmapZipPkgReader.can_map(BytesIO()) is False
+
+    @requires_mmap
+    def it_can_retrieve_the_blob_for_a_deflated_member(self, phys_reader):
+        pack_uri = PackURI('/word/document.xml')
+        blob = phys_reader.blob_for(pack_uri)
+        sha1 = hashlib.sha1(blob).hexdigest()
+        assert sha1 == 'b9b4a98bcac7c5a162825b60c3db7df11e02ac5f'
+
+    @requires_mmap
+    def it_serves_a_stored_member_without_copying(self, stored_pkg_path):
+        phys_reader = _MmapZipPkgReader(stored_pkg_path)
+        blob = phys_reader.blob_for(PackURI('/part/name.xml'))
+        phys_reader.close()
+        assert isinstance(blob, memoryview)
+        assert blob.tobytes() == b'<BlobbityFooBlob/>'
+
+    @requires_mmap
+    def it_can_refer_to_a_deflated_member(self, request, phys_reader):
+        var_mock(request, 'docx.opc.phys_pkg.BLOB_CHUNK_SIZE', new=1000)
+        pack_uri = PackURI('/word/document.xml')
+        blob_ref = phys_reader.blob_reference_for(pack_uri)
+        chunks = list(blob_ref.iter_chunks())
+        blob = phys_reader.blob_for(pack_uri)
+        assert max(len(chunk) for chunk in chunks) <= 1000
+        assert b''.join(chunks) == blob
+        assert blob_ref.read() == blob
+        assert blob_ref.crc32() == zlib.crc32(blob) & 0xffffffff
+
+    @requires_mmap
+    def it_can_refer_to_a_stored_member(self, stored_pkg_path):
+        phys_reader = _MmapZipPkgReader(stored_pkg_path)
+        blob_ref = phys_reader.blob_reference_for(PackURI('/part/name.xml'))
+        phys_reader.close()
+        assert list(blob_ref.iter_chunks()) == [b'<BlobbityFooBlob/>']
+        assert blob_ref.read() == b'<BlobbityFooBlob/>'
+
+    @requires_mmap
+    def it_closes_the_mapping_when_closed(self, stored_pkg_path):
+        phys_reader = _MmapZipPkgReader(zip_pkg_path)
+        phys_reader.close()
+        assert phys_reader._mmap.closed
+        phys_reader = _MmapZipPkgReader(stored_pkg_path)
+        blob = phys_reader.blob_for(PackURI('/part/name.xml'))
+        phys_reader.close()
+        assert not phys_reader._mmap.closed
+        assert blob.tobytes() == b'<BlobbityFooBlob/>'
+
+    @requires_mmap
+    def it_raises_KeyError_when_member_is_not_present(self, phys_reader):
+        with pytest.raises(KeyError):
+            phys_reader.blob_for(PackURI('/foo/bar.xml'))
+
+    @requires_mmap
+    def it_returns_none_when_part_has_no_rels_xml(self, phys_reader):
+        partname = PackURI('/ppt/viewProps.xml')
+        rels_xml = phys_reader.rels_xml_for(partname)
+        assert rels_xml is None
+
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture(scope='class')
+    def phys_reader(self, request):
+        phys_reader = _MmapZipPkgReader(zip_pkg_path)
+        request.addfinalizer(phys_reader.close)
+        return phys_reader
+
+    @pytest.fixture
+    def stored_pkg_path(self, tmpdir):
+        path = str(tmpdir.join('stored.zip'))
+        zipf = ZipFile(path, 'w', compression=ZIP_STORED)
+        zipf.writestr('part/name.xml', b'<BlobbityFooBlob/>')
+        zipf.close()
+        return path
+
+
 class DescribeZipPkgWriter(object):
 
     def it_is_used_by_PhysPkgWriter_unconditionally(self, tmp_docx_path):
@@ -174,8 +366,98 @@ class DescribeZipPkgWriter(object):
         retrieved_blob_sha1 = hashlib.sha1(retrieved_blob).hexdigest()
         assert retrieved_blob_sha1 == written_blob_sha1
 
+    def it_can_write_a_prepared_member(self, pkg_file):
+        # setup ------------------------
+        blobs = [
+            (PackURI('/part/name.xml'), b'<BlobbityFooBlob/>' * 100),
+            (PackURI('/part/other.xml'), b'<Other/>'),
+        ]
+        # exercise ---------------------
+        pkg_writer = PhysPkgWriter(pkg_file)
+        for pack_uri, blob in blobs:
+            member = pkg_writer.prepare_member(pack_uri, blob)
+            pkg_writer.write_member(member)
+        pkg_writer.close()
+        # verify -----------------------
+        zipf = ZipFile(pkg_file, 'r')
+        assert zipf.testzip() is None
+        for pack_uri, blob in blobs:
+            zinfo = zipf.getinfo(pack_uri.membername)
+            assert zinfo.compress_type == ZIP_DEFLATED
+            assert zipf.read(pack_uri.membername) == blob
+        zipf.close()
+
+    def it_can_write_members_with_a_fixed_timestamp(self, pkg_file):
+        pkg_writer = PhysPkgWriter(pkg_file, deterministic=True)
+        pkg_writer.write(PackURI('/part/name.xml'), b'<Foo/>')
+        pkg_writer.write_member(pkg_writer.prepare_member(
+            PackURI('/part/other.xml'), b'<Bar/>'
+        ))
+        pkg_writer.close()
+        zipf = ZipFile(pkg_file, 'r')
+        assert zipf.testzip() is None
+        for zinfo in zipf.infolist():
+            assert zinfo.date_time == DETERMINISTIC_DATE_TIME
+            assert zinfo.compress_type == ZIP_DEFLATED
+        zipf.close()
+
+    def it_can_stream_a_blob_reference(self, pkg_file):
+        pack_uri = PackURI('/docProps/thumbnail.jpeg')
+        zip_reader = _ZipPkgReader(zip_pkg_path)
+        blob_ref = zip_reader.blob_reference_for(pack_uri)
+        pkg_writer = PhysPkgWriter(pkg_file)
+        pkg_writer.write(pack_uri, blob_ref)
+        pkg_writer.write_member(pkg_writer.prepare_member(
+            PackURI('/docProps/copy.jpeg'), blob_ref
+        ))
+        pkg_writer.close()
+        zipf = ZipFile(pkg_file, 'r')
+        assert zipf.testzip() is None
+        assert zipf.read('docProps/thumbnail.jpeg') == blob_ref.read()
+        assert zipf.read('docProps/copy.jpeg') == blob_ref.read()
+        zipf.close()
+        zip_reader.close()
+
+    def it_can_copy_members_from_a_source(self, pkg_file, tmpdir, mappable):
+        # setup ------------------------
+        source_path = str(tmpdir.join('source.zip'))
+        zipf = ZipFile(source_path, 'w', compression=ZIP_STORED)
+        zipf.writestr('part/name.xml', b'<BlobbityFooBlob/>')
+        zipf.writestr('part/other.xml', b'<Other/>')
+        zipf.close()
+        # exercise ---------------------
+        pkg_writer = PhysPkgWriter(pkg_file)
+        pkg_writer.reuse_members_from(source_path)
+        reader_cls = _MmapZipPkgReader if mappable else _ZipPkgReader
+        assert type(pkg_writer._source) is reader_cls
+        pkg_writer.write_member(
+            pkg_writer.source_member(PackURI('/part/name.xml'))
+        )
+        pkg_writer.write(PackURI('/part/other.xml'), b'<Changed/>')
+        with pytest.raises(KeyError):
+            pkg_writer.source_member(PackURI('/part/missing.xml'))
+        pkg_writer.close()
+        # verify -----------------------
+        zipf = ZipFile(pkg_file, 'r')
+        assert zipf.testzip() is None
+        assert zipf.getinfo('part/name.xml').compress_type == ZIP_STORED
+        assert zipf.getinfo('part/other.xml').compress_type == ZIP_DEFLATED
+        assert zipf.read('part/name.xml') == b'<BlobbityFooBlob/>'
+        assert zipf.read('part/other.xml') == b'<Changed/>'
+        zipf.close()
+
     # fixtures ---------------------------------------------
 
+    # the source is memory-mapped only where a map can be read
+    @pytest.fixture(params=sorted(set([False, sys.version_info >= (3,)])))
+    def mappable(self, request):
+        if not request.param:
+            var_mock(
+                request, 'docx.opc.phys_pkg._MmapZipPkgReader.can_map',
+                new=staticmethod(lambda pkg_file: False)
+            )
+        return request.param
+
     @pytest.fixture
     def pkg_file(self, request):
         pkg_file = BytesIO()
@@ -48,6 +48,21 @@ class DescribePackageReader(object):
         init.assert_called_once_with(content_types, pkg_srels, sparts)
         assert isinstance(pkg_reader, PackageReader)
 
+    def it_can_construct_from_a_memory_mapped_pkg_file(
+            self, init, PhysPkgReader_, _MmapZipPkgReader_, from_xml,
+            _srels_for, _load_serialized_parts):
+        phys_reader = _MmapZipPkgReader_.return_value
+        _MmapZipPkgReader_.can_map.return_value = True
+        pkg_file = Mock(name='pkg_file')
+
+        PackageReader.from_file(pkg_file, use_mmap=True)
+
+        _MmapZipPkgReader_.can_map.assert_called_once_with(pkg_file)
+        _MmapZipPkgReader_.assert_called_once_with(pkg_file)
+        assert PhysPkgReader_.call_count == 0
+        from_xml.assert_called_once_with(phys_reader.content_types_xml)
+        phys_reader.close.assert_called_once_with()
+
     def it_can_iterate_over_the_serialized_parts(self, iter_sparts_fixture):
         pkg_reader, expected_iter_spart_items = iter_sparts_fixture
         iter_spart_items = list(pkg_reader.iter_sparts())
@@ -206,6 +221,10 @@ class DescribePackageReader(object):
     def _load_serialized_parts(self, request):
         return method_mock(request, PackageReader, '_load_serialized_parts')
 
+    @pytest.fixture
+    def _MmapZipPkgReader_(self, request):
+        return class_mock(request, 'docx.opc.pkgreader._MmapZipPkgReader')
+
     @pytest.fixture
     def partnames_(self, request):
         partname_ = loose_mock(request, spec=str, name='partname_')
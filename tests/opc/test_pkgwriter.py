@@ -32,9 +32,9 @@ class DescribePackageWriter(object):
         expected_calls = [
             call._write_content_types_stream(phys_writer, parts),
             call._write_pkg_rels(phys_writer, pkg_rels),
-            call._write_parts(phys_writer, parts),
+            call._write_parts(phys_writer, parts, False),
         ]
-        PhysPkgWriter_.assert_called_once_with(pkg_file)
+        PhysPkgWriter_.assert_called_once_with(pkg_file, False)
         assert _write_methods.mock_calls == expected_calls
         phys_writer.close.assert_called_once_with()
 
@@ -75,6 +75,55 @@ class DescribePackageWriter(object):
         ]
         assert phys_writer.write.mock_calls == expected_calls
 
+    def it_copies_the_members_of_clean_parts_from_the_source(self):
+        phys_writer = Mock(name='phys_writer')
+        clean = Mock(name='clean', _rels=[], is_dirty=False)
+        dirty = Mock(name='dirty', _rels=[], is_dirty=True)
+
+        PackageWriter._write_parts(phys_writer, [clean, dirty], True)
+
+        phys_writer.source_member.assert_called_once_with(clean.partname)
+        phys_writer.write_member.assert_called_once_with(
+            phys_writer.source_member.return_value
+        )
+        phys_writer.write.assert_called_once_with(dirty.partname, dirty.blob)
+
+    def it_copies_clean_parts_from_the_source_concurrently_too(self):
+        phys_writer = Mock(name='phys_writer')
+        phys_writer.prepare_member.side_effect = lambda uri, blob: blob
+        phys_writer.source_member.side_effect = lambda uri: uri
+        parts = [
+            Mock(name='part%d' % n, _rels=[], is_dirty=bool(n % 2))
+            for n in range(6)
+        ]
+
+        PackageWriter._write_parts_concurrently(phys_writer, parts, 3, True)
+
+        assert phys_writer.write_member.mock_calls == [
+            call(part.blob if part.is_dirty else part.partname)
+            for part in parts
+        ]
+
+    def it_can_write_parts_concurrently(self):
+        # mockery ----------------------
+        phys_writer = Mock(name='phys_writer')
+        phys_writer.prepare_member.side_effect = lambda uri, blob: blob
+        rels = MagicMock(name='rels')
+        rels.__len__.return_value = 1
+        parts = [
+            Mock(name='part%d' % n, _rels=rels if n % 2 else [])
+            for n in range(6)
+        ]
+        # exercise ---------------------
+        PackageWriter._write_parts_concurrently(phys_writer, parts, 3)
+        # verify -----------------------
+        expected_calls = []
+        for part in parts:
+            expected_calls.append(call(part.blob))
+            if part._rels:
+                expected_calls.append(call(part._rels.xml))
+        assert phys_writer.write_member.mock_calls == expected_calls
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
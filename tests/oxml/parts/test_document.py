@@ -8,6 +8,8 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import pytest
 
+from docx.oxml.ns import qn
+
 from ...unitutil.cxml import element, xml
 
 
@@ -24,8 +26,43 @@ class DescribeCT_Body(object):
         assert body.xml == expected_xml
         assert sectPr is body.get_or_add_sectPr()
 
+    def it_knows_the_sectPr_of_each_section(self):
+        body = element(
+            'w:body/('
+            '  w:p/w:pPr/w:sectPr/w:type{w:val=a},'
+            '  w:p/w:pPr/w:sectPrChange/w:sectPr,'
+            '  w:tbl,'
+            '  w:p/(w:pPr/w:sectPr/w:type{w:val=b},w:r),'
+            '  w:p/w:r,'
+            '  w:sectPr/w:type{w:val=c}'
+            ')'
+        )
+        start_types = [
+            sectPr[0].get(qn('w:val')) for sectPr in body.sectPr_lst
+        ]
+        assert start_types == ['a', 'b', 'c']
+
+    def it_adds_block_items_before_its_sectPr(self, add_block_fixture):
+        body, expected_xml = add_block_fixture
+        body.add_p()
+        body.add_tbl()
+        assert body.xml == expected_xml
+
     # fixtures -------------------------------------------------------
 
+    @pytest.fixture(params=[
+        ('w:body',
+         'w:body/(w:p,w:tbl/(w:tblPr/w:tblW{w:type=auto,w:w=0},w:tblGrid))'),
+        ('w:body/(w:p,w:sectPr)',
+         'w:body/(w:p,w:p,w:tbl/(w:tblPr/w:tblW{w:type=auto,w:w=0},'
+         'w:tblGrid),w:sectPr)'),
+    ])
+    def add_block_fixture(self, request):
+        before_cxml, after_cxml = request.param
+        body = element(before_cxml)
+        expected_xml = xml(after_cxml)
+        return body, expected_xml
+
     @pytest.fixture(params=[
         ('w:body',                 'w:body'),
         ('w:body/w:p',             'w:body'),
@@ -7,15 +7,20 @@ Test suite for pptx.oxml.__init__.py module, primarily XML parser-related.
 from __future__ import print_function, unicode_literals
 
 import pytest
+import threading
+import time
 
 from lxml import etree
 
 from docx.oxml import (
-    OxmlElement, oxml_parser, parse_xml, register_element_cls
+    OxmlElement, oxml_parser, parse_xml, parse_xml_chunks,
+    register_element_cls
 )
 from docx.oxml.ns import qn
 from docx.oxml.shared import BaseOxmlElement
 
+from ..unitutil.mock import var_mock
+
 
 class DescribeOxmlElement(object):
 
@@ -87,8 +92,46 @@ class DescribeParseXml(object):
         element = parse_xml(xml_bytes)
         assert isinstance(element, CustElmCls)
 
+    def it_can_parse_xml_fed_in_chunks(self, xml_bytes):
+        register_element_cls('a:foo', CustElmCls)
+        chunks = [xml_bytes[i:i+7] for i in range(0, len(xml_bytes), 7)]
+        element = parse_xml_chunks(iter(chunks))
+        assert isinstance(element, CustElmCls)
+        assert etree.tostring(element) == etree.tostring(parse_xml(xml_bytes))
+
+    def it_registers_the_element_classes_once_across_threads(
+            self, registration_fixture):
+        registered, finished = registration_fixture
+
+        def parse():
+            parse_xml('<foo/>')
+            finished.append(len(registered))
+
+        threads = [threading.Thread(target=parse) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert registered == [True]
+        assert finished == [1] * 8
+
     # fixture components ---------------------------------------------
 
+    @pytest.fixture
+    def registration_fixture(self, request):
+        registered, finished = [], []
+
+        def register_all_element_classes():
+            time.sleep(0.05)
+            registered.append(True)
+
+        var_mock(request, 'docx.oxml._element_classes_registered', new=False)
+        var_mock(
+            request, 'docx.oxml._register_all_element_classes',
+            new=register_all_element_classes
+        )
+        return registered, finished
+
     @pytest.fixture
     def xml_bytes(self):
         return (
@@ -106,7 +149,7 @@ class DescribeRegisterElementCls(object):
         register_element_cls('a:foo', CustElmCls)
         foo = parse_xml(xml_text)
         assert type(foo) is CustElmCls
-        assert type(foo.find(qn('a:bar'))) is etree._Element
+        assert type(foo.find(qn('a:bar'))) is BaseOxmlElement
 
     # fixture components ---------------------------------------------
 
@@ -8,6 +8,9 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import pytest
 
+from docx.oxml.table import _tc_text
+from docx.oxml.text import run_content_text, sym_text, TextMap
+
 from ..unitutil.cxml import element, xml
 
 
@@ -31,3 +34,101 @@ class DescribeCT_R(object):
         r = element(initial_cxml)
         expected_xml = xml(expected_cxml)
         return r, text, expected_xml
+
+
+class DescribeTextMap(object):
+
+    def it_maps_the_text_of_the_runs_in_a_paragraph(self):
+        p = element(
+            'w:p/(w:pPr,w:r/(w:rPr,w:t"foo",w:tab),w:r/w:t,w:r/(w:br,w:t"b'
+            'ar"),w:hyperlink/w:r/w:t"baz")'
+        )
+        assert TextMap(p).text == 'foo\t\nbar'
+
+    def it_can_replace_a_span_of_its_text(self, replace_fixture):
+        p, spans, expected_xml = replace_fixture
+        text_map = TextMap(p)
+        for start, end, text in spans:
+            text_map.replace(start, end, text)
+        assert p.xml == expected_xml
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('w:p/w:r/w:t"a{x}b"', [(1, 4, 'foo')],
+         'w:p/w:r/w:t"afoob"'),
+        ('w:p/(w:r/(w:rPr/w:b,w:t"a{"),w:r/w:t"x",w:r/w:t"}b")',
+         [(1, 4, 'foo')],
+         'w:p/(w:r/(w:rPr/w:b,w:t"afoo"),w:r,w:r/w:t"b")'),
+        ('w:p/(w:r/w:t"{x}",w:r/w:t"{y}")', [(3, 6, 'b'), (0, 3, 'a')],
+         'w:p/(w:r/w:t"a",w:r/w:t"b")'),
+        ('w:p/w:r/w:t"{x}{y}"', [(3, 6, 'b '), (0, 3, 'a')],
+         'w:p/w:r/w:t{xml:space=preserve}"ab "'),
+        ('w:p/w:r/(w:t"a",w:tab,w:t"b")', [(1, 3, 'c')],
+         'w:p/w:r/(w:t"a",w:t"c")'),
+        ('w:p/w:r/(w:tab,w:t"b")', [(0, 1, 'x')],
+         'w:p/w:r/(w:t"x",w:t"b")'),
+        ('w:p/w:r/w:t"a b"', [(0, 2, '')],
+         'w:p/w:r/w:t"b"'),
+        ('w:p/w:r/w:t"a{x}b"', [(1, 4, 42)],
+         'w:p/w:r/w:t"a42b"'),
+        ('w:p/w:r/w:t"a{x}b"', [(1, 4, 'c\td\ne ')],
+         'w:p/w:r/(w:t"ac",w:tab,w:t"d",w:br,w:t"e b")'),
+        ('w:p/w:r/(w:t"a",w:tab,w:t"b")', [(1, 2, '\t\t')],
+         'w:p/w:r/(w:t"a",w:tab,w:tab,w:t"b")'),
+        ('w:p/w:r/w:t"{x}{y}"', [(3, 6, '\tb'), (0, 3, 'a\n')],
+         'w:p/w:r/(w:t"a",w:br,w:tab,w:t"b")'),
+    ])
+    def replace_fixture(self, request):
+        p_cxml, spans, expected_cxml = request.param
+        return element(p_cxml), spans, xml(expected_cxml)
+
+
+class DescribeRunContentText(object):
+
+    def it_knows_the_text_a_run_content_element_contributes(
+            self, text_fixture):
+        child, expected_text = text_fixture
+        assert run_content_text(child) == expected_text
+
+    def it_is_shared_by_everything_reading_run_text(self):
+        tc = element(
+            'w:tc/w:p/w:r/(w:rPr,w:t"a",w:tab,w:sym{w:char=F04A},w:cr)'
+        )
+        p = tc[0]
+        assert p[0].text == 'a\t\n'
+        assert TextMap(p).text == p[0].text
+        assert _tc_text(tc) == 'a\t\uf04a\n'
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('w:t"foo"',                            'foo'),
+        ('w:t',                                 ''),
+        ('w:tab',                               '\t'),
+        ('w:br',                                '\n'),
+        ('w:cr',                                '\n'),
+        ('w:sym{w:font=Wingdings,w:char=F04A}', ''),
+        ('w:rPr',                               ''),
+    ])
+    def text_fixture(self, request):
+        cxml, expected_text = request.param
+        return element(cxml), expected_text
+
+
+class DescribeSymText(object):
+
+    def it_knows_the_character_a_sym_element_specifies(self, sym_fixture):
+        sym, expected_text = sym_fixture
+        assert sym_text(sym) == expected_text
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('w:sym{w:font=Wingdings,w:char=F04A}', '\uf04a'),
+        ('w:sym{w:char=zz}',                    ''),
+        ('w:sym',                               ''),
+    ])
+    def sym_fixture(self, request):
+        cxml, expected_text = request.param
+        return element(cxml), expected_text
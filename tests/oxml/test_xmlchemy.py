@@ -7,6 +7,7 @@ Test suite for docx.oxml.xmlchemy
 from __future__ import absolute_import, print_function, unicode_literals
 
 import pytest
+import threading
 
 from docx.compat import Unicode
 from docx.oxml import parse_xml, register_element_cls
@@ -15,7 +16,7 @@ from docx.oxml.ns import qn
 from docx.oxml.simpletypes import BaseIntType
 from docx.oxml.xmlchemy import (
     BaseOxmlElement, Choice, serialize_for_reading, OneOrMore, OneAndOnlyOne,
-    OptionalAttribute, RequiredAttribute, ZeroOrMore, ZeroOrOne,
+    OptionalAttribute, RequiredAttribute, unchecked, ZeroOrMore, ZeroOrOne,
     ZeroOrOneChoice, XmlString
 )
 
@@ -36,6 +37,12 @@ class DescribeBaseOxmlElement(object):
         element.insert_element_before(child, *tagnames)
         assert element.xml == expected_xml
 
+    def it_can_insert_elements_before_named_successors(
+            self, insert_elms_fixture):
+        element, children, tagnames, expected_xml = insert_elms_fixture
+        element.insert_elements_before(children, *tagnames)
+        assert element.xml == expected_xml
+
     def it_can_remove_all_children_with_name_in_sequence(
             self, remove_fixture):
         element, tagnames, expected_xml = remove_fixture
@@ -76,6 +83,23 @@ class DescribeBaseOxmlElement(object):
         expected_xml = self.rPr_bldr(after).xml()
         return element, child, tagnames, expected_xml
 
+    @pytest.fixture(params=[
+        ('u',  'bi', 'u',  'biu'),
+        ('',   'bi', 'u',  'bi'),
+        ('bu', 'ii', 'u',  'biiu'),
+        ('b',  'iu', 'iu', 'biu'),
+    ])
+    def insert_elms_fixture(self, request):
+        present, new, successors, after = request.param
+        element = self.rPr_bldr(present).element
+        children = [
+            {'b': a_b(), 'i': an_i(), 'u': a_u()}[char].with_nsdecls()
+            .element for char in new
+        ]
+        tagnames = self.nsptags(successors)
+        expected_xml = self.rPr_bldr(after).xml()
+        return element, children, tagnames, expected_xml
+
     @pytest.fixture(params=[
         ('biu', 'b', 'iu'), ('biu', 'bi', 'u'), ('bbiiuu',  'i',   'bbuu'),
         ('biu', 'i', 'bu'), ('biu', 'bu', 'i'), ('bbiiuu',   '', 'bbiiuu'),
@@ -476,6 +500,33 @@ class DescribeRequiredAttribute(object):
         with pytest.raises(expected_exception):
             parent.reqAttr = value
 
+    def it_skips_validation_on_assign_when_unchecked(self):
+        parent = a_parent().with_nsdecls().with_reqAttr(1).element
+        with unchecked():
+            parent.reqAttr = -4
+        assert parent.get('reqAttr') == '-4'
+        with pytest.raises(ValueError):
+            parent.reqAttr = -4
+
+    def it_still_validates_on_other_threads_when_unchecked(self):
+        parent = a_parent().with_nsdecls().with_reqAttr(1).element
+        errors = []
+
+        def assign():
+            try:
+                parent.reqAttr = -4
+            except ValueError as e:
+                errors.append(e)
+
+        with unchecked():
+            with unchecked():
+                thread = threading.Thread(target=assign)
+                thread.start()
+                thread.join()
+            parent.reqAttr = -5
+        assert len(errors) == 1
+        assert parent.get('reqAttr') == '-5'
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -8,7 +8,10 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import pytest
 
+from copy import deepcopy
+
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml.ns import qn
 from docx.oxml.parts.document import CT_Body, CT_Document
 from docx.oxml.section import CT_SectPr
 from docx.oxml.text import CT_R
@@ -66,11 +69,19 @@ class DescribeDocumentPart(object):
         body_.add_paragraph.assert_called_once_with('', None)
         assert p is p_
 
-    def it_can_add_a_section(self, add_section_fixture):
+    def it_can_add_many_paragraphs_at_once(self, add_paragraphs_fixture):
+        document_part, paragraphs, body_, p_lst_ = add_paragraphs_fixture
+        p_lst = document_part.add_paragraphs(paragraphs)
+        body_.add_paragraphs.assert_called_once_with(paragraphs)
+        assert p_lst is p_lst_
+
+    def it_can_add_a_section(
+            self, add_section_fixture, invalidate_body_indexes_):
         (document_part, start_type_, body_elm_, new_sectPr_, Section_,
          section_) = add_section_fixture
         section = document_part.add_section(start_type_)
         body_elm_.add_section_break.assert_called_once_with()
+        invalidate_body_indexes_.assert_called_once_with()
         assert new_sectPr_.start_type == start_type_
         Section_.assert_called_once_with(new_sectPr_)
         assert section is section_
@@ -93,6 +104,19 @@ class DescribeDocumentPart(object):
         assert image_part is image_part_
         assert rId == rId_
 
+    def it_can_find_all_matches_of_a_pattern(
+            self, document_part_body_, body_):
+        document_part = DocumentPart(None, None, None, None)
+        found = document_part.find_all('foo')
+        body_.find_all.assert_called_once_with('foo')
+        assert found is body_.find_all.return_value
+
+    def it_can_replace_text(self, document_part_body_, body_):
+        document_part = DocumentPart(None, None, None, None)
+        count = document_part.replace({'foo': 'bar'})
+        body_.replace.assert_called_once_with({'foo': 'bar'})
+        assert count is body_.replace.return_value
+
     def it_knows_the_next_available_xml_id(self, next_id_fixture):
         document, expected_id = next_id_fixture
         assert document.next_id == expected_id
@@ -104,6 +128,13 @@ class DescribeDocumentPart(object):
         document_part = DocumentPart(None, None, None, None)
         return document_part, body_, p_
 
+    @pytest.fixture
+    def add_paragraphs_fixture(self, document_part_body_, body_):
+        document_part = DocumentPart(None, None, None, None)
+        paragraphs = [('foo', 'Heading1'), 'bar']
+        p_lst_ = body_.add_paragraphs.return_value
+        return document_part, paragraphs, body_, p_lst_
+
     @pytest.fixture
     def add_section_fixture(
             self, document_elm_, start_type_, body_elm_, sectPr_, Section_,
@@ -230,6 +261,10 @@ class DescribeDocumentPart(object):
     def InlineShapes_(self, request):
         return class_mock(request, 'docx.parts.document.InlineShapes')
 
+    @pytest.fixture
+    def invalidate_body_indexes_(self, request):
+        return method_mock(request, DocumentPart, 'invalidate_body_indexes')
+
     @pytest.fixture
     def p_(self, request):
         return instance_mock(request, Paragraph)
@@ -298,9 +333,10 @@ class Describe_Body(object):
         assert isinstance(table, Table)
 
     def it_can_clear_itself_of_all_content_it_holds(self, clear_fixture):
-        body, expected_xml = clear_fixture
+        body, expected_xml, document_part_ = clear_fixture
         _body = body.clear_content()
         assert body._body.xml == expected_xml
+        document_part_.invalidate_body_indexes.assert_called_once_with()
         assert _body is body
 
     def it_provides_access_to_the_paragraphs_it_contains(
@@ -356,9 +392,11 @@ class Describe_Body(object):
     ])
     def clear_fixture(self, request):
         before_cxml, after_cxml = request.param
-        body = _Body(element(before_cxml), None)
+        document_part_ = instance_mock(request, DocumentPart)
+        document_part_.part = document_part_
+        body = _Body(element(before_cxml), document_part_)
         expected_xml = xml(after_cxml)
-        return body, expected_xml
+        return body, expected_xml, document_part_
 
     @pytest.fixture
     def paragraphs_fixture(self):
@@ -417,8 +455,66 @@ class DescribeInlineShapes(object):
         InlineShape_.new_picture.assert_called_once_with(
             r_, image_part_, rId_, shape_id_
         )
+        assert inline_shapes._inline_lst_cache is None
         assert picture_shape is new_picture_shape_
 
+    def it_only_finds_inline_shapes_in_the_body(self):
+        document = element(
+            'w:document/(w:p/w:r/w:drawing/wp:inline,w:body/w:tbl/w:tr/w:tc'
+            '/w:p/w:r/w:drawing/wp:inline)'
+        )
+        inline_shapes = InlineShapes(document[1], None)
+        assert len(inline_shapes) == 1
+
+    def it_caches_the_inline_shapes(self, inline_shapes_fixture):
+        inline_shapes, inline_shape_count = inline_shapes_fixture
+        inline_lst = inline_shapes._inline_lst
+        assert len(inline_shapes) == inline_shape_count
+        assert inline_shapes._inline_lst is inline_lst
+
+    def it_finds_the_inline_shapes_again_when_one_is_removed(
+            self, inline_shapes_fixture):
+        inline_shapes, inline_shape_count = inline_shapes_fixture
+        assert len(inline_shapes) == inline_shape_count
+        paragraph = Paragraph(inline_shapes._body[0], None)
+        paragraph.runs[0].text = 'foo'
+        assert len(inline_shapes) == inline_shape_count - 1
+        paragraph.clear()
+        assert len(inline_shapes) == 0
+
+    def it_finds_the_inline_shapes_again_after_any_change(
+            self, inline_shapes_fixture):
+        inline_shapes, inline_shape_count = inline_shapes_fixture
+        assert len(inline_shapes) == inline_shape_count
+        inline_shapes._body.append(deepcopy(inline_shapes._body[0]))
+        assert len(inline_shapes) == inline_shape_count * 2
+
+    def it_finds_the_inline_shapes_again_when_invalidated(
+            self, inline_shapes_fixture):
+        inline_shapes, inline_shape_count = inline_shapes_fixture
+        assert len(inline_shapes) == inline_shape_count
+        inline_shapes._body.append(element('w:p/w:r/w:drawing/wp:inline'))
+        inline_shapes._invalidate()
+        assert len(inline_shapes) == inline_shape_count + 1
+
+    def it_can_report_the_picture_in_each_shape(self, request):
+        body = element(
+            'w:body/w:p/(w:r/w:drawing/wp:inline/(wp:extent{cx=1,cy=2},'
+            'a:graphic/a:graphicData/pic:pic/pic:blipFill/a:blip),w:r/w:dr'
+            'awing/wp:inline/(wp:extent{cx=3,cy=4},a:graphic/a:graphicData))'
+        )
+        body.xpath('.//a:blip')[0].set(qn('r:embed'), 'rId7')
+        document_ = instance_mock(request, DocumentPart)
+        document_.related_parts = {'rId7': 'image_part'}
+        inline_shapes = InlineShapes(body, None)
+        property_mock(request, InlineShapes, 'part', return_value=document_)
+        picture_info = inline_shapes.picture_info()
+        assert [
+            (info.rId, info.image_part, info.width, info.height)
+            for info in picture_info
+        ] == [('rId7', 'image_part', 1, 2), (None, None, 3, 4)]
+        assert isinstance(picture_info[0].shape, InlineShape)
+
     def it_knows_the_part_it_belongs_to(self, inline_shapes_with_parent_):
         inline_shapes, parent_ = inline_shapes_with_parent_
         part = inline_shapes.part
@@ -519,6 +615,14 @@ class DescribeSections(object):
         for index in indicies:
             assert isinstance(sections[index], Section)
 
+    def it_caches_the_sections_until_invalidated(self, document_elm):
+        sections = Sections(document_elm)
+        assert len(sections) == 2
+        document_elm.body.add_section_break()
+        assert len(sections) == 2
+        sections._invalidate()
+        assert len(sections) == 3
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -0,0 +1,135 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.aio module
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import asyncio
+import pytest
+
+from io import BytesIO
+from zipfile import ZipFile
+
+from docx.aio import _spool, CHUNK_SIZE, open_document, save_document
+from docx.api import Document
+from docx.opc.phys_pkg import DETERMINISTIC_DATE_TIME
+
+from .unitutil.file import docx_path
+from .unitutil.mock import var_mock
+
+
+class DescribeOpenDocument(object):
+
+    def it_can_open_a_document_from_a_path(self):
+        document = run(open_document(docx_path('test')))
+        assert isinstance(document, Document)
+
+    def it_opens_the_default_template_if_no_file_provided(self):
+        document = run(open_document())
+        assert isinstance(document, Document)
+
+    def it_can_open_a_document_from_a_blocking_stream(self):
+        with open(docx_path('test'), 'rb') as f:
+            document = run(open_document(f))
+        assert isinstance(document, Document)
+
+    def it_can_open_a_document_from_an_asyncio_stream(self):
+        async def open_from_stream_reader():
+            reader = asyncio.StreamReader()
+            with open(docx_path('test'), 'rb') as f:
+                reader.feed_data(f.read())
+            reader.feed_eof()
+            return await open_document(reader)
+
+        document = run(open_from_stream_reader())
+        assert isinstance(document, Document)
+
+    def it_spools_a_stream_to_disk_once_it_outgrows_memory(self, request):
+        var_mock(request, 'docx.aio.SPOOL_SIZE', new=1000)
+        with open(docx_path('test'), 'rb') as f:
+            blob = f.read()
+
+        async def spool_stream_reader():
+            reader = asyncio.StreamReader()
+            reader.feed_data(blob)
+            reader.feed_eof()
+            loop = asyncio.get_event_loop()
+            return await _spool(reader, loop, None)
+
+        spool = run(spool_stream_reader())
+        assert spool._rolled
+        assert spool.read() == blob
+
+
+class DescribeSaveDocument(object):
+
+    def it_can_save_a_document_to_a_path(self, document, tmpdir):
+        path = str(tmpdir.join('saved.docx'))
+        run(document.save_async(path))
+        assert ZipFile(path).testzip() is None
+
+    def it_can_save_a_document_to_a_blocking_stream(self, document):
+        stream = BytesIO()
+        run(save_document(document, stream))
+        assert ZipFile(stream).testzip() is None
+
+    def it_drains_an_asyncio_stream_writer_after_each_chunk(self, document):
+        writer = _StreamWriter()
+        run(save_document(document, writer))
+        assert writer.drain_count == len(writer.chunks)
+        assert max(len(chunk) for chunk in writer.chunks) <= CHUNK_SIZE
+        assert ZipFile(BytesIO(b''.join(writer.chunks))).testzip() is None
+
+    def it_passes_save_options_on(self, document):
+        writer, stream = _StreamWriter(), BytesIO()
+        run(save_document(document, writer, deterministic=True))
+        run(document.save_async(stream, deterministic=True))
+        for blob in (b''.join(writer.chunks), stream.getvalue()):
+            zipf = ZipFile(BytesIO(blob))
+            date_times = set(zinfo.date_time for zinfo in zipf.infolist())
+            assert date_times == set([DETERMINISTIC_DATE_TIME])
+
+    def it_stops_the_save_when_the_stream_fails(self, document):
+        class FailingWriter(_StreamWriter):
+            def write(self, data):
+                raise IOError('peer went away')
+
+        with pytest.raises(IOError) as excinfo:
+            run(save_document(document, FailingWriter()))
+        assert str(excinfo.value) == 'peer went away'
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def document(self):
+        document = Document()
+        for idx in range(200):
+            document.add_paragraph('paragraph %d' % idx)
+        return document
+
+
+# helpers ------------------------------------------------------------
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class _StreamWriter(object):
+    """
+    Stands in for an |asyncio.StreamWriter|, recording writes and drains.
+    """
+    def __init__(self):
+        self.chunks = []
+        self.drain_count = 0
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+
+    async def drain(self):
+        self.drain_count += 1
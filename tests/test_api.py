@@ -32,20 +32,20 @@ class DescribeDocument(object):
     def it_opens_a_docx_on_construction(self, init_fixture):
         docx_, open_ = init_fixture
         document = Document(docx_)
-        open_.assert_called_once_with(docx_)
+        open_.assert_called_once_with(docx_, False, None)
         assert isinstance(document, Document)
 
     def it_can_open_a_docx_file(self, open_fixture):
         docx_, Package_, package_, document_part_ = open_fixture
         document_part, package = Document._open(docx_)
-        Package_.open.assert_called_once_with(docx_)
+        Package_.open.assert_called_once_with(docx_, False, None)
         assert document_part is document_part
         assert package is package_
 
     def it_opens_default_template_if_no_file_provided(
             self, Package_, default_docx_):
         Document._open(None)
-        Package_.open.assert_called_once_with(default_docx_)
+        Package_.open.assert_called_once_with(default_docx_, False, None)
 
     def it_should_raise_if_not_a_Word_file(self, Package_, package_, docx_):
         package_.main_document.content_type = 'foobar'
@@ -74,6 +74,22 @@ class DescribeDocument(object):
         document_part_.add_paragraph.assert_called_once_with(text, style)
         assert paragraph is paragraph_
 
+    def it_can_add_many_paragraphs_at_once(self, document, document_part_):
+        paragraphs = [('foo', 'Heading1'), 'bar']
+        paragraph_lst = document.add_paragraphs(paragraphs)
+        document_part_.add_paragraphs.assert_called_once_with(paragraphs)
+        assert paragraph_lst is document_part_.add_paragraphs.return_value
+
+    def it_can_find_all_matches_of_a_pattern(self, document, document_part_):
+        found = document.find_all('foo')
+        document_part_.find_all.assert_called_once_with('foo')
+        assert found is document_part_.find_all.return_value
+
+    def it_can_replace_text(self, document, document_part_):
+        count = document.replace({'foo': 'bar'})
+        document_part_.replace.assert_called_once_with({'foo': 'bar'})
+        assert count is document_part_.replace.return_value
+
     def it_can_add_a_page_break(self, add_page_break_fixture):
         document, document_part_, paragraph_, run_ = add_page_break_fixture
         paragraph = document.add_page_break()
@@ -107,6 +123,11 @@ class DescribeDocument(object):
         assert table.style == expected_style
         assert table == table_
 
+    def it_can_compute_a_digest_of_its_content(self, document, package_):
+        digest = document.content_digest()
+        package_.content_digest.assert_called_once_with()
+        assert digest is package_.content_digest.return_value
+
     def it_provides_access_to_the_document_inline_shapes(self, document):
         body = document.inline_shapes
         assert body is document._document_part.inline_shapes
@@ -129,7 +150,17 @@ class DescribeDocument(object):
     def it_can_save_the_package(self, save_fixture):
         document, package_, file_ = save_fixture
         document.save(file_)
-        package_.save.assert_called_once_with(file_)
+        package_.save.assert_called_once_with(
+            file_, None, False, 'zip', False
+        )
+
+    def it_can_compact_itself_before_saving(self, save_fixture, compact_):
+        document, package_, file_ = save_fixture
+        document.save(file_, compact=True)
+        compact_.assert_called_once_with()
+        package_.save.assert_called_once_with(
+            file_, None, False, 'zip', False
+        )
 
     def it_provides_access_to_the_numbering_part(self, num_part_get_fixture):
         document, document_part_, numbering_part_ = num_part_get_fixture
@@ -249,6 +280,10 @@ class DescribeDocument(object):
             request, Document, 'add_paragraph', return_value=paragraph_
         )
 
+    @pytest.fixture
+    def compact_(self, request):
+        return method_mock(request, Document, 'compact')
+
     @pytest.fixture
     def default_docx_(self, request):
         return var_mock(request, 'docx.api._default_docx_path')
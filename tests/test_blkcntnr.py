@@ -23,6 +23,38 @@ class DescribeBlockItemContainer(object):
         assert blkcntnr._element.xml == expected_xml
         assert isinstance(paragraph, Paragraph)
 
+    def it_can_add_many_paragraphs_at_once(self, add_paragraphs_fixture):
+        blkcntnr, paragraphs, expected_xml = add_paragraphs_fixture
+        paragraph_lst = blkcntnr.add_paragraphs(paragraphs)
+        assert blkcntnr._element.xml == expected_xml
+        assert len(paragraph_lst) == len(paragraphs)
+        for paragraph in paragraph_lst:
+            assert isinstance(paragraph, Paragraph)
+
+    def it_can_find_all_matches_of_a_pattern(self):
+        blkcntnr = BlockItemContainer(element(
+            'w:body/(w:p/(w:r/w:t"{{a",w:r/w:t"}} {{b}}"),w:tbl/w:tr/w:tc/w:p'
+            '/w:r/w:t"{{c}}")'
+        ), None)
+        found = blkcntnr.find_all(r'\{\{(\w+)\}\}')
+        assert [match.group(1) for _, match in found] == ['a', 'b', 'c']
+        assert [match.span() for _, match in found] == [(0, 5), (6, 11),
+                                                        (0, 5)]
+        for paragraph, _ in found:
+            assert isinstance(paragraph, Paragraph)
+        assert found[0][0]._p is found[1][0]._p
+
+    def it_can_replace_text_across_runs(self, replace_fixture):
+        blkcntnr, mapping, expected_count, expected_xml = replace_fixture
+        count = blkcntnr.replace(mapping)
+        assert count == expected_count
+        assert blkcntnr._element.xml == expected_xml
+
+    def it_raises_on_replace_of_the_empty_string(self):
+        blkcntnr = BlockItemContainer(element('w:body/w:p'), None)
+        with pytest.raises(ValueError):
+            blkcntnr.replace({'': 'foo'})
+
     def it_can_add_a_table(self, add_table_fixture):
         blkcntnr, rows, cols, expected_xml = add_table_fixture
         table = blkcntnr.add_table(rows, cols)
@@ -54,6 +86,68 @@ class DescribeBlockItemContainer(object):
             count += 1
         assert count == expected_count
 
+    def it_supports_negative_indices_and_slices(self):
+        blkcntnr = BlockItemContainer(
+            element('w:body/(w:p/w:r/w:t"a",w:tbl,w:p/w:r/w:t"b",w:p)'), None
+        )
+        paragraphs = blkcntnr.paragraphs
+        assert paragraphs[-2].text == 'b'
+        assert [p.text for p in paragraphs[:2]] == ['a', 'b']
+        assert paragraphs[::-1][0] is paragraphs[2]
+        assert blkcntnr.tables[-1]._tbl is blkcntnr._element[1]
+        with pytest.raises(IndexError):
+            paragraphs[3]
+        with pytest.raises(IndexError):
+            paragraphs[-4]
+
+    def it_caches_the_paragraphs_and_tables_it_contains(self):
+        blkcntnr = BlockItemContainer(element('w:body/w:tbl'), None)
+        paragraphs, tables = blkcntnr.paragraphs, blkcntnr.tables
+        assert blkcntnr.paragraphs is paragraphs
+        assert len(paragraphs) == 0
+        paragraph = blkcntnr.add_paragraph()
+        assert len(paragraphs) == 1
+        assert paragraphs[0] is paragraph
+        blkcntnr.add_table(1, 1)
+        assert len(tables) == 2
+        paragraph.insert_paragraph_before()
+        assert len(paragraphs) == 2
+        blkcntnr.add_paragraphs(['foo', 'bar'])
+        assert [p.text for p in paragraphs] == ['', '', 'foo', 'bar']
+
+    def it_keeps_its_cache_when_block_items_are_appended(self):
+        blkcntnr = BlockItemContainer(element('w:body/(w:p,w:sectPr)'), None)
+        paragraph_items = blkcntnr.paragraphs._items
+        table_items = blkcntnr.tables._items
+        blkcntnr.add_table(1, 1)
+        blkcntnr.add_paragraphs(['foo', 'bar'])
+        assert blkcntnr.paragraphs._items is paragraph_items
+        assert blkcntnr.tables._items is table_items
+        assert len(blkcntnr.paragraphs) == 3
+        assert len(blkcntnr.tables) == 1
+
+    def it_refreshes_its_cache_when_its_children_change(self):
+        body = element('w:body/(w:p,w:p,w:p,w:sectPr)')
+        paragraphs = BlockItemContainer(body, None).paragraphs
+        assert len(paragraphs) == 3
+        body.remove(body[1])
+        assert len(paragraphs) == 2
+        Paragraph(body[1], None).insert_paragraph_before('foo')
+        assert [p.text for p in paragraphs] == ['', 'foo', '']
+        body.replace(body[0], element('w:p/w:r/w:t"bar"'))
+        assert paragraphs[0].text == 'bar'
+
+    def it_refreshes_its_cache_when_children_are_reordered_or_replaced(
+            self):
+        body = element('w:body/(w:p/w:r/w:t"a",w:p/w:r/w:t"b",w:p/w:r/w:t"c"'
+                       ',w:sectPr)')
+        paragraphs = BlockItemContainer(body, None).paragraphs
+        assert [p.text for p in paragraphs] == ['a', 'b', 'c']
+        body.insert(1, body[2])
+        assert [p.text for p in paragraphs] == ['a', 'c', 'b']
+        body[1] = element('w:p/w:r/w:t"d"')
+        assert paragraphs[1].text == 'd'
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=[
@@ -72,6 +166,29 @@ class DescribeBlockItemContainer(object):
         expected_xml = xml(after_cxml)
         return blkcntnr, text, style, expected_xml
 
+    @pytest.fixture(params=[
+        ('w:body', [],
+         'w:body'),
+        ('w:body', ['', 'foobar'],
+         'w:body/(w:p,w:p/w:r/w:t"foobar")'),
+        ('w:body/w:sectPr', [('foo', 'Heading1'), ('bar', 'Normal')],
+         'w:body/(w:p/(w:pPr/w:pStyle{w:val=Heading1},w:r/w:t"foo"),w:p/w:r/'
+         'w:t"bar",w:sectPr)'),
+        ('w:body/(w:p,w:sectPr)', ['a\tb', 'c\nd '],
+         'w:body/(w:p,w:p/w:r/(w:t"a",w:tab,w:t"b"),w:p/w:r/(w:t"c",w:br,w:'
+         't{xml:space=preserve}"d "),w:sectPr)'),
+        ('w:body', [('a < b & c', 'Quote')],
+         'w:body/w:p/(w:pPr/w:pStyle{w:val=Quote},w:r/w:t"a &lt; b &amp; c")'),
+        ('w:tc/(w:tcPr,w:p)', ['foo', ('', 'Caption')],
+         'w:tc/(w:tcPr,w:p,w:p/w:r/w:t"foo",w:p/w:pPr/w:pStyle{w:val=Captio'
+         'n})'),
+    ])
+    def add_paragraphs_fixture(self, request):
+        blkcntnr_cxml, paragraphs, after_cxml = request.param
+        blkcntnr = BlockItemContainer(element(blkcntnr_cxml), None)
+        expected_xml = xml(after_cxml)
+        return blkcntnr, paragraphs, expected_xml
+
     @pytest.fixture(params=[
         ('w:body', 0, 0, 'w:body/w:tbl/(w:tblPr/w:tblW{w:type=auto,w:w=0},w:'
          'tblGrid)'),
@@ -88,6 +205,25 @@ class DescribeBlockItemContainer(object):
         expected_xml = xml(after_cxml)
         return blkcntnr, rows, cols, expected_xml
 
+    @pytest.fixture(params=[
+        ('w:body/w:p/w:r/w:t"{x}"', {}, 0,
+         'w:body/w:p/w:r/w:t"{x}"'),
+        ('w:body/w:p/(w:r/(w:rPr/w:b,w:t"{"),w:r/w:t"x}!")', {'{x}': 'foo'},
+         1, 'w:body/w:p/(w:r/(w:rPr/w:b,w:t"foo"),w:r/w:t"!")'),
+        ('w:body/(w:p/w:r/w:t"{x}{xy}{x}",w:tbl/w:tr/w:tc/w:p/w:r/w:t"{xy}'
+         '")', {'{x}': 'a', '{xy}': 'b'}, 4,
+         'w:body/(w:p/w:r/w:t"aba",w:tbl/w:tr/w:tc/w:p/w:r/w:t"b")'),
+        ('w:body/w:p/w:r/w:t"ab"', {'a': 'b', 'b': 'a'}, 2,
+         'w:body/w:p/w:r/w:t"ba"'),
+        ('w:body/w:p/w:r/w:t"{n}:{v}"', {'{n}': 5, '{v}': 'a\tb'}, 2,
+         'w:body/w:p/w:r/(w:t"5:a",w:tab,w:t"b")'),
+    ])
+    def replace_fixture(self, request):
+        blkcntnr_cxml, mapping, expected_count, after_cxml = request.param
+        blkcntnr = BlockItemContainer(element(blkcntnr_cxml), None)
+        expected_xml = xml(after_cxml)
+        return blkcntnr, mapping, expected_count, expected_xml
+
     @pytest.fixture(params=[
         ('w:body',                 0),
         ('w:body/w:p',             1),
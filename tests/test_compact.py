@@ -0,0 +1,102 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.compact module
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import pytest
+
+from io import BytesIO
+from zipfile import ZipFile
+
+from docx.api import Document
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+
+from .unitutil.cxml import element
+from .unitutil.file import test_file
+
+
+class DescribeCompactDocument(object):
+
+    def it_drops_the_styles_nothing_uses(self, document):
+        document.compact()
+        style_ids = document.styles_part._element.xpath(
+            './w:style/@w:styleId'
+        )
+        assert sorted(style_ids) == [
+            'DefaultParagraphFont', 'Heading1', 'Heading1Char',
+            'ListBullet2', 'ListNumber', 'NoList', 'Normal', 'TableNormal',
+        ]
+
+    def it_drops_the_numbering_definitions_nothing_uses(self, document):
+        numbering = document.numbering_part._element
+        document.compact()
+        assert numbering.xpath('./w:num/@w:numId') == ['2', '5']
+        assert numbering.xpath('./w:abstractNum/@w:abstractNumId') == [
+            '6', '7'
+        ]
+
+    def it_drops_images_nothing_refers_to(self, document):
+        picture = document.add_picture(test_file('monty-truth.png'))
+        document.add_picture(test_file('python-icon.png'))
+        p = picture._inline.getparent().getparent().getparent()
+        p.getparent().remove(p)
+        document.compact()
+        assert len(document._package.image_parts) == 1
+        stream = BytesIO()
+        document.save(stream)
+        media = [
+            name for name in ZipFile(stream).namelist()
+            if name.startswith('word/media/')
+        ]
+        assert len(media) == 1
+
+    def it_keeps_images_a_vml_shape_refers_to(self, document):
+        picture = document.add_picture(test_file('monty-truth.png'))
+        rId = picture._inline.graphic.graphicData.pic.blipFill.blip.embed
+        p = picture._inline.getparent().getparent().getparent()
+        p.addnext(parse_xml(
+            '<w:p %s><w:r><w:pict><v:shape><v:imagedata o:relid="%s"/>'
+            '</v:shape></w:pict></w:r></w:p>' % (nsdecls('w', 'v', 'o'), rId)
+        ))
+        p.getparent().remove(p)
+        document.compact()
+        assert len(document._package.image_parts) == 1
+        assert rId in document._document_part.rels
+
+    def it_keeps_a_numbering_definition_missing_its_abstract_one(
+            self, document):
+        numbering = document.numbering_part._element
+        numbering.append(element('w:num{w:numId=99}'))
+        p = document.add_paragraph('qux')._p
+        p.get_or_add_pPr().append(
+            element('w:numPr/(w:ilvl{w:val=0},w:numId{w:val=99})')
+        )
+        document.compact()
+        assert numbering.xpath('./w:num/@w:numId') == ['2', '5', '99']
+
+    def it_drops_unused_hyperlinks_but_keeps_implicit_rels(self, document):
+        rels = document._document_part.rels
+        reltypes = set(rel.reltype for rel in rels.values())
+        document._document_part.relate_to(
+            'http://foo', RT.HYPERLINK, is_external=True
+        )
+        document.compact()
+        assert set(rel.reltype for rel in rels.values()) == reltypes
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def document(self):
+        document = Document()
+        document.add_heading('foo')
+        document.add_paragraph('bar', 'ListNumber')
+        p = document.add_paragraph('baz')._p
+        p.get_or_add_pPr().append(
+            element('w:numPr/(w:ilvl{w:val=0},w:numId{w:val=2})')
+        )
+        return document
@@ -0,0 +1,200 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.composer module
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import pytest
+
+from docx.api import Document
+from docx.composer import compose
+from docx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from docx.opc.package import Part
+from docx.opc.packuri import PackURI
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+
+from .unitutil.cxml import element
+from .unitutil.file import docx_path, test_file
+
+
+class DescribeComposer(object):
+
+    def it_appends_the_body_content_of_another_document(self, documents):
+        document, other = documents
+        assert len(document.paragraphs) == 1
+        document.append_document(other)
+        assert [p.text for p in document.paragraphs] == ['foo', 'bar']
+        body = document._document_part._element.body
+        assert body[-1].tag == qn('w:sectPr')
+        assert len(body.findall(qn('w:sectPr'))) == 1
+        assert [p.text for p in other.paragraphs] == ['bar']
+
+    def it_brings_the_section_breaks_it_contains(self, documents):
+        document, other = documents
+        assert len(document.sections) == 1
+        other.add_section()
+        document.append_document(other)
+        assert len(document.sections) == 2
+
+    def it_reuses_an_image_already_present(self, documents):
+        document, other = documents
+        document.add_picture(test_file('monty-truth.png'))
+        other.add_picture(test_file('monty-truth.png'))
+        document.append_document(other)
+        image_parts = document._package.image_parts
+        assert len(image_parts) == 1
+        rIds = document._document_part._element.xpath('//a:blip/@r:embed')
+        assert len(rIds) == 2
+        related_parts = document._document_part.related_parts
+        assert related_parts[rIds[0]] is related_parts[rIds[1]]
+
+    def it_copies_an_image_not_present(self, documents):
+        document, other = documents
+        document.add_picture(test_file('monty-truth.png'))
+        other.add_picture(test_file('python-icon.png'))
+        document.append_document(other)
+        assert len(document._package.image_parts) == 2
+        rId = document._document_part._element.xpath('//a:blip/@r:embed')[1]
+        image_part = document._document_part.related_parts[rId]
+        with open(test_file('python-icon.png'), 'rb') as f:
+            assert image_part.blob == f.read()
+        shape_ids = document._document_part._element.xpath('//wp:docPr/@id')
+        assert len(set(shape_ids)) == 2
+
+    def it_remaps_the_rIds_of_hyperlinks(self, documents):
+        document, other = documents
+        document._document_part.relate_to(
+            'http://foo', RT.HYPERLINK, is_external=True
+        )
+        rId = other._document_part.relate_to(
+            'http://bar', RT.HYPERLINK, is_external=True
+        )
+        other._document_part._element.body.insert(0, parse_xml(
+            '<w:p %s><w:hyperlink r:id="%s"><w:r><w:t>link</w:t></w:r>'
+            '</w:hyperlink></w:p>' % (nsdecls('w', 'r'), rId)
+        ))
+        document.append_document(other)
+        hyperlink = document._document_part._element.xpath(
+            '//w:hyperlink'
+        )[0]
+        new_rId = hyperlink.get(qn('r:id'))
+        assert document._document_part.target_ref(new_rId) == 'http://bar'
+
+    def it_copies_the_styles_it_uses_that_are_missing(self, documents):
+        document, other = documents
+        styles = document.styles_part._element
+        for style_id in ('Heading1', 'Heading1Char'):
+            styles.remove(styles.style_having_styleId(style_id))
+        other.add_heading('baz')
+        document.append_document(other)
+        style_ids = styles.xpath('./w:style/@w:styleId')
+        assert 'Heading1' in style_ids
+        assert 'Heading1Char' in style_ids
+        assert style_ids.count('Normal') == 1
+        assert document.paragraphs[-1].style == 'Heading1'
+
+    def it_copies_numbering_definitions_under_new_ids(self, documents):
+        document, other = documents
+        numbering = document.numbering_part._element
+        num_count = len(numbering.num_lst)
+        p = other.add_paragraph('item')._p
+        p.get_or_add_pPr().append(
+            element('w:numPr/(w:ilvl{w:val=0},w:numId{w:val=1})')
+        )
+        document.append_document(other)
+        numId = document._document_part._element.xpath('//w:numId/@w:val')
+        assert numId == ['%d' % (num_count + 1)]
+        num = numbering.num_having_numId(num_count + 1)
+        abstractNumId = num.abstractNumId.val
+        abstractNums = numbering.xpath(
+            './w:abstractNum[@w:abstractNumId="%d"]' % abstractNumId
+        )
+        assert len(abstractNums) == 1
+        tags = [child.tag for child in numbering]
+        assert tags.index(qn('w:num')) > tags.index(qn('w:abstractNum'))
+        assert len(numbering.num_lst) == num_count + 1
+
+    def it_remaps_the_ids_in_the_headers_it_brings(self, documents):
+        document, other = documents
+        document.add_picture(test_file('monty-truth.png'))
+        styles = document.styles_part._element
+        styles.remove(styles.style_having_styleId('Heading1'))
+        num_count = len(document.numbering_part._element.num_lst)
+        header = Part(
+            PackURI('/word/header1.xml'), CT.WML_HEADER, (
+                '<w:hdr %s><w:p><w:pPr><w:pStyle w:val="Heading1"/>'
+                '<w:numPr><w:ilvl w:val="0"/><w:numId w:val="1"/></w:numPr>'
+                '</w:pPr><w:r><w:drawing><wp:inline><wp:docPr id="1" nam'
+                'e="x"/></wp:inline></w:drawing></w:r></w:p></w:hdr>'
+                % nsdecls('w', 'wp')
+            ).encode('utf-8'), other._package
+        )
+        rId = other._document_part.relate_to(header, RT.HEADER)
+        other.add_section()
+        sectPr = other._document_part._element.xpath('//w:pPr/w:sectPr')[0]
+        sectPr.insert(0, parse_xml(
+            '<w:headerReference %s w:type="default" r:id="%s"/>'
+            % (nsdecls('w', 'r'), rId)
+        ))
+        document.append_document(other)
+        new_rId = document._document_part._element.xpath(
+            '//w:headerReference/@r:id'
+        )[0]
+        hdr = parse_xml(document._document_part.related_parts[new_rId].blob)
+        assert hdr.xpath('//w:pStyle/@w:val') == ['Heading1']
+        assert styles.style_having_styleId('Heading1') is not None
+        assert hdr.xpath('//w:numId/@w:val') == ['%d' % (num_count + 1)]
+        body_ids = document._document_part._element.xpath('//wp:docPr/@id')
+        assert hdr.xpath('//wp:docPr/@id')[0] not in body_ids
+        assert header.blob.count(b'w:val="Heading1"') == 1
+
+    def it_removes_references_to_notes_and_comments(self, documents):
+        document, other = documents
+        body = other._document_part._element.body
+        body.insert(0, parse_xml(
+            '<w:commentRangeStart %s w:id="0"/>' % nsdecls('w')
+        ))
+        body.insert(1, parse_xml(
+            '<w:p %s><w:r><w:t>baz</w:t><w:footnoteReference w:id="1"/>'
+            '</w:r><w:commentRangeEnd w:id="0"/><w:r><w:commentReference'
+            ' w:id="0"/><w:endnoteReference w:id="1"/></w:r></w:p>'
+            % nsdecls('w')
+        ))
+        document.append_document(other)
+        body = document._document_part._element.body
+        assert body.xpath(
+            '//w:commentRangeStart | //w:commentRangeEnd | '
+            '//w:commentReference | //w:endnoteReference | '
+            '//w:footnoteReference'
+        ) == []
+        assert [p.text for p in document.paragraphs] == ['foo', 'baz', 'bar']
+        assert len(other._document_part._element.xpath(
+            '//w:footnoteReference'
+        )) == 1
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def documents(self):
+        document = Document()
+        document.add_paragraph('foo')
+        other = Document()
+        other.add_paragraph('bar')
+        return document, other
+
+
+class DescribeCompose(object):
+
+    def it_composes_a_new_document_from_several(self):
+        document = Document(docx_path('test'))
+        composed = compose([document, docx_path('test'), document])
+        texts = [p.text for p in document.paragraphs]
+        assert [p.text for p in composed.paragraphs] == texts * 3
+        assert [p.text for p in document.paragraphs] == texts
+
+    def it_raises_when_there_are_no_documents(self):
+        with pytest.raises(ValueError):
+            compose([])
@@ -0,0 +1,171 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.export module
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import pytest
+
+from io import BytesIO, StringIO
+
+from docx.api import Document
+from docx.export import Exporter, TextExporter, export
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+
+from .unitutil.cxml import element
+from .unitutil.file import test_file
+
+
+class DescribeExport(object):
+
+    def it_exports_a_document_as_text(self, document):
+        assert export(document) == 'Title\nfoo bar\nitem\na\tb\nc\td\n'
+
+    def it_exports_a_document_as_markdown(self, document):
+        assert export(document, format='markdown') == (
+            '# Title\n\nfoo **bar**\n\n- item\n\n'
+            '| a | b |\n| --- | --- |\n| c | d |\n\n'
+        )
+
+    def it_exports_a_document_as_html(self, document):
+        assert export(document, format='html') == (
+            '<h1>Title</h1>\n<p>foo <strong>bar</strong></p>\n<p>item</p>\n'
+            '<table>\n<tr><td>a</td><td>b</td></tr>\n'
+            '<tr><td>c</td><td>d</td></tr>\n</table>\n'
+        )
+
+    def it_writes_to_an_output_stream(self, document):
+        out = StringIO()
+        assert document.export(out) is None
+        assert out.getvalue() == export(document)
+
+    def it_streams_the_body_of_a_docx_file(self, document):
+        stream = BytesIO()
+        document.save(stream)
+        for format in ('text', 'markdown', 'html'):
+            stream.seek(0)
+            assert export(stream, format=format) == export(
+                document, format=format
+            )
+
+    def it_renders_hyperlinks_and_pictures(self):
+        document = Document()
+        rId = document._document_part.relate_to(
+            'http://foo', RT.HYPERLINK, is_external=True
+        )
+        document._document_part._element.body.insert(0, parse_xml(
+            '<w:p %s><w:hyperlink r:id="%s"><w:r><w:t>link</w:t></w:r>'
+            '</w:hyperlink></w:p>' % (nsdecls('w', 'r'), rId)
+        ))
+        document.add_picture(test_file('monty-truth.png'))
+        markdown = document.export(format='markdown')
+        assert markdown.startswith('[link](http://foo)\n\n![')
+        assert '](media/image1.png)' in markdown
+        html = document.export(format='html')
+        assert html.startswith('<p><a href="http://foo">link</a></p>\n')
+        assert '<img src="media/image1.png" alt=' in html
+
+    def it_renders_only_links_having_a_safe_url(self):
+        document = Document()
+        for url in ('javascript:alert(1)', ' Java\tScript:alert(1)',
+                    'http://foo/a b)c'):
+            rId = document._document_part.relate_to(
+                url, RT.HYPERLINK, is_external=True
+            )
+            document._document_part._element.body.append(parse_xml(
+                '<w:p %s><w:hyperlink r:id="%s"><w:r><w:t>link</w:t></w:r>'
+                '</w:hyperlink></w:p>' % (nsdecls('w', 'r'), rId)
+            ))
+        assert document.export(format='html').endswith(
+            '<p>link</p>\n<p>link</p>\n'
+            '<p><a href="http://foo/a b)c">link</a></p>\n'
+        )
+        assert document.export(format='markdown').endswith(
+            'link\n\nlink\n\n[link](http://foo/a%20b%29c)\n\n'
+        )
+
+    def it_tells_numbered_lists_from_bulleted_ones(self):
+        document = Document()
+        numbering = document.numbering_part._element
+        numbering.insert(0, parse_xml(
+            '<w:abstractNum %s w:abstractNumId="90"><w:lvl w:ilvl="0">'
+            '<w:numFmt w:val="decimal"/></w:lvl><w:lvl w:ilvl="1"><w:numFmt'
+            ' w:val="bullet"/></w:lvl></w:abstractNum>' % nsdecls('w')
+        ))
+        numbering.append(parse_xml(
+            '<w:num %s w:numId="90"><w:abstractNumId w:val="90"/></w:num>'
+            % nsdecls('w')
+        ))
+        for text, ilvl in (('one', 0), ('two', 1)):
+            document.add_paragraph(text)._p.get_or_add_pPr().append(
+                element('w:numPr/(w:ilvl{w:val=%d},w:numId{w:val=90})' % ilvl)
+            )
+        markdown = '1. one\n\n   - two\n\n'
+        assert document.export(format='markdown') == markdown
+        stream = BytesIO()
+        document.save(stream)
+        assert export(stream, format='markdown') == markdown
+
+    def it_escapes_special_characters(self):
+        document = Document()
+        document.add_paragraph('a <b> & *c*')
+        assert document.export(format='html') == (
+            '<p>a &lt;b&gt; &amp; *c*</p>\n'
+        )
+        assert document.export(format='markdown') == 'a <b> & \\*c\\*\n\n'
+
+    def it_raises_on_an_unsupported_format(self, document):
+        with pytest.raises(ValueError):
+            export(document, format='rtf')
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def document(self):
+        document = Document()
+        document.add_heading('Title')
+        paragraph = document.add_paragraph('foo ')
+        paragraph.add_run('bar').bold = True
+        document.add_paragraph('item', 'ListBullet')
+        table = document.add_table(2, 2)
+        for idx, text in enumerate('abcd'):
+            table.cell(idx // 2, idx % 2).paragraphs[0].add_run(text)
+        return document
+
+
+class DescribeExporter(object):
+
+    def it_dispatches_on_the_tag_of_each_element(self):
+        class UpperExporter(TextExporter):
+            def text(self, t):
+                return t.text.upper()
+
+        out = StringIO()
+        blocks = element(
+            'w:body/(w:p/w:r/w:t"foo",w:sdt/w:sdtContent/w:p/w:r/w:t"bar",'
+            'w:sectPr)'
+        )
+        UpperExporter(out).export(blocks.iterchildren())
+        assert out.getvalue() == 'FOO\nBAR\n'
+
+    def it_skips_deleted_text(self):
+        out = StringIO()
+        p = element('w:p/(w:r/w:t"foo",w:del/w:r/w:delText"bar")')
+        TextExporter(out).export([p])
+        assert out.getvalue() == 'foo\n'
+
+    def it_renders_symbols(self):
+        out = StringIO()
+        p = element('w:p/w:r/(w:t"a",w:sym{w:char=F04A})')
+        TextExporter(out).export([p])
+        assert out.getvalue() == 'a\uf04a\n'
+
+    def it_renders_nothing_by_default(self):
+        out = StringIO()
+        Exporter(out).export([element('w:p/w:r/w:t"foo"')])
+        assert out.getvalue() == ''
+        assert Exporter.block_handlers[qn('w:p')] == 'paragraph'
@@ -0,0 +1,50 @@
+# encoding: utf-8
+
+"""
+Test suite guarding the cost of ``import docx``
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import os
+import subprocess
+import sys
+
+import docx
+
+
+deferred_modules = (
+    'docx.image.bmp', 'docx.image.jpeg', 'docx.image.png',
+    'docx.image.tiff', 'docx.oxml.parts.document', 'docx.oxml.shape',
+    'docx.oxml.table', 'docx.oxml.text', 'docx.parts.document',
+    'hashlib', 'multiprocessing', 'tempfile',
+)
+
+
+class DescribeImportDocx(object):
+
+    def it_defers_modules_not_needed_until_first_use(self):
+        imported = modules_imported_by('import docx')
+        assert [name for name in deferred_modules if name in imported] == []
+
+    def it_loads_deferred_modules_once_a_document_is_opened(self):
+        imported = modules_imported_by('import docx; docx.Document()')
+        for name in ('docx.oxml.text', 'docx.parts.document'):
+            assert name in imported
+
+
+# helpers ------------------------------------------------------------
+
+def modules_imported_by(source):
+    """
+    Return the set of names of the modules loaded after executing *source*
+    in a fresh interpreter.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(docx.__file__)))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [root] + [p for p in env.get('PYTHONPATH', '').split(os.pathsep) if p]
+    )
+    script = '%s; import sys; print("\\n".join(sys.modules))' % source
+    output = subprocess.check_output([sys.executable, '-c', script], env=env)
+    return set(output.decode('utf-8').split())
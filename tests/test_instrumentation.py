@@ -0,0 +1,104 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.instrumentation module
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import pytest
+
+from io import BytesIO
+
+from docx import instrumentation
+from docx.api import Document
+from docx.instrumentation import PhaseTiming, phase, recording, Recorder
+
+from .unitutil.file import docx_path
+
+
+class DescribeInstrumentation(object):
+
+    def it_records_nothing_unless_enabled(self):
+        assert instrumentation._recorder is None
+        with phase('foo') as p:
+            p.add_blob(b'bar')
+        assert instrumentation._recorder is None
+
+    def it_can_be_enabled_and_disabled(self):
+        recorder = instrumentation.enable()
+        try:
+            with phase('foo', '/part.xml') as p:
+                p.add_blob(b'barbaz')
+        finally:
+            assert instrumentation.disable() is recorder
+        timing = recorder.timings[0]
+        assert (timing.name, timing.partname, timing.nbytes) == (
+            'foo', '/part.xml', 6
+        )
+        assert timing.seconds >= 0.0
+
+    def it_restores_the_outer_recorder_after_recording(self):
+        outer = instrumentation.enable()
+        try:
+            with recording() as inner:
+                with phase('foo'):
+                    pass
+            assert instrumentation._recorder is outer
+        finally:
+            instrumentation.disable()
+        assert len(inner.timings) == 1
+        assert outer.timings == []
+
+    def it_passes_each_timing_to_the_callback(self):
+        timings = []
+        with recording(timings.append) as recorder:
+            with phase('foo'):
+                pass
+        assert timings == recorder.timings
+
+    def it_records_the_phases_of_open_and_save(self):
+        with recording() as recorder:
+            document = Document(docx_path('test'))
+            document.save(BytesIO())
+        phases = recorder.report()['phases']
+        for name in ('read', 'read.rels', 'read.inflate', 'unmarshal',
+                     'unmarshal.part', 'parse', 'unmarshal.rels',
+                     'unmarshal.after_unmarshal', 'save.before_marshal',
+                     'write', 'write.serialize', 'write.deflate'):
+            assert phases[name]['count'] > 0
+        assert phases['read.inflate']['bytes'] > 0
+        parts = recorder.report()['parts']
+        assert parts['/word/document.xml']['parse']['bytes'] > 0
+
+
+class DescribeRecorder(object):
+
+    def it_summarizes_timings_by_phase_and_part(self, recorder):
+        report = recorder.report()
+        assert report['phases'] == {
+            'read.inflate': {'count': 2, 'seconds': 3.0, 'bytes': 30},
+            'write': {'count': 1, 'seconds': 4.0, 'bytes': 0},
+        }
+        assert report['parts'] == {
+            '/a.xml': {'read.inflate': {'seconds': 1.0, 'bytes': 10}},
+            '/b.xml': {'read.inflate': {'seconds': 2.0, 'bytes': 20}},
+        }
+
+    def it_can_export_counters(self, recorder):
+        counters = recorder.counters()
+        assert counters['docx.read.inflate.count'] == 2
+        assert counters['docx.read.inflate.seconds'] == 3.0
+        assert counters['docx.read.inflate.bytes'] == 30
+        assert counters['docx.write.seconds'] == 4.0
+        assert len(counters) == 6
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def recorder(self):
+        recorder = Recorder()
+        recorder.add(PhaseTiming('read.inflate', '/a.xml', 1.0, 10))
+        recorder.add(PhaseTiming('read.inflate', '/b.xml', 2.0, 20))
+        recorder.add(PhaseTiming('write', None, 4.0, 0))
+        return recorder
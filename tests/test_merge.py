@@ -0,0 +1,101 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.merge module
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import pytest
+
+from io import BytesIO
+from zipfile import ZipFile
+
+from docx.api import Document
+from docx.merge import CompiledTemplate
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.text import Paragraph
+
+
+class DescribeCompiledTemplate(object):
+
+    def it_knows_the_names_of_its_placeholders(self, document):
+        template = CompiledTemplate(document)
+        assert template.slots == ['name', 'amount', 'name']
+
+    def it_can_use_another_placeholder_pattern(self, document):
+        template = CompiledTemplate(document, r'owe \{\{ \w+ \}\}')
+        assert template.slots == ['owe {{ amount }}']
+
+    def it_can_render_a_copy_with_placeholders_filled(self, document):
+        template = CompiledTemplate(document)
+        stream = BytesIO()
+        template.render({'name': 'Joe', 'amount': 42}, stream)
+        paragraphs = Document(stream).paragraphs
+        assert [p.text for p in paragraphs] == [
+            'Dear Joe, you owe 42.', 'Bye Joe'
+        ]
+        assert paragraphs[0].runs[1].bold is True
+
+    def it_renders_values_as_run_content(self, document):
+        template = CompiledTemplate(document)
+        stream = BytesIO()
+        template.render({'name': ' a < b\tc\n', 'amount': ''}, stream)
+        paragraph = Document(stream).paragraphs[0]
+        assert paragraph.text == 'Dear  a < b\tc\n, you owe .'
+
+    def it_renders_every_member_of_the_package(self, document):
+        saved = BytesIO()
+        document.save(saved)
+        template = CompiledTemplate(document)
+        for name in ('Joe', 'Ann'):
+            stream = BytesIO()
+            template.render({'name': name, 'amount': 1}, stream)
+            zipf = ZipFile(stream)
+            assert zipf.testzip() is None
+            assert zipf.namelist() == ZipFile(saved).namelist()
+
+    def it_fills_placeholders_in_nested_paragraphs_in_place(self):
+        document = Document()
+        paragraph = document.add_paragraph('{{outer}} ')
+        txbxContent = OxmlElement('w:txbxContent')
+        txbxContent.append(document.add_paragraph('{{inner}}')._p)
+        paragraph.add_run()._r.append(txbxContent)
+        paragraph.add_run(' {{after}}')
+        template = CompiledTemplate(document)
+        assert template.slots == ['outer', 'inner', 'after']
+        stream = BytesIO()
+        template.render({'outer': 'O', 'inner': 'I', 'after': 'A'}, stream)
+        merged = Document(stream)
+        inner = merged._document_part._element.body.iter(qn('w:p'))
+        assert merged.paragraphs[0].text == 'O  A'
+        assert Paragraph(list(inner)[1], None).text == 'I'
+
+    def it_rejects_a_value_xml_does_not_allow(self, document):
+        template = CompiledTemplate(document)
+        with pytest.raises(ValueError):
+            template.render({'name': 'x\x01y', 'amount': 1}, BytesIO())
+
+    def it_is_unaffected_by_later_changes_to_the_document(self, document):
+        template = CompiledTemplate(document)
+        document.paragraphs[1].text = 'changed'
+        stream = BytesIO()
+        template.render({'name': 'Joe', 'amount': 1}, stream)
+        assert Document(stream).paragraphs[1].text == 'Bye Joe'
+
+    def it_raises_when_a_value_is_missing(self, document):
+        template = CompiledTemplate(document)
+        with pytest.raises(KeyError):
+            template.render({'name': 'Joe'}, BytesIO())
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def document(self):
+        document = Document()
+        paragraph = document.add_paragraph('Dear {{na')
+        paragraph.add_run('me}}').bold = True
+        paragraph.add_run(', you owe {{ amount }}.')
+        document.add_paragraph('Bye {{name}}')
+        return document
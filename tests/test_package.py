@@ -42,6 +42,18 @@ class DescribeImageParts(object):
         image_parts._add_image_part.assert_called_once_with(image_)
         assert image_part is image_part_
 
+    def it_can_import_an_image_part_from_another_package(self):
+        image_parts = ImageParts()
+        image_part = ImagePart(
+            PackURI('/word/media/image3.png'), 'image/png', b'foobar'
+        )
+        imported_part = image_parts.import_image_part(image_part)
+        assert imported_part is not image_part
+        assert imported_part.partname == '/word/media/image1.png'
+        assert imported_part.blob == b'foobar'
+        assert image_parts.import_image_part(image_part) is imported_part
+        assert len(image_parts) == 1
+
     def it_knows_the_next_available_image_partname(
             self, next_partname_fixture):
         image_parts, ext, expected_partname = next_partname_fixture
@@ -0,0 +1,65 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.shared module
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import pytest
+
+from docx.shared import lazyproperty
+
+
+class DescribeLazyproperty(object):
+
+    def it_computes_the_value_only_once(self):
+        class Foo(object):
+            calls = []
+
+            @lazyproperty
+            def bar(self):
+                """bar docstring"""
+                self.calls.append(1)
+                return 42
+
+        foo = Foo()
+        assert foo.bar == 42
+        assert foo.bar == 42
+        assert Foo.calls == [1]
+        assert Foo.bar.__doc__ == 'bar docstring'
+
+    def it_caches_the_value_in_a_slot(self):
+        class Foo(object):
+            __slots__ = ('_bar',)
+
+            @lazyproperty
+            def bar(self):
+                return 42
+
+        foo = Foo()
+        assert foo.bar == 42
+        assert foo._bar == 42
+        assert not hasattr(foo, '__dict__')
+
+    def it_raises_when_its_slot_is_missing(self):
+        class Foo(object):
+            __slots__ = ()
+
+            @lazyproperty
+            def bar(self):
+                return 42
+
+        with pytest.raises(TypeError):
+            Foo().bar
+
+    def it_cannot_be_assigned_to(self):
+        class Foo(object):
+            @lazyproperty
+            def bar(self):
+                return 42
+
+        with pytest.raises(AttributeError):
+            Foo().bar = 24
@@ -29,6 +29,11 @@ class DescribeTable(object):
         columns = table.columns
         assert isinstance(columns, _Columns)
 
+    def it_caches_its_rows_and_columns_in_slots(self, table):
+        assert table.rows is table.rows
+        assert table.columns is table.columns
+        assert not hasattr(table, '__dict__')
+
     def it_provides_access_to_a_cell_by_row_and_col_indices(self, table):
         for row_idx in range(2):
             for col_idx in range(2):
@@ -70,6 +75,61 @@ class DescribeTable(object):
         table.autofit = new_value
         assert table._tbl.xml == expected_xml
 
+    def it_can_extract_the_text_of_its_cells(self, text_table):
+        assert text_table.to_records() == [
+            ('a', 'b', 'b', ''),
+            ('c\nd', 'b', 'b', 'e\tf'),
+            ('', 'g', 'h', ''),
+        ]
+        assert text_table.to_columns() == [
+            ['a', 'c\nd', ''], ['b', 'b', 'g'], ['b', 'b', 'h'],
+            ['', 'e\tf', ''],
+        ]
+
+    def it_can_set_the_text_of_a_block_of_cells(self):
+        table = Table(_tbl_bldr(rows=3, cols=3).element, None)
+        table.cell(1, 1).paragraphs[0].add_run('foo')
+        table.set_values([['a', 1], [None, 'b\tc']], start=(1, 1))
+        assert table.to_records() == [
+            ('', '', ''), ('', 'a', '1'), ('', '', 'b\tc'),
+        ]
+        assert len(table.cell(1, 1).paragraphs) == 1
+        assert table.cell(1, 1)._tc.xml == xml('w:tc/w:p/w:r/w:t"a"')
+
+    def it_refreshes_the_paragraphs_of_cells_held_when_values_are_set(self):
+        table = Table(_tbl_bldr(rows=1, cols=2).element, None)
+        cell = table.cell(0, 1)
+        cell.paragraphs[0].add_run('foo')
+        table.set_values([['a', 'b']])
+        assert cell.paragraphs[0].text == 'b'
+        table.fill_column(1, ['c'])
+        assert [p.text for p in cell.paragraphs] == ['c']
+
+    def it_can_fill_a_column(self):
+        table = Table(_tbl_bldr(rows=2, cols=2).element, None)
+        table.fill_column(1, ['a', 'b'])
+        assert table.to_columns() == [['', ''], ['a', 'b']]
+
+    def it_changes_no_cell_when_values_are_out_of_range(self):
+        table = Table(_tbl_bldr(rows=2, cols=2).element, None)
+        with pytest.raises(IndexError):
+            table.set_values([['a', 'b'], ['c', 'd', 'e']])
+        with pytest.raises(IndexError):
+            table.fill_column(0, ['a', 'b', 'c'])
+        assert table.to_records() == [('', ''), ('', '')]
+
+    def it_can_extract_the_text_of_its_cells_to_numpy(self, text_table):
+        pytest.importorskip('numpy')
+        array = text_table.to_array()
+        assert array.shape == (3, 4)
+        assert array[1, 0] == 'c\nd'
+
+    def it_can_extract_the_text_of_its_cells_to_pandas(self, text_table):
+        pytest.importorskip('pandas')
+        dataframe = text_table.to_dataframe()
+        assert dataframe.shape == (2, 4)
+        assert list(dataframe['a']) == ['c\nd', '']
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -148,6 +208,21 @@ class DescribeTable(object):
         table = Table(tbl, None)
         return table
 
+    @pytest.fixture
+    def text_table(self):
+        tbl = element(
+            'w:tbl/(w:tblPr,w:tblGrid/(w:gridCol,w:gridCol,w:gridCol),'
+            'w:tr/(w:tc/w:p/w:r/w:t"a",'
+            'w:tc/(w:tcPr/(w:gridSpan{w:val=2},w:vMerge{w:val=restart}),'
+            'w:p/w:r/w:t"b")),'
+            'w:tr/(w:tc/(w:p/w:r/w:t"c",w:p/w:r/w:t"d"),'
+            'w:tc/(w:tcPr/(w:gridSpan{w:val=2},w:vMerge),w:p),'
+            'w:tc/w:p/w:r/(w:t"e",w:tab,w:t"f")),'
+            'w:tr/(w:trPr/w:gridBefore{w:val=1},w:tc/w:p/w:r/w:t"g",'
+            'w:tc/w:p/w:r/w:t"h"))'
+        )
+        return Table(tbl, None)
+
 
 class Describe_Cell(object):
 
@@ -193,6 +268,12 @@ class Describe_Cell(object):
         cell.text = text
         assert cell._tc.xml == expected_xml
 
+    def it_refreshes_its_paragraphs_when_its_text_is_set(self):
+        cell = _Cell(element('w:tc/w:p/w:r/w:t"foo"'), None)
+        assert cell.paragraphs[0].text == 'foo'
+        cell.text = 'bar'
+        assert cell.paragraphs[0].text == 'bar'
+
     def it_knows_its_width_in_EMU(self, width_get_fixture):
         cell, expected_width = width_get_fixture
         assert cell.width == expected_width
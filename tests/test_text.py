@@ -16,6 +16,7 @@ from docx.shape import InlineShape
 from docx.text import Paragraph, Run
 
 import pytest
+import weakref
 
 from .unitutil.cxml import element, xml
 from .unitutil.mock import call, class_mock, instance_mock
@@ -31,6 +32,14 @@ class DescribeParagraph(object):
         ]
         assert runs == [run_, run_2_]
 
+    def it_is_a_lightweight_proxy(self):
+        paragraph = Paragraph(element('w:p'), None)
+        run = Run(element('w:r'), paragraph)
+        assert not hasattr(paragraph, '__dict__')
+        assert not hasattr(run, '__dict__')
+        assert weakref.ref(paragraph)() is paragraph
+        assert weakref.ref(run)() is run
+
     def it_can_add_a_run_to_itself(self, add_run_fixture):
         paragraph, text, style, expected_xml = add_run_fixture
         run = paragraph.add_run(text, style)